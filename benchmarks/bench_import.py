@@ -0,0 +1,83 @@
+"""
+Import-time and client construction benchmark that guards the startup budget.
+
+Every sample runs a fresh interpreter, so module caches don't hide cold-start cost.
+Exits with status 1 when the median exceeds the budget or when heavy optional
+modules are loaded by a plain import and client construction. Usage:
+
+    python -m benchmarks.bench_import --samples 10 --budget-ms 50
+"""
+import argparse
+import ast
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, Any, List, Optional
+
+# Modules that must not be loaded by "import vsesvit_ai" and VsesvitAI(...)
+HEAVY_MODULES = ('requests', 'urllib3', 'dotenv', 'httpx', 'asyncio')
+
+PROBE = """
+import sys, time
+started = time.perf_counter()
+import src.vsesvit_ai
+from src.vsesvit_ai import VsesvitAI
+imported = time.perf_counter()
+for _ in range(1000):
+    VsesvitAI(api_key='vsa_probe')
+constructed = time.perf_counter()
+print({
+    'import_ms': (imported - started) * 1000,
+    'construct_us': (constructed - imported) * 1000,
+    'heavy': sorted(name for name in %r if name in sys.modules),
+})
+"""
+
+
+def sample() -> Dict[str, Any]:
+    """
+    Measure import and construction time in a fresh interpreter.
+
+    :return: Dictionary with import_ms, construct_us (per client) and loaded heavy modules
+    """
+    output = subprocess.run(
+        [sys.executable, '-S', '-c', PROBE % (HEAVY_MODULES,)],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    # Printed as a Python literal to avoid importing json in the probe
+    return ast.literal_eval(output)
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description='Vsesvit AI SDK import-time benchmark')
+    parser.add_argument('--samples', type=int, default=10, help='Number of fresh interpreters to measure')
+    parser.add_argument('--budget-ms', type=float, default=50.0, help='Maximum median import time')
+    parser.add_argument('--construct-budget-us', type=float, default=50.0,
+                        help='Maximum median VsesvitAI construction time')
+    parser.add_argument('--output', help='Write JSON results to this file')
+    args = parser.parse_args(argv)
+
+    samples = [sample() for _ in range(args.samples)]
+    report = {
+        'import_ms': round(statistics.median(s['import_ms'] for s in samples), 3),
+        'construct_us': round(statistics.median(s['construct_us'] for s in samples), 3),
+        'heavy_modules': sorted({name for s in samples for name in s['heavy']}),
+        'budget_ms': args.budget_ms,
+        'construct_budget_us': args.construct_budget_us,
+    }
+    report['ok'] = (report['import_ms'] <= args.budget_ms
+                    and report['construct_us'] <= args.construct_budget_us
+                    and not report['heavy_modules'])
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    if not report['ok']:
+        raise SystemExit(1)
+    return report
+
+
+if __name__ == '__main__':
+    main()
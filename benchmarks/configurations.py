@@ -0,0 +1,91 @@
+"""
+Client configurations compared by the benchmark suite.
+
+Each configuration knows how to build a VsesvitAI client for a server and how to
+execute a batch of operations (calls of the resource methods of that client).
+"""
+from typing import Callable, Dict, Any, List
+
+from benchmarks.harness import run_operations
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.transport import PooledTransport, AsyncTransport
+
+
+class Configuration:
+    """Plain synchronous client, operations run one after another."""
+
+    name = 'sync'
+
+    def __init__(self, concurrency: int = 1):
+        """
+        Initialize the configuration
+
+        :param concurrency: Number of operations in flight at the same time
+        """
+        self.concurrency = concurrency
+
+    def make_client(self, api_key: str, base_url: str) -> VsesvitAI:
+        """
+        Build the client under test.
+
+        :param api_key: API key accepted by the server
+        :param base_url: Base API URL of the server
+        :return: Configured client
+        """
+        return VsesvitAI(api_key=api_key, base_url=base_url)
+
+    def run(self, client: VsesvitAI, operations: List[Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        Execute operations and collect timings.
+
+        :param client: Client built by make_client
+        :param operations: Zero-argument calls of resource methods of the client, one per timed operation
+        :return: Timings as returned by run_operations
+        """
+        return run_operations(operations, self.concurrency)
+
+    def close(self, client: VsesvitAI) -> None:
+        """
+        Release resources held by the client.
+
+        :param client: Client built by make_client
+        """
+        client.close()
+
+
+class PooledConfiguration(Configuration):
+    """Keep-alive connection pool shared by a pool of worker threads."""
+
+    name = 'pooled'
+
+    def make_client(self, api_key: str, base_url: str) -> VsesvitAI:
+        transport = PooledTransport(pool_maxsize=max(self.concurrency, 10))
+        return VsesvitAI(api_key=api_key, base_url=base_url, transport=transport)
+
+
+class AsyncConfiguration(Configuration):
+    """
+    Connection pool of AsyncTransport (httpx) shared by a pool of worker threads.
+
+    Resource methods are synchronous, so they run on threads like the pooled
+    configuration; this compares the httpx pool with the requests one.
+    """
+
+    name = 'async'
+
+    def make_client(self, api_key: str, base_url: str) -> VsesvitAI:
+        transport = AsyncTransport(max_connections=self.concurrency,
+                                   max_keepalive_connections=self.concurrency)
+        return VsesvitAI(api_key=api_key, base_url=base_url, transport=transport)
+
+
+CONFIGURATIONS = {
+    'sync': Configuration,
+    'pooled': PooledConfiguration,
+}
+
+try:
+    import httpx  # noqa: F401
+    CONFIGURATIONS['async'] = AsyncConfiguration
+except ImportError:  # pragma: no cover
+    pass
@@ -0,0 +1,110 @@
+"""
+Timing primitives shared by the benchmark scenarios.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Return the pct-th percentile of samples using linear interpolation.
+
+    :param samples: Measured values
+    :param pct: Percentile between 0 and 100
+    :return: Percentile value, 0.0 for an empty list
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class Result:
+    """Outcome of a single benchmark run."""
+
+    def __init__(self, benchmark: str, configuration: str, latencies: List[float], elapsed: float,
+                 items: int = 0, transferred: int = 0, errors: int = 0, extra: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the result
+
+        :param benchmark: Benchmark name
+        :param configuration: Client configuration name
+        :param latencies: Latency of every operation in seconds
+        :param elapsed: Wall-clock duration of the run in seconds
+        :param items: Number of resource items processed (e.g. list rows)
+        :param transferred: Number of payload bytes uploaded or downloaded
+        :param errors: Number of failed operations
+        :param extra: Additional benchmark-specific values
+        """
+        self.benchmark = benchmark
+        self.configuration = configuration
+        self.latencies = latencies
+        self.elapsed = elapsed
+        self.items = items
+        self.transferred = transferred
+        self.errors = errors
+        self.extra = extra or {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the result to a JSON-serializable dictionary.
+
+        :return: Dictionary with throughput and latency statistics
+        """
+        operations = len(self.latencies)
+        elapsed = self.elapsed or float('inf')
+        data = {
+            'benchmark': self.benchmark,
+            'configuration': self.configuration,
+            'operations': operations,
+            'errors': self.errors,
+            'elapsed_s': round(self.elapsed, 6),
+            'ops_per_s': round(operations / elapsed, 2),
+            'p50_ms': round(percentile(self.latencies, 50) * 1000, 3),
+            'p99_ms': round(percentile(self.latencies, 99) * 1000, 3),
+            'mean_ms': round(sum(self.latencies) / operations * 1000, 3) if operations else 0.0,
+        }
+        if self.items:
+            data['items'] = self.items
+            data['items_per_s'] = round(self.items / elapsed, 2)
+        if self.transferred:
+            data['bytes'] = self.transferred
+            data['mb_per_s'] = round(self.transferred / elapsed / 1024 / 1024, 2)
+        data.update(self.extra)
+        return data
+
+
+def run_operations(operations: List[Callable[[], Any]], concurrency: int = 1) -> Dict[str, Any]:
+    """
+    Run operations and time each of them.
+
+    :param operations: Zero-argument callables, each one is a single timed operation
+    :param concurrency: Number of threads running operations in parallel
+    :return: Dictionary with 'latencies', 'elapsed', 'results' and 'errors'
+    """
+    def timed(operation):
+        started = time.perf_counter()
+        try:
+            result = operation()
+        except Exception as e:
+            return None, time.perf_counter() - started, e
+        return result, time.perf_counter() - started, None
+
+    started = time.perf_counter()
+    if concurrency <= 1:
+        outcomes = [timed(operation) for operation in operations]
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            outcomes = list(executor.map(timed, operations))
+    elapsed = time.perf_counter() - started
+
+    return {
+        'latencies': [latency for _, latency, error in outcomes if error is None],
+        'elapsed': elapsed,
+        'results': [result for result, _, error in outcomes if error is None],
+        'errors': [error for _, _, error in outcomes if error is not None],
+    }
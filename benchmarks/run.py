@@ -0,0 +1,195 @@
+"""
+Run the SDK benchmark suite and write machine-readable results.
+
+By default a local StubServer is started and seeded, so results are reproducible
+and independent of the network. Usage:
+
+    python -m benchmarks.run --output bench_results.json
+    python -m benchmarks.run --configurations sync --benchmarks get_by_id,list_scan --latency 0.005
+    python -m benchmarks.run --compare bench_results.json --tolerance 0.15
+
+With --compare the results are checked against an earlier report; the run
+exits with a non-zero status when a benchmark is slower by more than the
+tolerance.
+"""
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+import time
+from typing import Dict, Any, List, Optional
+
+from benchmarks.configurations import CONFIGURATIONS
+from benchmarks.scenarios import SCENARIOS
+from src.vsesvit_ai.testing import StubServer
+
+
+def _csv(value: str) -> List[str]:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Vsesvit AI SDK benchmarks')
+    parser.add_argument('--configurations', type=_csv, default=list(CONFIGURATIONS),
+                        help='Comma-separated client configurations (default: all)')
+    parser.add_argument('--benchmarks', type=_csv, default=list(SCENARIOS),
+                        help='Comma-separated benchmarks (default: all)')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Operations in flight for concurrent configurations')
+    parser.add_argument('--requests', type=int, default=500, help='Number of get_by_id calls')
+    parser.add_argument('--articles', type=int, default=2000, help='Articles seeded into the stub server')
+    parser.add_argument('--page-size', type=int, default=100, help='Page size of the list scan')
+    parser.add_argument('--downloads', type=int, default=20, help='Number of downloads')
+    parser.add_argument('--download-size', type=int, default=4 * 1024 * 1024, help='Bytes per download')
+    parser.add_argument('--uploads', type=int, default=20, help='Number of uploads')
+    parser.add_argument('--upload-size', type=int, default=1024 * 1024, help='Bytes per upload')
+    parser.add_argument('--content-size', type=int, default=20000, help='Bytes of HTML per article')
+    parser.add_argument('--latency', type=float, default=0.0, help='Stub server latency in seconds')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the stub server')
+    parser.add_argument('--in-process', action='store_true',
+                        help='Run the stub server in the benchmark process instead of a child process')
+    parser.add_argument('--base-url', help='Benchmark an already running stand-in server instead of the stub')
+    parser.add_argument('--api-key', default=StubServer.api_key, help='API key for --base-url')
+    parser.add_argument('--output', help='Write JSON results to this file instead of stdout')
+    parser.add_argument('--compare', help='Earlier JSON results to check this run against')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='Allowed slowdown against --compare as a fraction (default: 0.1)')
+    return parser.parse_args(argv)
+
+
+def run(options: Dict[str, Any], base_url: str, api_key: str) -> List[Dict[str, Any]]:
+    """
+    Run every selected benchmark for every selected configuration.
+
+    :param options: Parsed command line options as a dictionary
+    :param base_url: Base API URL of the server under test
+    :param api_key: API key accepted by the server
+    :return: List of result dictionaries
+    """
+    results = []
+    for configuration_name in options['configurations']:
+        concurrency = 1 if configuration_name == 'sync' else options['concurrency']
+        configuration = CONFIGURATIONS[configuration_name](concurrency=concurrency)
+        client = configuration.make_client(api_key, base_url)
+        try:
+            for benchmark in options['benchmarks']:
+                result = SCENARIOS[benchmark](configuration, client, options)
+                results.append(dict(result.to_dict(), concurrency=concurrency))
+                print(f"{configuration_name:>8} {benchmark:<10} "
+                      f"{results[-1]['ops_per_s']:>10} ops/s  p50 {results[-1]['p50_ms']} ms  "
+                      f"p99 {results[-1]['p99_ms']} ms", file=sys.stderr)
+        finally:
+            configuration.close(client)
+    return results
+
+
+def compare(previous: List[Dict[str, Any]], results: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    """
+    Find the benchmarks that got slower than in an earlier run.
+
+    A benchmark regressed when its throughput dropped, or its p99 latency rose,
+    by more than the tolerance. Benchmarks missing from either run are ignored.
+
+    :param previous: Results of the earlier run
+    :param results: Results of this run
+    :param tolerance: Allowed slowdown as a fraction (e.g. 0.1 for 10%)
+    :return: Description of every regression, empty if there are none
+    """
+    earlier = {(result['configuration'], result['benchmark']): result for result in previous}
+    regressions = []
+    for result in results:
+        before = earlier.get((result['configuration'], result['benchmark']))
+        if before is None:
+            continue
+        name = f"{result['configuration']} {result['benchmark']}"
+        if result['ops_per_s'] < before['ops_per_s'] * (1 - tolerance):
+            regressions.append(f"{name}: {result['ops_per_s']} ops/s, was {before['ops_per_s']}")
+        if result['p99_ms'] > before['p99_ms'] * (1 + tolerance):
+            regressions.append(f"{name}: p99 {result['p99_ms']} ms, was {before['p99_ms']}")
+    return regressions
+
+
+def _make_server(options: Dict[str, Any]) -> StubServer:
+    server = StubServer(latency=options['latency'], download_size=options['download_size'],
+                        content_size=options['content_size'], seed=options['seed'])
+    server.start()
+    server.state.seed(projects=10, articles=options['articles'])
+    return server
+
+
+def _serve(options: Dict[str, Any], connection) -> None:
+    """Run the stub server in a child process until the parent closes the pipe."""
+    server = _make_server(options)
+    connection.send(server.base_url)
+    try:
+        connection.recv()
+    except EOFError:
+        pass
+    finally:
+        server.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    args = parse_args(argv)
+    options = vars(args)
+    previous = None
+    if args.compare:
+        with open(args.compare) as file:
+            previous = json.load(file)['results']
+
+    unknown = [name for name in args.configurations if name not in CONFIGURATIONS]
+    unknown += [name for name in args.benchmarks if name not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"Unknown configurations or benchmarks: {', '.join(unknown)}")
+
+    # By default the stub runs in a child process, so it doesn't compete with
+    # the client under test for the GIL
+    server = process = connection = None
+    if args.base_url:
+        base_url = args.base_url
+    elif args.in_process:
+        server = _make_server(options)
+        base_url = server.base_url
+    else:
+        connection, child_connection = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=_serve, args=(options, child_connection), daemon=True)
+        process.start()
+        base_url = connection.recv()
+
+    try:
+        results = run(options, base_url, args.api_key)
+    finally:
+        if server is not None:
+            server.stop()
+        if process is not None:
+            connection.send('stop')
+            process.join()
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'server': base_url if args.base_url else 'stub',
+            'options': {key: value for key, value in options.items()
+                        if key not in ('api_key', 'output', 'compare', 'tolerance')},
+        },
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if previous is not None:
+        regressions = compare(previous, results, args.tolerance)
+        if regressions:
+            raise SystemExit("Regressions against {}:\n  {}".format(args.compare, '\n  '.join(regressions)))
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark scenarios.
+
+Every scenario takes a configuration, a client built by it and the benchmark options,
+and returns a Result. Operations are calls of the resource methods
+(Article.get_by_id, SmartTable.upload, ...), so every configuration measures the
+SDK code users run, including response processing.
+"""
+import io
+from typing import Dict, Any, List
+
+from benchmarks.harness import Result
+
+
+def _article_ids(client, count: int) -> List[int]:
+    """Collect up to count article IDs from the server."""
+    ids = []
+    page = 1
+    while len(ids) < count:
+        response = client.article.get_list(params={'page': page, 'limit': 100})
+        ids.extend(item['id'] for item in response['data'])
+        if page >= response['meta']['last_page']:
+            break
+        page += 1
+    if not ids:
+        raise RuntimeError('The server has no articles, seed it before benchmarking')
+    return ids[:count]
+
+
+def bench_get_by_id(configuration, client, options: Dict[str, Any]) -> Result:
+    """Repeated Article.get_by_id calls over a rotating set of IDs."""
+    ids = _article_ids(client, 100)
+    operations = [
+        lambda article_id=ids[i % len(ids)]: client.article.get_by_id(article_id)
+        for i in range(options['requests'])
+    ]
+    timings = configuration.run(client, operations)
+    return Result('get_by_id', configuration.name, timings['latencies'], timings['elapsed'],
+                  errors=len(timings['errors']))
+
+
+def bench_list_scan(configuration, client, options: Dict[str, Any]) -> Result:
+    """Full scan of all articles through Article.get_list pages."""
+    page_size = options['page_size']
+    first = client.article.get_list(params={'page': 1, 'limit': page_size})
+    operations = [
+        lambda page=page: client.article.get_list(params={'page': page, 'limit': page_size})
+        for page in range(2, first['meta']['last_page'] + 1)
+    ]
+    timings = configuration.run(client, operations)
+    items = len(first['data']) + sum(len(response['data']) for response in timings['results'])
+    return Result('list_scan', configuration.name, timings['latencies'], timings['elapsed'],
+                  items=items, errors=len(timings['errors']), extra={'page_size': page_size})
+
+
+def bench_download(configuration, client, options: Dict[str, Any]) -> Result:
+    """Bulk Article.download of binary files."""
+    ids = _article_ids(client, options['downloads'])
+    operations = [
+        lambda article_id=ids[i % len(ids)]: client.article.download(article_id, 'pdf')
+        for i in range(options['downloads'])
+    ]
+    timings = configuration.run(client, operations)
+    transferred = sum(len(content) for content in timings['results'])
+    return Result('download', configuration.name, timings['latencies'], timings['elapsed'],
+                  transferred=transferred, errors=len(timings['errors']))
+
+
+def bench_upload(configuration, client, options: Dict[str, Any]) -> Result:
+    """Bulk SmartTable.upload of in-memory files."""
+    payload = b'\x00' * options['upload_size']
+    operations = [
+        lambda i=i: client.smart_table.upload(io.BytesIO(payload), file_name=f'products-{i}.xlsx')
+        for i in range(options['uploads'])
+    ]
+    timings = configuration.run(client, operations)
+    transferred = len(payload) * len(timings['results'])
+    return Result('upload', configuration.name, timings['latencies'], timings['elapsed'],
+                  transferred=transferred, errors=len(timings['errors']))
+
+
+SCENARIOS = {
+    'get_by_id': bench_get_by_id,
+    'list_scan': bench_list_scan,
+    'download': bench_download,
+    'upload': bench_upload,
+}
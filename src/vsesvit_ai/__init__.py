@@ -1,4 +1,3 @@
-from src.vsesvit_ai.base.client import VsesvitAI
 from src.vsesvit_ai.base.exceptions import (
     VsesvitAIError,
     AuthenticationError,
@@ -7,11 +6,16 @@ from src.vsesvit_ai.base.exceptions import (
     ValidationError,
     RateLimitError,
     ServerError,
-    NetworkError
+    NetworkError,
+    CassetteError,
+    CircuitOpenError,
+    JobFailedError,
+    PipelineError
 )
 
 __all__ = [
     'VsesvitAI',
+    'VsesvitAIPool',
     'VsesvitAIError',
     'AuthenticationError',
     'ResourceNotFoundError',
@@ -19,7 +23,22 @@ __all__ = [
     'ValidationError',
     'RateLimitError',
     'ServerError',
-    'NetworkError'
+    'NetworkError',
+    'CassetteError',
+    'CircuitOpenError',
+    'JobFailedError',
+    'PipelineError'
 ]
 
 __version__ = '0.1.0'
+
+
+def __getattr__(name):
+    # The client is imported on first access to keep "import vsesvit_ai" cheap
+    if name == 'VsesvitAI':
+        from src.vsesvit_ai.base.client import VsesvitAI
+        return VsesvitAI
+    if name == 'VsesvitAIPool':
+        from src.vsesvit_ai.pool import VsesvitAIPool
+        return VsesvitAIPool
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,5 @@
 from typing import Dict, Any, Optional, Union
+from src.vsesvit_ai.models import ArticleModel, wrap
 
 
 class Article:
@@ -20,7 +21,46 @@ class Article:
         :raises: AccessDeniedError if permission denied
         :raises: ValidationError if query parameters are invalid
         """
-        return self.client.request("GET", "articles", params=params)
+        response = self.client.request("GET", "articles", params=params)
+        return wrap(self.client, response, ArticleModel)
+
+    def stream_list(self, params: Dict[str, Any] = None) -> 'ListStream':
+        """
+        Get a list of articles, yielding items while the response is downloaded.
+
+        Suited for pages with a high limit: the first items are available before
+        the whole page is received and memory use doesn't grow with the page size.
+
+        :param params: Query parameters for filtering and pagination
+        :return: ListStream of articles, its meta is available after iteration
+        :raises: AuthenticationError if API key is invalid
+        :raises: AccessDeniedError if permission denied
+        :raises: ValidationError if query parameters are invalid
+        """
+        return self.client.stream_list("articles", params=params, model=ArticleModel)
+
+    def get_list_lazy(self, params: Dict[str, Any] = None, batch: bool = True,
+                      max_workers: int = 4) -> 'LazyList':
+        """
+        Get a list of articles whose details are fetched on demand.
+
+        Summary fields (id, name, state, language, ...) are available immediately.
+        Reading a detail-only field such as content fetches the article once with
+        get_by_id; with batch enabled the other articles of the page are fetched
+        in the background at the same time.
+
+        :param params: Query parameters for filtering and pagination
+        :param batch: Fetch the details of the whole page in the background on first access
+        :param max_workers: Number of concurrent background requests
+        :return: LazyList of LazyItem articles with pagination info in meta
+        :raises: AuthenticationError if API key is invalid
+        :raises: AccessDeniedError if permission denied
+        :raises: ValidationError if query parameters are invalid
+        """
+        from src.vsesvit_ai.lazy import LazyList
+
+        response = self.client.request("GET", "articles", params=params)
+        return LazyList(response, self.get_by_id, batch=batch, max_workers=max_workers)
 
     def get_by_id(self, article_id: int) -> Dict[str, Any]:
         """
@@ -32,7 +72,8 @@ class Article:
         :raises: AccessDeniedError if article doesn't exist or permission denied
         :raises: ResourceNotFoundError if article doesn't exist
         """
-        return self.client.request("GET", f"articles/{article_id}")
+        response = self.client.request("GET", f"articles/{article_id}")
+        return wrap(self.client, response, ArticleModel)
 
     def create(self, project_id: int, name: str, brief: str,
                additional_params: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -89,7 +130,8 @@ class Article:
         if additional_params:
             data.update(additional_params)
 
-        return self.client.request("POST", "articles/create", data=data)
+        response = self.client.request("POST", "articles/create", data=data)
+        return wrap(self.client, response, ArticleModel)
 
     def download(self, article_id: int, file_format: str, path: Optional[str] = None) -> Union[bytes, str]:
         """
@@ -125,7 +167,8 @@ class Article:
         :raises: ResourceNotFoundError if article doesn't exist
         """
         endpoint = f"articles/{article_id}/archive"
-        return self.client.request("PUT", endpoint)
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, ArticleModel)
 
     def unarchive(self, article_id: int) -> Dict[str, Any]:
         """
@@ -138,4 +181,5 @@ class Article:
         :raises: ResourceNotFoundError if article doesn't exist
         """
         endpoint = f"articles/{article_id}/unarchive"
-        return self.client.request("PUT", endpoint)
\ No newline at end of file
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, ArticleModel)
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+from src.vsesvit_ai.models import AudienceModel, wrap
 
 
 class Audience:
@@ -20,7 +21,8 @@ class Audience:
         :raises: AccessDeniedError if permission denied
         :raises: ValidationError if query parameters are invalid
         """
-        return self.client.request("GET", "audiences", params=params)
+        response = self.client.request("GET", "audiences", params=params)
+        return wrap(self.client, response, AudienceModel)
 
     def get_by_id(self, audience_id: int) -> Dict[str, Any]:
         """
@@ -32,7 +34,8 @@ class Audience:
         :raises: AccessDeniedError if audience doesn't exist or permission denied
         :raises: ResourceNotFoundError if audience doesn't exist
         """
-        return self.client.request("GET", f"audiences/{audience_id}")
+        response = self.client.request("GET", f"audiences/{audience_id}")
+        return wrap(self.client, response, AudienceModel)
 
     def create(self, project_id: int, name: str,
                additional_params: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -73,7 +76,37 @@ class Audience:
         if additional_params:
             data.update(additional_params)
 
-        return self.client.request("POST", "audiences/create", data=data)
+        response = self.client.request("POST", "audiences/create", data=data)
+        return wrap(self.client, response, AudienceModel)
+
+    def get_or_create(self, project_id: int, name: str,
+                      additional_params: Dict[str, Any] = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        Return the audience created with the same parameters, or create one.
+
+        Looks the parameters up in the resource index of the client, then among the
+        audiences of the project with the same name; archived audiences aren't reused.
+
+        :param project_id: ID of the project of the audience
+        :param name: Audience name
+        :param additional_params: Optional parameters, as for create()
+        :return: Tuple of (dictionary with audience details, whether it was created)
+        :raises: AuthenticationError if API key is invalid
+        :raises: ValidationError if required parameters are missing
+        :raises: AccessDeniedError if permission denied
+        :raises: ResourceNotFoundError if project doesn't exist
+        """
+        from src.vsesvit_ai.dedupe import get_or_create
+        data = {
+            'projectId': project_id,
+            'name': name
+        }
+
+        if additional_params:
+            data.update(additional_params)
+
+        return get_or_create(self, "audiences", data,
+                             lambda: self.create(project_id, name, additional_params))
 
     def archive(self, audience_id: int) -> Dict[str, Any]:
         """
@@ -86,7 +119,8 @@ class Audience:
         :raises: ResourceNotFoundError if audience doesn't exist
         """
         endpoint = f"audiences/{audience_id}/archive"
-        return self.client.request("PUT", endpoint)
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, AudienceModel)
 
     def unarchive(self, audience_id: int) -> Dict[str, Any]:
         """
@@ -99,4 +133,5 @@ class Audience:
         :raises: ResourceNotFoundError if audience doesn't exist
         """
         endpoint = f"audiences/{audience_id}/unarchive"
-        return self.client.request("PUT", endpoint)
\ No newline at end of file
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, AudienceModel)
\ No newline at end of file
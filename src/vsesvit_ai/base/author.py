@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+from src.vsesvit_ai.models import AuthorModel, wrap
 
 
 class Author:
@@ -20,7 +21,8 @@ class Author:
         :raises: AccessDeniedError if permission denied
         :raises: ValidationError if query parameters are invalid
         """
-        return self.client.request("GET", "authors", params=params)
+        response = self.client.request("GET", "authors", params=params)
+        return wrap(self.client, response, AuthorModel)
 
     def get_by_id(self, author_id: int) -> Dict[str, Any]:
         """
@@ -32,7 +34,8 @@ class Author:
         :raises: AccessDeniedError if author doesn't exist or permission denied
         :raises: ResourceNotFoundError if author doesn't exist
         """
-        return self.client.request("GET", f"authors/{author_id}")
+        response = self.client.request("GET", f"authors/{author_id}")
+        return wrap(self.client, response, AuthorModel)
 
     def create(self, project_id: int, name: str, biography: str,
                additional_params: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -61,7 +64,39 @@ class Author:
         if additional_params:
             data.update(additional_params)
 
-        return self.client.request("POST", "authors/create", data=data)
+        response = self.client.request("POST", "authors/create", data=data)
+        return wrap(self.client, response, AuthorModel)
+
+    def get_or_create(self, project_id: int, name: str, biography: str,
+                      additional_params: Dict[str, Any] = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        Return the author created with the same parameters, or create one.
+
+        Looks the parameters up in the resource index of the client, then among the
+        authors of the project with the same name; archived authors aren't reused.
+
+        :param project_id: ID of the project of the author
+        :param name: Author name
+        :param biography: Author biography
+        :param additional_params: Optional parameters, as for create()
+        :return: Tuple of (dictionary with author details, whether it was created)
+        :raises: AuthenticationError if API key is invalid
+        :raises: ValidationError if required parameters are missing
+        :raises: AccessDeniedError if permission denied
+        :raises: ResourceNotFoundError if project doesn't exist
+        """
+        from src.vsesvit_ai.dedupe import get_or_create
+        data = {
+            'projectId': project_id,
+            'name': name,
+            'biography': biography
+        }
+
+        if additional_params:
+            data.update(additional_params)
+
+        return get_or_create(self, "authors", data,
+                             lambda: self.create(project_id, name, biography, additional_params))
 
     def archive(self, author_id: int) -> Dict[str, Any]:
         """
@@ -74,7 +109,8 @@ class Author:
         :raises: ResourceNotFoundError if author doesn't exist
         """
         endpoint = f"authors/{author_id}/archive"
-        return self.client.request("PUT", endpoint)
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, AuthorModel)
 
     def unarchive(self, author_id: int) -> Dict[str, Any]:
         """
@@ -87,4 +123,5 @@ class Author:
         :raises: ResourceNotFoundError if author doesn't exist
         """
         endpoint = f"authors/{author_id}/unarchive"
-        return self.client.request("PUT", endpoint)
\ No newline at end of file
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, AuthorModel)
\ No newline at end of file
@@ -1,41 +1,292 @@
-import requests
-from typing import Optional, Dict, Any, Union
-from src.vsesvit_ai.base.article import Article
-from src.vsesvit_ai.base.project import Project
-from src.vsesvit_ai.base.landing import Landing
-from src.vsesvit_ai.base.smart_table import SmartTable
-from src.vsesvit_ai.base.knowledge_base import KnowledgeBase
-from src.vsesvit_ai.base.audience import Audience
-from src.vsesvit_ai.base.author import Author
-from src.vsesvit_ai.base.user import User
-from src.vsesvit_ai.base.exceptions import NetworkError
-from src.vsesvit_ai.errors.error_massages import ERROR_NETWORK
+import threading
+import time
+from functools import cached_property
+from typing import Optional, Dict, Any, List, Union, Callable, Awaitable, ContextManager
+from src.vsesvit_ai import config
+from src.vsesvit_ai.base.exceptions import NetworkError, RateLimitError, ServerError
+from src.vsesvit_ai.codec import JSONCodec, get_codec
 from src.vsesvit_ai.errors.error_handlers import handle_error_response
-from src.vsesvit_ai.config import API_BASE_URL
+from src.vsesvit_ai.forking import ProcessLocal
+from src.vsesvit_ai.transport.base import Transport
 
 
-class VsesvitAI:
-    """The main client to work with VsesvitAI API."""
+class VsesvitAI(ProcessLocal):
+    """
+    The main client to work with VsesvitAI API.
 
-    def __init__(self, api_key: str, base_url: str = API_BASE_URL, debug: bool = False):
+    A client can be pickled (e.g. passed to a ProcessPoolExecutor) and used after os.fork():
+    the key, base URLs and settings are kept, while connections, worker threads and locks
+    are created anew in the other process.
+    """
+
+    _local = ('_executor', '_executor_lock', '_codec')
+
+    def __init__(self, api_key: str, base_url: Optional[Union[str, List[str]]] = None, debug: bool = False,
+                 transport: Optional[Transport] = None, load_env: bool = False,
+                 json_codec: Union[str, JSONCodec] = 'json', models: bool = False,
+                 failover_cooldown: float = 30.0, circuit_breaker: Union[bool, 'CircuitBreakers'] = False,
+                 hedge: Union[bool, 'Hedger'] = False, max_workers: int = 8,
+                 adaptive_concurrency: Union[bool, 'AIMDController'] = False,
+                 scheduler: Union[bool, 'Scheduler'] = False, cache: Union[bool, str, 'ResponseCache'] = False,
+                 prefetch: Union[bool, int, 'Prefetcher'] = False,
+                 resource_index: Union[str, 'ResourceIndex', None] = None, validate: bool = False):
         """
         Initializes the VsesvitAI Client
 
+        Resource attributes (article, project, ...) and the default transport are
+        created on first access, so constructing a client is cheap.
+
         :param api_key: API-the authentication key you got at Vsesvit.ai
-        :param base_url: Base API URL, defaults to value from .env
+        :param base_url: Base API URL, defaults to the API_BASE_URL environment variable or the production URL.
+            A list of URLs (regions or mirrors) sends every request to the fastest healthy one
+            and fails over to the others on NetworkError and ServerError
         :param debug: Enable debug mode to get more detailed error information
+        :param transport: HTTP transport to send requests with, defaults to RequestsTransport
+        :param load_env: Load variables from a .env file before reading settings from the environment
+        :param json_codec: JSON codec name ('auto', 'json', 'orjson', 'msgspec', 'ujson') or a JSONCodec instance;
+            'auto' uses the fastest installed library, the default is the standard library
+        :param models: Return compact typed models (ArticleModel, ModelList, ...) from resource
+            methods instead of response dictionaries
+        :param failover_cooldown: Seconds a base URL is out of rotation after it failed repeatedly
+        :param circuit_breaker: Fail fast with CircuitOpenError while an endpoint group keeps failing;
+            True for the default settings or a CircuitBreakers instance
+        :param hedge: Send a second copy of GET requests that are slower than the 95th percentile of recent
+            latencies and use the first response; True for the default settings or a Hedger instance
+        :param max_workers: Number of threads running calls queued with submit() and batch()
+        :param adaptive_concurrency: Limit the requests in flight from all threads and adapt the limit
+            to 429s, server errors and latency (synchronous requests only); True for the default settings
+            or an AIMDController instance
+        :param scheduler: Admit synchronous requests by priority class ('interactive', 'default', 'batch')
+            under shared concurrency and rate limits; True for a Scheduler using the adaptive limit
+            (or 8 requests in flight), or a Scheduler instance
+        :param cache: Keep synchronous GET responses of reference data (projects, authors, ...) in a SQLite
+            file shared between runs and processes, serving stale entries while they're refreshed in the
+            background; True for 'vsesvit-cache.db', a path, or a ResponseCache instance
+        :param prefetch: Fetch the details of the first items of every list response in the background,
+            so a following get_by_id returns without waiting (synchronous requests only); True for the
+            first 3 items, a number of items, or a Prefetcher instance
+        :param resource_index: Index of the authors, audiences and knowledge bases created by get_or_create(),
+            kept in memory by default; a path of a SQLite file reused by later runs and other processes,
+            or a ResourceIndex instance
+        :param validate: Check the payloads of create requests against the documented parameters and raise
+            ValidationError without sending invalid ones
         """
+        if load_env:
+            config.load_env()
         self.api_key = api_key
-        self.base_url = base_url.rstrip('/')
+        urls = base_url if isinstance(base_url, (list, tuple)) else [base_url or config.get_base_url()]
+        self.base_url = urls[0].rstrip('/')
+        self.router = None
+        if len(urls) > 1:
+            from src.vsesvit_ai.routing import EndpointRouter
+            self.router = EndpointRouter([url.rstrip('/') for url in urls], cooldown=failover_cooldown)
+        self.breakers = None
+        if circuit_breaker:
+            from src.vsesvit_ai.circuit import CircuitBreakers
+            self.breakers = circuit_breaker if isinstance(circuit_breaker, CircuitBreakers) else CircuitBreakers()
+        self.hedger = None
+        if hedge:
+            from src.vsesvit_ai.hedging import Hedger
+            self.hedger = hedge if isinstance(hedge, Hedger) else Hedger()
+        self.concurrency = None
+        if adaptive_concurrency:
+            from src.vsesvit_ai.concurrency import AIMDController
+            self.concurrency = (adaptive_concurrency if isinstance(adaptive_concurrency, AIMDController)
+                                else AIMDController())
+        self.scheduler = None
+        if scheduler:
+            from src.vsesvit_ai.scheduling import Scheduler
+            self.scheduler = (scheduler if isinstance(scheduler, Scheduler)
+                              else Scheduler(max_concurrency=self.concurrency or 8))
+        self.cache = None
+        if cache:
+            from src.vsesvit_ai.cache import ResponseCache
+            if isinstance(cache, ResponseCache):
+                self.cache = cache
+            else:
+                self.cache = ResponseCache() if cache is True else ResponseCache(cache)
+        self.prefetcher = None
+        if prefetch:
+            from src.vsesvit_ai.prefetch import Prefetcher
+            if isinstance(prefetch, Prefetcher):
+                self.prefetcher = prefetch
+            else:
+                self.prefetcher = Prefetcher() if prefetch is True else Prefetcher(top=prefetch)
+        self._resource_index = resource_index
+        self.validator = None
+        if validate:
+            from src.vsesvit_ai.validation import validate_request
+            self.validator = validate_request
         self.debug = debug
-        self.article = Article(self)
-        self.project = Project(self)
-        self.landing = Landing(self)
-        self.knowledge_base = KnowledgeBase(self)
-        self.smart_table = SmartTable(self)
-        self.author = Author(self)
-        self.audience = Audience(self)
-        self.user = User(self)
+        self.models = models
+        self._transport = transport
+        self.max_workers = max_workers
+        self._json_codec = json_codec
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._codec = None
+
+    @property
+    def resource_index(self) -> 'ResourceIndex':
+        """Index of the records created by get_or_create(), opened on first use."""
+        from src.vsesvit_ai.dedupe import ResourceIndex
+
+        with self._executor_lock:
+            if not isinstance(self._resource_index, ResourceIndex):
+                self._resource_index = ResourceIndex(self._resource_index or ':memory:')
+            return self._resource_index
+
+    @property
+    def codec(self) -> JSONCodec:
+        """JSON codec used to encode request bodies and decode responses."""
+        if self._codec is None:
+            self._codec = get_codec(self._json_codec)
+        return self._codec
+
+    @property
+    def transport(self) -> Transport:
+        """HTTP transport used to send requests."""
+        if self._transport is None:
+            from src.vsesvit_ai.transport.requests_transport import RequestsTransport
+            self._transport = RequestsTransport()
+        return self._transport
+
+    @transport.setter
+    def transport(self, transport: Transport) -> None:
+        self._transport = transport
+
+    @property
+    def executor(self) -> 'ThreadPoolExecutor':
+        """Bounded thread pool running calls queued with submit() and batch()."""
+        with self._executor_lock:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                # Worker threads share one keep-alive connection pool unless a transport was set
+                if self._transport is None:
+                    from src.vsesvit_ai.transport.requests_transport import PooledTransport
+                    self._transport = PooledTransport(pool_maxsize=self.max_workers)
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='vsesvit')
+            return self._executor
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> 'Future':
+        """
+        Runs a call on the client thread pool.
+
+        The call runs with the priority class set with priority() when it was submitted.
+
+        :param fn: Function to call, e.g. client.article.get_by_id
+        :returns: concurrent.futures.Future of the call
+        """
+        from src.vsesvit_ai.executor import submit_in_context
+
+        return submit_in_context(self.executor, fn, *args, **kwargs)
+
+    def batch(self, max_pending: Optional[int] = None, raise_errors: bool = False) -> 'Batch':
+        """
+        Creates a batch of calls running on the client thread pool.
+
+        Leaving the batch context waits for all calls; results and errors
+        are collected per call:
+
+            with client.batch() as batch:
+                for article_id in ids:
+                    batch.submit(client.article.get_by_id, article_id)
+            articles = batch.results
+
+        :param max_pending: Maximum number of queued calls that haven't completed, submit() blocks
+            while it is reached; defaults to four per worker thread
+        :param raise_errors: Raise the first error when the batch context exits
+        :returns: Batch
+        """
+        from src.vsesvit_ai.executor import Batch
+
+        return Batch(self.executor, max_pending or 4 * self.max_workers, raise_errors=raise_errors)
+
+    def pipeline(self, max_workers: int = 8, retries: int = 2, retry_delay: float = 1.0,
+                 poll_interval: float = 2.0, timeout: Optional[float] = 1800.0,
+                 reuse: bool = False) -> 'Pipeline':
+        """
+        Creates a pipeline of dependent steps, e.g. knowledge base, author and audience, then articles using them.
+
+            pipeline = client.pipeline()
+            kb = pipeline.knowledge_base("kb", project_id, "Docs", "Product docs", {"sources": sources})
+            post = pipeline.article("post", project_id, "Guide", "Brief", {"knowledgeIds": [kb.id]})
+            pipeline.step("docx", client.article.download, post.id, "docx", path="guide.docx")
+            results = pipeline.run()
+
+        :param max_workers: Maximum number of steps running at once
+        :param retries: Number of times a step is run again after a temporary error
+        :param retry_delay: Seconds before the first retry, doubled for every further retry
+        :param poll_interval: Seconds between checks of the state of a generation job
+        :param timeout: Maximum seconds a step waits for a generation job, None to wait without limit
+        :param reuse: Reuse knowledge bases, authors and audiences created with the same parameters,
+            see get_or_create()
+        :returns: Pipeline
+        """
+        from src.vsesvit_ai.pipeline import Pipeline
+
+        return Pipeline(self, max_workers=max_workers, retries=retries, retry_delay=retry_delay,
+                        poll_interval=poll_interval, timeout=timeout, reuse=reuse)
+
+    def priority(self, name: str) -> 'ContextManager[None]':
+        """
+        Sets the priority class of the requests made in a block of code.
+
+            with client.priority("batch"):
+                client.export("inventory/")
+
+        Priorities are enforced by the client scheduler; without one they have no effect.
+
+        :param name: 'interactive', 'default' or 'batch'
+        :returns: Context manager
+        """
+        from src.vsesvit_ai.scheduling import priority
+
+        return priority(name)
+
+    @cached_property
+    def article(self) -> 'Article':
+        from src.vsesvit_ai.base.article import Article
+        return Article(self)
+
+    @cached_property
+    def project(self) -> 'Project':
+        from src.vsesvit_ai.base.project import Project
+        return Project(self)
+
+    @cached_property
+    def landing(self) -> 'Landing':
+        from src.vsesvit_ai.base.landing import Landing
+        return Landing(self)
+
+    @cached_property
+    def knowledge_base(self) -> 'KnowledgeBase':
+        from src.vsesvit_ai.base.knowledge_base import KnowledgeBase
+        return KnowledgeBase(self)
+
+    @cached_property
+    def smart_table(self) -> 'SmartTable':
+        from src.vsesvit_ai.base.smart_table import SmartTable
+        return SmartTable(self)
+
+    @cached_property
+    def author(self) -> 'Author':
+        from src.vsesvit_ai.base.author import Author
+        return Author(self)
+
+    @cached_property
+    def audience(self) -> 'Audience':
+        from src.vsesvit_ai.base.audience import Audience
+        return Audience(self)
+
+    @cached_property
+    def user(self) -> 'User':
+        from src.vsesvit_ai.base.user import User
+        return User(self)
 
     def request(
             self,
@@ -47,6 +298,7 @@ class VsesvitAI:
             files: Dict[str, Any] = None,
             timeout: Optional[float] = None,
             return_json: bool = True,
+            priority: Optional[str] = None,
     ) -> Union[Dict[str, Any], bytes]:
         """
         Makes a request to the VsesvitAI API.
@@ -59,11 +311,329 @@ class VsesvitAI:
         :param files: Files to upload
         :param timeout: Request timeout in seconds
         :param return_json: Whether to parse response as JSON (True) or return raw content (False)
+        :param priority: Priority class for the client scheduler, defaults to the class set with priority()
         :returns: JSON response as a dictionary or raw binary content
         :raises: VsesvitAIError or one of its subclasses on API errors
         """
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if self.validator is not None:
+            self.validator(method, endpoint, data)
+        if self.prefetcher is not None and method.upper() != 'GET':
+            try:
+                return self._request(method, endpoint, params, data, headers, files, timeout, return_json, priority)
+            finally:
+                # A response prefetched before the write is stale, even if the write failed
+                self.prefetcher.invalidate(endpoint)
+        prefetch = self.prefetcher is not None and method.upper() == 'GET' and return_json
+        if prefetch:
+            prefetched = self.prefetcher.take(endpoint, params)
+            if prefetched is not None:
+                return prefetched
+        result = self._request(method, endpoint, params, data, headers, files, timeout, return_json, priority)
+        if prefetch:
+            self.prefetcher.schedule(endpoint, result, self._prefetch)
+        return result
+
+    def _request(
+            self,
+            method: str,
+            endpoint: str,
+            params: Dict[str, Any] = None,
+            data: Dict[str, Any] = None,
+            headers: Dict[str, str] = None,
+            files: Dict[str, Any] = None,
+            timeout: Optional[float] = None,
+            return_json: bool = True,
+            priority: Optional[str] = None,
+    ) -> Union[Dict[str, Any], bytes]:
+        # Sends a request through the response cache, hedger and _call()
+        json_body, body, headers = self._encode_body(data, files, self._build_headers(headers))
 
+        def send(base_url: str) -> Union[Dict[str, Any], bytes]:
+            response = self.transport.send(
+                method=method,
+                url=self._build_url(endpoint, base_url),
+                params=params,
+                json=json_body,
+                headers=headers,
+                files=files,
+                timeout=timeout,
+                **body
+            )
+            return self._process_response(response, endpoint, return_json)
+
+        def fetch() -> Union[Dict[str, Any], bytes]:
+            if self.hedger is not None and method.upper() == 'GET' and return_json:
+                return self.hedger.call(lambda: self._call(method, endpoint, send, priority))
+            return self._call(method, endpoint, send, priority)
+
+        if self.cache is None or not self.cache.cacheable(endpoint):
+            return fetch()
+        if method.upper() == 'GET' and return_json:
+            return self.cache.fetch(self.api_key, endpoint, params, fetch, self.codec, self.submit)
+        try:
+            return fetch()
+        finally:
+            # The write may have taken effect even if its response was an error
+            self.cache.invalidate(self.api_key, endpoint)
+
+    async def request_async(
+            self,
+            method: str,
+            endpoint: str,
+            params: Dict[str, Any] = None,
+            data: Dict[str, Any] = None,
+            headers: Dict[str, str] = None,
+            files: Dict[str, Any] = None,
+            timeout: Optional[float] = None,
+            return_json: bool = True,
+    ) -> Union[Dict[str, Any], bytes]:
+        """
+        Makes a request to the VsesvitAI API from a coroutine.
+
+        Uses native asyncio with AsyncTransport; other transports run in a worker thread.
+        Arguments and return value are the same as for request().
+
+        :raises: VsesvitAIError or one of its subclasses on API errors
+        """
+        if self.validator is not None:
+            self.validator(method, endpoint, data)
+        json_body, body, headers = self._encode_body(data, files, self._build_headers(headers))
+
+        async def send(base_url: str) -> Union[Dict[str, Any], bytes]:
+            response = await self.transport.send_async(
+                method=method,
+                url=self._build_url(endpoint, base_url),
+                params=params,
+                json=json_body,
+                headers=headers,
+                files=files,
+                timeout=timeout,
+                **body
+            )
+            return self._process_response(response, endpoint, return_json)
+
+        if self.hedger is not None and method.upper() == 'GET' and return_json:
+            return await self.hedger.call_async(lambda: self._call_async(method, endpoint, send))
+        return await self._call_async(method, endpoint, send)
+
+    def stream_list(
+            self,
+            endpoint: str,
+            params: Dict[str, Any] = None,
+            headers: Dict[str, str] = None,
+            timeout: Optional[float] = None,
+            model: Optional[type] = None,
+            chunk_size: int = 65536,
+    ) -> 'ListStream':
+        """
+        Requests a list endpoint and parses its items while the response is downloaded.
+
+        :param endpoint: API endpoint of a list (without base URL)
+        :param params: Query string parameters
+        :param headers: Additional HTTP headers
+        :param timeout: Request timeout in seconds
+        :param model: Model class for the items, used when the client has models enabled
+        :param chunk_size: Size of the body chunks read from the connection in bytes
+        :returns: ListStream yielding the items, with meta available after iteration; the request
+            keeps its scheduler or concurrency slot until the stream is read to the end or closed
+        :raises: VsesvitAIError or one of its subclasses on API errors
+        """
+        from src.vsesvit_ai.streaming import ListStream
+
+        def send(base_url: str) -> ListStream:
+            response = self.transport.stream(
+                method="GET",
+                url=self._build_url(endpoint, base_url),
+                params=params,
+                headers=self._build_headers(headers),
+                timeout=timeout,
+                chunk_size=chunk_size
+            )
+            if response.status_code >= 400:
+                self._process_response(response.read(), endpoint, return_json=True)
+            return ListStream(response, item_factory=model if self.models else None)
+
+        return self._call("GET", endpoint, send, hold=True)
+
+    def sync(self, store: Union[str, 'Mirror'] = 'vsesvit.db', resources: Optional[List[str]] = None,
+             page_size: int = 100) -> 'Mirror':
+        """
+        Updates a local SQLite mirror of the account resources.
+
+        The first sync lists every record, later syncs fetch only records whose
+        updatedAt changed since the previous one.
+
+        :param store: Path of the SQLite database or an open Mirror
+        :param resources: Resource collections to sync (e.g. ['articles']), defaults to all of them
+        :param page_size: Number of records requested per page
+        :returns: Mirror with the synced records, its stats describe the sync
+        :raises: VsesvitAIError or one of its subclasses on API errors
+        """
+        from src.vsesvit_ai.mirror import Mirror
+
+        mirror = store if isinstance(store, Mirror) else Mirror(store)
+        mirror.sync(self, resources=resources, page_size=page_size)
+        return mirror
+
+    def export(self, directory: str, resources: Optional[List[str]] = None, file_format: str = 'auto',
+               page_size: int = 100, max_workers: int = 4, batch_size: int = 10000) -> Dict[str, Dict[str, Any]]:
+        """
+        Exports resources to JSONL or Parquet files, one file per resource.
+
+        Pages are fetched in parallel and written in batches, so memory use
+        doesn't grow with the number of records.
+
+        :param directory: Output directory, created if it doesn't exist
+        :param resources: Resources to export (e.g. ['articles', 'referrals']), defaults to all of them
+        :param file_format: 'jsonl', 'parquet', or 'auto' for Parquet when pyarrow is installed
+        :param page_size: Number of records requested per page
+        :param max_workers: Number of pages fetched concurrently
+        :param batch_size: Number of rows buffered before they are written
+        :returns: Dictionary with the file path and number of rows per resource
+        :raises: VsesvitAIError or one of its subclasses on API errors
+        """
+        from src.vsesvit_ai.export import export
+
+        return export(self, directory, resources=resources, file_format=file_format,
+                      page_size=page_size, max_workers=max_workers, batch_size=batch_size)
+
+    def archive_many(self, resources: Union[str, List[str]], ids: Optional[List[int]] = None,
+                     params: Optional[Dict[str, Any]] = None, max_workers: int = 4, retries: int = 2,
+                     retry_delay: float = 1.0, journal: Optional[str] = None, page_size: int = 100) -> 'BulkReport':
+        """
+        Archives records by ID or by list filters, several at a time.
+
+            report = client.archive_many(["articles", "landings"], params={"projectId": 42}, journal="cleanup.jsonl")
+            for (resource, record_id), error in report.failed.items():
+                print(resource, record_id, error)
+
+        :param resources: Resource collection (e.g. 'articles') or several of them when selecting by params
+        :param ids: IDs of the records of a single resource collection
+        :param params: List filters selecting the records instead of IDs; archived records aren't selected
+            unless the filter sets 'archived'
+        :param max_workers: Number of requests sent concurrently
+        :param retries: Number of times a request is sent again after a network, server or rate limit error
+        :param retry_delay: Seconds before the first retry, doubled for every further retry
+        :param journal: Path of a JSON lines file recording archived records; running again with the same
+            journal skips them, so an interrupted run can be resumed
+        :param page_size: Number of records requested per page when selecting by params
+        :returns: BulkReport with the succeeded, failed and skipped records
+        :raises: ValueError if a resource can't be archived, or neither ids nor params are given
+        :raises: VsesvitAIError or one of its subclasses if listing the records fails
+        """
+        from src.vsesvit_ai.bulk import set_archived
+
+        return set_archived(self, 'archive', resources, ids=ids, params=params, max_workers=max_workers,
+                            retries=retries, retry_delay=retry_delay, journal=journal, page_size=page_size)
+
+    def unarchive_many(self, resources: Union[str, List[str]], ids: Optional[List[int]] = None,
+                       params: Optional[Dict[str, Any]] = None, max_workers: int = 4, retries: int = 2,
+                       retry_delay: float = 1.0, journal: Optional[str] = None,
+                       page_size: int = 100) -> 'BulkReport':
+        """
+        Removes records from archived status by ID or by list filters, several at a time.
+
+        Arguments are the same as for archive_many(); records that aren't archived aren't selected
+        by params unless the filter sets 'archived'.
+
+        :returns: BulkReport with the succeeded, failed and skipped records
+        :raises: ValueError if a resource can't be archived, or neither ids nor params are given
+        :raises: VsesvitAIError or one of its subclasses if listing the records fails
+        """
+        from src.vsesvit_ai.bulk import set_archived
+
+        return set_archived(self, 'unarchive', resources, ids=ids, params=params, max_workers=max_workers,
+                            retries=retries, retry_delay=retry_delay, journal=journal, page_size=page_size)
+
+    def close(self) -> None:
+        """Wait for calls queued with submit() and close connections held by the transport."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.hedger is not None:
+            self.hedger.close()
+        if self.cache is not None:
+            self.cache.close()
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        if self._resource_index is not None and not isinstance(self._resource_index, str):
+            self._resource_index.close()
+        if self._transport is not None:
+            self._transport.close()
+
+    async def aclose(self) -> None:
+        """Close connections held by the transport from a coroutine."""
+        if self._transport is not None:
+            await self._transport.aclose()
+
+    def __enter__(self) -> 'VsesvitAI':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _prefetch(self, endpoint: str) -> Dict[str, Any]:
+        # Prefetches yield to the requests callers are waiting for
+        return self._request("GET", endpoint, priority="batch")
+
+    def _call(self, method: str, endpoint: str, send: Callable[[str], Any], priority: Optional[str] = None,
+              hold: bool = False) -> Any:
+        # Sends a request to the base URL, through the circuit breaker, scheduler or
+        # concurrency limit and endpoint router if enabled. With hold, send returns a
+        # ListStream that keeps the slot of the request until it's closed.
+        def call() -> Any:
+            if self.router is None:
+                return send(self.base_url)
+            return self.router.call(send, idempotent=method.upper() != 'POST')
+
+        def limited() -> Any:
+            if hold:
+                return self._held(call, priority)
+            if self.scheduler is not None:
+                return self.scheduler.call(call, priority)
+            if self.concurrency is None:
+                return call()
+            return self.concurrency.call(call)
+
+        if self.breakers is None:
+            return limited()
+        return self.breakers.call(endpoint, limited)
+
+    def _held(self, send: Callable[[], 'ListStream'], priority: Optional[str]) -> 'ListStream':
+        # The latency up to the response headers adjusts the limit, reading the body doesn't
+        if self.scheduler is not None:
+            done = self.scheduler.hold(priority)
+        elif self.concurrency is not None:
+            done = self.concurrency.hold()
+        else:
+            return send()
+        start = time.perf_counter()
+        try:
+            stream = send()
+        except (RateLimitError, ServerError, NetworkError):
+            done(None, True)
+            raise
+        except BaseException:
+            done(None, False)
+            raise
+        latency = time.perf_counter() - start
+        stream.on_close = lambda failed: done(None if failed else latency, failed)
+        return stream
+
+    async def _call_async(self, method: str, endpoint: str, send: Callable[[str], Awaitable[Any]]) -> Any:
+        async def call() -> Any:
+            if self.router is None:
+                return await send(self.base_url)
+            return await self.router.call_async(send, idempotent=method.upper() != 'POST')
+
+        if self.breakers is None:
+            return await call()
+        return await self.breakers.call_async(endpoint, call)
+
+    def _build_url(self, endpoint: str, base_url: Optional[str] = None) -> str:
+        return f"{base_url or self.base_url}/{endpoint.lstrip('/')}"
+
+    def _build_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
         request_headers = {
             'X-API-KEY': self.api_key
         }
@@ -74,34 +644,28 @@ class VsesvitAI:
         if headers:
             request_headers.update(headers)
 
-        try:
-            response = requests.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data,
-                headers=request_headers,
-                files=files,
-                timeout=timeout
-            )
+        return request_headers
 
-            if response.status_code >= 400:
-                handle_error_response(
-                    response=response,
-                    endpoint=endpoint,
-                    api_key=self.api_key,
-                    debug=self.debug
-                )
-
-            if return_json:
-                if response.content:
-                    return response.json()
-                return {}
-            else:
-                return response.content
+    def _encode_body(self, data: Any, files: Optional[Dict[str, Any]], headers: Dict[str, str]):
+        # The standard library codec leaves encoding to the transport; faster codecs
+        # send pre-encoded bytes, so the transport call is unchanged for plain json
+        if data is None or files or self.codec.name == 'json':
+            return data, {}, headers
+        headers['Content-Type'] = 'application/json'
+        return None, {'data': self.codec.dumps(data)}, headers
 
-        except requests.RequestException as e:
-            raise NetworkError(
-                message=ERROR_NETWORK.format(error=str(e)),
-                original_exception=e
+    def _process_response(self, response, endpoint: str, return_json: bool) -> Union[Dict[str, Any], bytes]:
+        if response.status_code >= 400:
+            handle_error_response(
+                response=response,
+                endpoint=endpoint,
+                api_key=self.api_key,
+                debug=self.debug
             )
+
+        if return_json:
+            if response.content:
+                return self.codec.loads(response.content)
+            return {}
+        else:
+            return response.content
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 class VsesvitAIError(Exception):
@@ -95,11 +95,62 @@ class ServerError(VsesvitAIError):
 
 
 class NetworkError(VsesvitAIError):
-    """Exception raised when network issues occur."""
+    """
+    Exception raised when network issues occur.
+
+    connect is True if the connection to the server couldn't be established,
+    so the request is known not to have reached it.
+    """
 
     def __init__(self, message: str = "Network error occurred",
-                 original_exception: Optional[Exception] = None):
+                 original_exception: Optional[Exception] = None, connect: bool = False):
         self.original_exception = original_exception
+        self.connect = connect
         if original_exception:
             message += f": {str(original_exception)}"
         super().__init__(message, None, None)
+
+
+class CassetteError(VsesvitAIError):
+    """Exception raised when a replayed cassette has no recorded response for a request."""
+
+    def __init__(self, message: str = "No recorded interaction matches the request"):
+        super().__init__(message, None, None)
+
+
+class CircuitOpenError(VsesvitAIError):
+    """Exception raised without sending a request while the circuit breaker of an endpoint group is open."""
+
+    def __init__(self, group: str, retry_after: Optional[float] = None,
+                 message: str = "Circuit breaker is open"):
+        self.group = group
+        self.retry_after = retry_after
+        message = f"{message} for {group}"
+        if retry_after is not None:
+            message += f", retry after {retry_after:.1f} seconds"
+        super().__init__(message, None, None)
+
+
+class JobFailedError(VsesvitAIError):
+    """Exception raised when the generation job of a created resource ends in a failed state."""
+
+    def __init__(self, resource_type: str, resource_id: Any, state: str,
+                 message: str = "Generation job failed"):
+        self.resource_type = resource_type
+        self.resource_id = resource_id
+        self.state = state
+        super().__init__(f"{message}: {resource_type} {resource_id} is in state '{state}'", None, None)
+
+
+class PipelineError(VsesvitAIError):
+    """Exception raised when steps of a pipeline failed; results of the completed steps are kept."""
+
+    def __init__(self, errors: Dict[str, Exception], skipped: List[str], results: Dict[str, Any],
+                 message: str = "Pipeline steps failed"):
+        self.errors = errors
+        self.skipped = skipped
+        self.results = results
+        message = f"{message}: {', '.join(errors)}"
+        if skipped:
+            message += f" (skipped: {', '.join(skipped)})"
+        super().__init__(message, None, None)
@@ -1,4 +1,5 @@
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+from src.vsesvit_ai.models import KnowledgeBaseModel, wrap
 
 
 class KnowledgeBase:
@@ -20,7 +21,8 @@ class KnowledgeBase:
         :raises: AccessDeniedError if permission denied
         :raises: ValidationError if query parameters are invalid
         """
-        return self.client.request("GET", "knowledge-bases", params=params)
+        response = self.client.request("GET", "knowledge-bases", params=params)
+        return wrap(self.client, response, KnowledgeBaseModel)
 
     def get_by_id(self, knowledge_base_id: int) -> Dict[str, Any]:
         """
@@ -32,7 +34,8 @@ class KnowledgeBase:
         :raises: AccessDeniedError if knowledge base doesn't exist or permission denied
         :raises: ResourceNotFoundError if knowledge base doesn't exist
         """
-        return self.client.request("GET", f"knowledge-bases/{knowledge_base_id}")
+        response = self.client.request("GET", f"knowledge-bases/{knowledge_base_id}")
+        return wrap(self.client, response, KnowledgeBaseModel)
 
     def create(self, project_id: int, name: str, description: str,
                additional_params: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -63,7 +66,39 @@ class KnowledgeBase:
         if additional_params:
             data.update(additional_params)
 
-        return self.client.request("POST", "knowledge-bases/create", data=data)
+        response = self.client.request("POST", "knowledge-bases/create", data=data)
+        return wrap(self.client, response, KnowledgeBaseModel)
+
+    def get_or_create(self, project_id: int, name: str, description: str,
+                      additional_params: Dict[str, Any] = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        Return the knowledge base created with the same parameters, or create one.
+
+        Looks the parameters up in the resource index of the client, then among the
+        knowledge bases of the project with the same name; archived knowledge bases aren't reused.
+
+        :param project_id: ID of the project of the knowledge base
+        :param name: Knowledge base name
+        :param description: Knowledge base description
+        :param additional_params: Optional parameters, as for create()
+        :return: Tuple of (dictionary with knowledge base details, whether it was created)
+        :raises: AuthenticationError if API key is invalid
+        :raises: ValidationError if required parameters are missing
+        :raises: AccessDeniedError if permission denied
+        :raises: ResourceNotFoundError if project doesn't exist
+        """
+        from src.vsesvit_ai.dedupe import get_or_create
+        data = {
+            'projectId': project_id,
+            'name': name,
+            'description': description
+        }
+
+        if additional_params:
+            data.update(additional_params)
+
+        return get_or_create(self, "knowledge-bases", data,
+                             lambda: self.create(project_id, name, description, additional_params))
 
     def archive(self, knowledge_base_id: int) -> Dict[str, Any]:
         """
@@ -76,7 +111,8 @@ class KnowledgeBase:
         :raises: ResourceNotFoundError if knowledge base doesn't exist
         """
         endpoint = f"knowledge-bases/{knowledge_base_id}/archive"
-        return self.client.request("PUT", endpoint)
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, KnowledgeBaseModel)
 
     def unarchive(self, knowledge_base_id: int) -> Dict[str, Any]:
         """
@@ -89,4 +125,5 @@ class KnowledgeBase:
         :raises: ResourceNotFoundError if knowledge base doesn't exist
         """
         endpoint = f"knowledge-bases/{knowledge_base_id}/unarchive"
-        return self.client.request("PUT", endpoint)
\ No newline at end of file
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, KnowledgeBaseModel)
\ No newline at end of file
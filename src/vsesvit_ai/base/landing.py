@@ -1,4 +1,5 @@
 from typing import Dict, Any, Optional, Union
+from src.vsesvit_ai.models import LandingModel, wrap
 
 
 class Landing:
@@ -20,7 +21,8 @@ class Landing:
         :raises: AccessDeniedError if permission denied
         :raises: ValidationError if query parameters are invalid
         """
-        return self.client.request("GET", "landings", params=params)
+        response = self.client.request("GET", "landings", params=params)
+        return wrap(self.client, response, LandingModel)
 
     def get_by_id(self, landing_id: int) -> Dict[str, Any]:
         """
@@ -32,7 +34,8 @@ class Landing:
         :raises: AccessDeniedError if landing doesn't exist or permission denied
         :raises: ResourceNotFoundError if landing doesn't exist
         """
-        return self.client.request("GET", f"landings/{landing_id}")
+        response = self.client.request("GET", f"landings/{landing_id}")
+        return wrap(self.client, response, LandingModel)
 
     def create(self, project_id: int, name: str, brief: str,
                additional_params: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -83,7 +86,8 @@ class Landing:
         if additional_params:
             data.update(additional_params)
 
-        return self.client.request("POST", "landings/create", data=data)
+        response = self.client.request("POST", "landings/create", data=data)
+        return wrap(self.client, response, LandingModel)
 
     def download(self, landing_id: int, path: Optional[str] = None) -> Union[bytes, str]:
         """
@@ -118,7 +122,8 @@ class Landing:
         :raises: ResourceNotFoundError if landing doesn't exist
         """
         endpoint = f"landings/{landing_id}/archive"
-        return self.client.request("PUT", endpoint)
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, LandingModel)
 
     def unarchive(self, landing_id: int) -> Dict[str, Any]:
         """
@@ -131,4 +136,5 @@ class Landing:
         :raises: ResourceNotFoundError if landing doesn't exist
         """
         endpoint = f"landings/{landing_id}/unarchive"
-        return self.client.request("PUT", endpoint)
\ No newline at end of file
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, LandingModel)
\ No newline at end of file
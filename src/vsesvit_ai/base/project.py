@@ -1,4 +1,5 @@
 from typing import Dict, Any, Optional, Union
+from src.vsesvit_ai.models import ProjectModel, wrap
 
 
 class Project:
@@ -20,7 +21,8 @@ class Project:
         :raises: AccessDeniedError if permission denied
         :raises: ValidationError if query parameters are invalid
         """
-        return self.client.request("GET", "projects", params=params)
+        response = self.client.request("GET", "projects", params=params)
+        return wrap(self.client, response, ProjectModel)
 
     def get_by_id(self, project_id: int) -> Dict[str, Any]:
         """
@@ -33,7 +35,8 @@ class Project:
         :raises: ResourceNotFoundError if project doesn't exist
         """
 
-        return self.client.request("GET", f"projects/{project_id}")
+        response = self.client.request("GET", f"projects/{project_id}")
+        return wrap(self.client, response, ProjectModel)
 
     def create(self, name: str, description: str,
                additional_params: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -56,7 +59,8 @@ class Project:
         if additional_params:
             data.update(additional_params)
 
-        return self.client.request("POST", "projects/create", data=data)
+        response = self.client.request("POST", "projects/create", data=data)
+        return wrap(self.client, response, ProjectModel)
 
     def archive(self, project_id: int) -> Dict[str, Any]:
         """
@@ -69,7 +73,8 @@ class Project:
         :raises: ResourceNotFoundError if project doesn't exist
         """
         endpoint = f"projects/{project_id}/archive"
-        return self.client.request("PUT", endpoint)
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, ProjectModel)
 
     def unarchive(self, project_id: int) -> Dict[str, Any]:
         """
@@ -82,4 +87,5 @@ class Project:
         :raises: ResourceNotFoundError if project doesn't exist
         """
         endpoint = f"projects/{project_id}/unarchive"
-        return self.client.request("PUT", endpoint)
\ No newline at end of file
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, ProjectModel)
\ No newline at end of file
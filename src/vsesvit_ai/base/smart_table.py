@@ -1,4 +1,5 @@
 from typing import Dict, Any, Union, Optional, BinaryIO
+from src.vsesvit_ai.models import SmartTableModel, wrap
 
 
 class SmartTable:
@@ -20,7 +21,8 @@ class SmartTable:
         :raises: AccessDeniedError if permission denied
         :raises: ValidationError if query parameters are invalid
         """
-        return self.client.request("GET", "smart-tables", params=params)
+        response = self.client.request("GET", "smart-tables", params=params)
+        return wrap(self.client, response, SmartTableModel)
 
     def get_by_id(self, table_id: int) -> Dict[str, Any]:
         """
@@ -32,7 +34,8 @@ class SmartTable:
         :raises: AccessDeniedError if smart table doesn't exist or permission denied
         :raises: ResourceNotFoundError if smart table doesn't exist
         """
-        return self.client.request("GET", f"smart-tables/{table_id}")
+        response = self.client.request("GET", f"smart-tables/{table_id}")
+        return wrap(self.client, response, SmartTableModel)
 
     def upload(self, file: Union[str, BinaryIO], file_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -94,7 +97,8 @@ class SmartTable:
         if additional_params:
             data.update(additional_params)
 
-        return self.client.request("POST", "smart-tables/create", data=data)
+        response = self.client.request("POST", "smart-tables/create", data=data)
+        return wrap(self.client, response, SmartTableModel)
 
     def download(self, table_id: int, format: str = "xlsx", path: Optional[str] = None) -> Union[bytes, str]:
         """
@@ -132,7 +136,8 @@ class SmartTable:
         :raises: ResourceNotFoundError if smart table doesn't exist
         """
         endpoint = f"smart-tables/{table_id}/archive"
-        return self.client.request("PUT", endpoint)
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, SmartTableModel)
 
     def unarchive(self, table_id: int) -> Dict[str, Any]:
         """
@@ -145,4 +150,5 @@ class SmartTable:
         :raises: ResourceNotFoundError if smart table doesn't exist
         """
         endpoint = f"smart-tables/{table_id}/unarchive"
-        return self.client.request("PUT", endpoint)
\ No newline at end of file
+        response = self.client.request("PUT", endpoint)
+        return wrap(self.client, response, SmartTableModel)
\ No newline at end of file
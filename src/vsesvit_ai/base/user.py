@@ -1,4 +1,5 @@
 from typing import Dict, Any
+from src.vsesvit_ai.models import UserModel, ReferralModel, wrap
 
 
 class User:
@@ -19,7 +20,8 @@ class User:
         :raises: AuthenticationError if API key is invalid
         :raises: AccessDeniedError if permission denied
         """
-        return self.client.request("GET", "user/me")
+        response = self.client.request("GET", "user/me")
+        return wrap(self.client, response, UserModel)
 
     def get_referrals(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -34,4 +36,5 @@ class User:
         :raises: AccessDeniedError if permission denied
         :raises: ValidationError if query parameters are invalid
         """
-        return self.client.request("GET", "user/referrals", params=params)
\ No newline at end of file
+        response = self.client.request("GET", "user/referrals", params=params)
+        return wrap(self.client, response, ReferralModel)
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+Bulk archive and unarchive of records.
+
+Housekeeping jobs archive thousands of stale articles, landings or smart
+tables; a loop over archive() sends one PUT after the other. archive_many()
+takes the IDs of the records, or list filters selecting them in one or more
+resource collections, and sends the PUTs on a few worker threads. Requests
+failing with errors that may be temporary are retried with backoff; the
+others are reported per record without stopping the run.
+
+With a journal file, every completed record is appended to it as a JSON
+line. A run that was interrupted, or whose failed records should be tried
+again, is resumed by passing the same journal: records it lists as done are
+skipped.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from src.vsesvit_ai.base.exceptions import VsesvitAIError
+from src.vsesvit_ai.calls import list_pages, with_retries
+from src.vsesvit_ai.executor import run_bounded
+
+# Resource collections whose records can be archived
+ARCHIVABLE_RESOURCES = (
+    'projects',
+    'articles',
+    'landings',
+    'smart-tables',
+    'knowledge-bases',
+    'authors',
+    'audiences',
+)
+
+ACTIONS = ('archive', 'unarchive')
+
+Record = Tuple[str, int]
+
+
+class BulkReport:
+    """Outcome of a bulk archive or unarchive run, per record."""
+
+    def __init__(self, action: str):
+        self.action = action
+        self.succeeded: List[Record] = []
+        self.failed: Dict[Record, VsesvitAIError] = {}
+        self.skipped: List[Record] = []
+
+    @property
+    def ok(self) -> bool:
+        """Whether no record failed."""
+        return not self.failed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the report as a dictionary of 'resource/id' lists, errors as messages."""
+        return {
+            'action': self.action,
+            'succeeded': [f'{resource}/{record_id}' for resource, record_id in self.succeeded],
+            'failed': {f'{resource}/{record_id}': str(error) for (resource, record_id), error in self.failed.items()},
+            'skipped': [f'{resource}/{record_id}' for resource, record_id in self.skipped],
+        }
+
+    def __repr__(self) -> str:
+        return (f"BulkReport(action={self.action!r}, succeeded={len(self.succeeded)}, "
+                f"failed={len(self.failed)}, skipped={len(self.skipped)})")
+
+
+class Journal:
+    """JSON lines file of the records a bulk run completed."""
+
+    def __init__(self, path: str, codec):
+        self.path = path
+        self.codec = codec
+        self._lock = threading.Lock()
+        self._file = None
+
+    def completed(self, action: str) -> Set[Record]:
+        """Return the records completed with an action by earlier runs."""
+        done: Set[Record] = set()
+        if not os.path.exists(self.path):
+            return done
+        with open(self.path, 'rb') as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    entry = self.codec.loads(line)
+                except self.codec.decode_errors:
+                    # A line cut short by an interrupted run
+                    continue
+                record = (entry['resource'], entry['id'])
+                if entry['action'] == action:
+                    done.add(record)
+                else:
+                    # A later opposite action undoes an earlier one
+                    done.discard(record)
+        return done
+
+    def write(self, action: str, record: Record) -> None:
+        """Append a completed record and flush it to the file."""
+        line = self.codec.dumps({'action': action, 'resource': record[0], 'id': record[1]}) + b'\n'
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'ab+')
+                # Lines aren't appended to a last line cut short by an interrupted run
+                if self._file.tell():
+                    self._file.seek(-1, os.SEEK_END)
+                    if self._file.read(1) != b'\n':
+                        self._file.write(b'\n')
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _listed(client, resource: str, params: Dict[str, Any], page_size: int) -> Iterator[int]:
+    """Yield the IDs of the records matching list filters."""
+    for response in list_pages(client, resource, params, page_size):
+        for item in response.get('data') or []:
+            yield item['id']
+
+
+def _targets(client, action: str, resources: Union[str, Iterable[str]], ids: Optional[Iterable[int]],
+             params: Optional[Dict[str, Any]], page_size: int) -> List[Record]:
+    resources = [resources] if isinstance(resources, str) else list(resources)
+    unknown = [resource for resource in resources if resource not in ARCHIVABLE_RESOURCES]
+    if unknown:
+        raise ValueError(f"resources can't be archived: {', '.join(unknown)}")
+    if ids is not None:
+        if len(resources) != 1:
+            raise ValueError("ids can only be given for a single resource")
+        return [(resources[0], int(record_id)) for record_id in dict.fromkeys(ids)]
+    if params is None:
+        raise ValueError("either ids or params must be given")
+    # Only records whose state changes are selected, unless the filter says otherwise
+    params = dict({'archived': 'false' if action == 'archive' else 'true'}, **params)
+    # All IDs are listed before the first change, which would shift the pages of the filter
+    return [(resource, record_id) for resource in resources
+            for record_id in dict.fromkeys(_listed(client, resource, params, page_size))]
+
+
+def _send(client, action: str, record: Record, retries: int, retry_delay: float) -> None:
+    with_retries(lambda: client.request('PUT', f'{record[0]}/{record[1]}/{action}'), retries, retry_delay)
+
+
+def set_archived(client, action: str, resources: Union[str, Iterable[str]], ids: Optional[Iterable[int]] = None,
+                 params: Optional[Dict[str, Any]] = None, max_workers: int = 4, retries: int = 2,
+                 retry_delay: float = 1.0, journal: Optional[str] = None, page_size: int = 100) -> BulkReport:
+    """
+    Archive or unarchive records.
+
+    :param client: VsesvitAI client instance
+    :param action: 'archive' or 'unarchive'
+    :param resources: Resource collection (e.g. 'articles') or several of them when selecting by params
+    :param ids: IDs of the records of a single resource collection
+    :param params: List filters selecting the records instead of IDs (e.g. {'projectId': 42});
+        records already in the target state aren't selected unless the filter sets 'archived'
+    :param max_workers: Number of requests sent concurrently
+    :param retries: Number of times a request is sent again after a network, server or rate limit error
+    :param retry_delay: Seconds before the first retry, doubled for every further retry
+    :param journal: Path of a JSON lines file recording completed records; records it lists are skipped
+    :param page_size: Number of records requested per page when selecting by params
+    :return: BulkReport with the succeeded, failed and skipped records
+    :raises: ValueError if the action or a resource is unknown, or neither ids nor params are given
+    :raises: VsesvitAIError or one of its subclasses if listing the records fails
+    """
+    if action not in ACTIONS:
+        raise ValueError(f"action must be one of: {', '.join(ACTIONS)}")
+    records = _targets(client, action, resources, ids, params, page_size)
+    report = BulkReport(action)
+    log = Journal(journal, client.codec) if journal is not None else None
+    done = log.completed(action) if log is not None else set()
+    report.skipped = [record for record in records if record in done]
+
+    def send(record: Record) -> None:
+        _send(client, action, record, retries, retry_delay)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='vsesvit-bulk') as executor:
+            pending = (record for record in records if record not in done)
+            for record, future in run_bounded(executor, send, pending, 2 * max_workers):
+                error = future.exception()
+                if error is None:
+                    report.succeeded.append(record)
+                    if log is not None:
+                        log.write(action, record)
+                elif isinstance(error, VsesvitAIError):
+                    report.failed[record] = error
+                else:
+                    raise error
+    finally:
+        if log is not None:
+            log.close()
+    return report
@@ -0,0 +1,199 @@
+"""
+Persistent cache of GET responses with stale-while-revalidate.
+
+ResponseCache stores decoded list and detail responses in a SQLite file, so
+they survive between runs and are shared by the processes using the file.
+Every resource collection has its own TTL. A fresh entry is returned without
+a request; an entry past its TTL but within the stale window is returned
+immediately while a background request refreshes it; older entries are
+fetched again before they are returned. Writes (create, update, archive) to
+a collection invalidate its cached responses for the API key that made them.
+
+Only collections with a TTL are cached. By default these are the reference
+data that rarely changes: projects, authors, audiences and knowledge bases.
+"""
+import json as jsonlib
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from src.vsesvit_ai.config import key_fingerprint
+from src.vsesvit_ai.forking import ProcessLocal
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    body BLOB NOT NULL,
+    stored REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_resource ON responses (owner, resource);
+'''
+
+# Seconds responses of a resource collection are fresh
+DEFAULT_TTL = {
+    'projects': 300.0,
+    'authors': 300.0,
+    'audiences': 300.0,
+    'knowledge-bases': 300.0,
+}
+
+
+def endpoint_resource(endpoint: str) -> str:
+    """
+    Return the resource collection of an endpoint.
+
+    :param endpoint: API endpoint (e.g. 'projects/42')
+    :return: Resource collection (e.g. 'projects')
+    """
+    return endpoint.strip('/').split('/', 1)[0].split('?', 1)[0]
+
+
+class ResponseCache(ProcessLocal):
+    """SQLite-backed cache of GET responses shared between processes and runs."""
+
+    _local = ('_connection', '_refreshing', '_lock')
+
+    def __init__(self, path: str = 'vsesvit-cache.db', ttl: Optional[Dict[str, float]] = None,
+                 stale_while_revalidate: float = 86400.0):
+        """
+        :param path: Path of the SQLite database, created if it doesn't exist
+        :param ttl: Seconds the responses of a resource collection are fresh, e.g. {'articles': 30};
+            collections without a TTL aren't cached. Defaults to DEFAULT_TTL
+        :param stale_while_revalidate: Seconds after the TTL during which a stale response is
+            returned while it's refreshed in the background
+        """
+        self.path = path
+        self.ttl = dict(DEFAULT_TTL if ttl is None else ttl)
+        self.stale_while_revalidate = stale_while_revalidate
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._connection = None
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """SQLite connection of this process, opened on first use."""
+        with self._lock:
+            if self._connection is None:
+                connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None,
+                                             check_same_thread=False)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.executescript(_SCHEMA)
+                self._connection = connection
+            return self._connection
+
+    def cacheable(self, endpoint: str) -> bool:
+        """Whether responses of an endpoint are cached."""
+        return self.ttl.get(endpoint_resource(endpoint), 0) > 0
+
+    def fetch(self, api_key: str, endpoint: str, params: Optional[Dict[str, Any]],
+              send: Callable[[], Any], codec: Any,
+              refresh: Callable[[Callable[[], Any]], Any]) -> Any:
+        """
+        Return a response from the cache, refreshing or fetching it as needed.
+
+        :param api_key: API key of the request; accounts don't share cached responses
+        :param endpoint: API endpoint of the request
+        :param params: Query string parameters of the request
+        :param send: Function sending the request and returning the decoded response
+        :param codec: JSON codec the responses are stored with
+        :param refresh: Function running a call in the background, e.g. VsesvitAI.submit
+        :return: Decoded response
+        """
+        resource = endpoint_resource(endpoint)
+        # API keys aren't written to the cache file
+        owner = key_fingerprint(api_key)
+        key = _key(owner, endpoint, params)
+        row = self.connection.execute("SELECT body, stored FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            age = time.time() - row[1]
+            ttl = self.ttl.get(resource, 0)
+            if age < ttl:
+                self.hits += 1
+                return codec.loads(row[0])
+            if age < ttl + self.stale_while_revalidate:
+                self.stale_hits += 1
+                self._refresh(key, owner, resource, send, codec, refresh)
+                return codec.loads(row[0])
+        self.misses += 1
+        return self._store(key, owner, resource, send(), codec)
+
+    def invalidate(self, api_key: str, endpoint: str) -> None:
+        """Drop the cached responses of the resource collection of an endpoint."""
+        self.connection.execute("DELETE FROM responses WHERE owner = ? AND resource = ?",
+                                (key_fingerprint(api_key), endpoint_resource(endpoint)))
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self.connection.execute("DELETE FROM responses")
+
+    def prune(self) -> int:
+        """
+        Drop responses that are past their TTL and stale window.
+
+        :return: Number of dropped responses
+        """
+        now = time.time()
+        dropped = 0
+        for resource, ttl in self.ttl.items():
+            cursor = self.connection.execute("DELETE FROM responses WHERE resource = ? AND stored < ?",
+                                             (resource, now - ttl - self.stale_while_revalidate))
+            dropped += cursor.rowcount
+        cursor = self.connection.execute(
+            f"DELETE FROM responses WHERE resource NOT IN ({', '.join('?' for _ in self.ttl)})",
+            tuple(self.ttl))
+        return dropped + cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of fresh hits, stale hits and misses of this process."""
+        return {'hits': self.hits, 'stale_hits': self.stale_hits, 'misses': self.misses}
+
+    def close(self) -> None:
+        """Close the connection of this process."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _store(self, key: str, owner: str, resource: str, response: Any, codec: Any) -> Any:
+        if isinstance(response, dict) and response.get('success', True):
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses (key, owner, resource, body, stored) VALUES (?, ?, ?, ?, ?)",
+                (key, owner, resource, codec.dumps(response), time.time()))
+        return response
+
+    def _refresh(self, key: str, owner: str, resource: str, send: Callable[[], Any], codec: Any,
+                 refresh: Callable[[Callable[[], Any]], Any]) -> None:
+        # One background refresh per entry at a time; a failed refresh keeps the stale entry
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run() -> None:
+            try:
+                self._store(key, owner, resource, send(), codec)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        try:
+            refresh(run)
+        except BaseException:
+            with self._lock:
+                self._refreshing.discard(key)
+            raise
+
+
+def _key(owner: str, endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+    query = jsonlib.dumps(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return f"{owner} {endpoint.strip('/')} {query}"
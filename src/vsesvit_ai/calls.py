@@ -0,0 +1,65 @@
+"""
+Retries and pagination shared by the modules that make many API calls.
+
+with_retries() calls a function again after errors that may be temporary,
+waiting with exponential backoff or as long as a rate limit asks for.
+list_pages() requests the pages of a list endpoint one after the other.
+"""
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type
+
+from src.vsesvit_ai.base.exceptions import NetworkError, RateLimitError, ServerError
+
+# Errors after which a request is sent again
+RETRIED_ERRORS: Tuple[Type[Exception], ...] = (NetworkError, ServerError, RateLimitError)
+
+
+def with_retries(fn: Callable[[], Any], retries: int, retry_delay: float,
+                 errors: Tuple[Type[Exception], ...] = RETRIED_ERRORS,
+                 retry_if: Optional[Callable[[Exception], bool]] = None) -> Any:
+    """
+    Call a function, again after temporary errors.
+
+    :param fn: Function to call without arguments
+    :param retries: Number of times the function is called again after one of the errors
+    :param retry_delay: Seconds before the first retry, doubled for every further retry; a longer
+        retry_after of the error is waited instead
+    :param errors: Errors after which the function is called again
+    :param retry_if: Called with one of the errors, the error is raised when it returns False
+    :return: Result of the function
+    :raises: The error of the last call if every call failed
+    """
+    delay = retry_delay
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return fn()
+        except errors as error:
+            if attempt > retries or (retry_if is not None and not retry_if(error)):
+                raise
+            retry_after = getattr(error, 'retry_after', None)
+            time.sleep(max(delay, retry_after or 0))
+            delay *= 2
+
+
+def list_pages(client, resource: str, params: Dict[str, Any], page_size: int) -> Iterator[Dict[str, Any]]:
+    """
+    Request the pages of a list endpoint in order.
+
+    Stop iterating to skip the remaining pages.
+
+    :param client: VsesvitAI client instance
+    :param resource: Resource collection (e.g. 'articles')
+    :param params: List filters and sort order
+    :param page_size: Number of records requested per page
+    :return: Iterator of the list responses, up to the last page or the first empty one
+    """
+    page = 1
+    while True:
+        response = client.request('GET', resource, params=dict(params, page=page, limit=page_size))
+        yield response
+        meta = response.get('meta') or {}
+        if not response.get('data') or page >= meta.get('last_page', page):
+            return
+        page += 1
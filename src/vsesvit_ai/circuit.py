@@ -0,0 +1,209 @@
+"""
+Circuit breakers that shed load while the API is failing.
+
+Requests are grouped by endpoint with resource IDs removed (articles/{id},
+articles/create, ...). Every group has a breaker that tracks the outcome of
+its recent requests. When the share of NetworkError and ServerError failures
+reaches the threshold, the breaker opens and requests of the group fail
+immediately with CircuitOpenError instead of waiting for a timeout. After
+reset_timeout a few probe requests are let through (half-open); success
+closes the breaker, a failure opens it again.
+"""
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict
+
+from src.vsesvit_ai.base.exceptions import CircuitOpenError, NetworkError, ServerError, VsesvitAIError
+from src.vsesvit_ai.forking import ProcessLocal
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+_ID = re.compile(r'/\d+(?=/|$)')
+
+
+def endpoint_group(endpoint: str) -> str:
+    """
+    Return the group of an endpoint, with resource IDs replaced by {id}.
+
+    :param endpoint: API endpoint (e.g. 'articles/42/archive')
+    :return: Endpoint group (e.g. 'articles/{id}/archive')
+    """
+    return _ID.sub('/{id}', endpoint.split('?', 1)[0].strip('/'))
+
+
+class CircuitBreaker(ProcessLocal):
+    """Breaker of a single endpoint group."""
+
+    _local = ('_probes', '_lock')
+
+    def __init__(self, group: str, failure_rate: float = 0.5, window: int = 20, min_requests: int = 10,
+                 reset_timeout: float = 30.0, half_open_requests: int = 1):
+        """
+        :param group: Endpoint group of the breaker
+        :param failure_rate: Share of failed requests in the window that opens the breaker
+        :param window: Number of recent requests the failure rate is computed over
+        :param min_requests: Minimum number of requests in the window before the breaker can open
+        :param reset_timeout: Seconds the breaker stays open before probe requests are let through
+        :param half_open_requests: Number of concurrent probe requests while half-open
+        """
+        self.group = group
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.reset_timeout = reset_timeout
+        self.half_open_requests = half_open_requests
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.outcomes = deque(maxlen=window)
+        self.rejected = 0
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def before(self) -> None:
+        """
+        Check whether a request may be sent.
+
+        :raises: CircuitOpenError if the breaker is open or all probe requests are in flight
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+            if self.state == OPEN and remaining <= 0:
+                self.state = HALF_OPEN
+                self._probes = 0
+            if self.state == HALF_OPEN and self._probes < self.half_open_requests:
+                self._probes += 1
+                return
+            self.rejected += 1
+        raise CircuitOpenError(self.group, retry_after=max(0.0, remaining))
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of a request that was let through."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+                if success:
+                    self.state = CLOSED
+                    self.outcomes.clear()
+                else:
+                    self._open()
+                return
+            self.outcomes.append(success)
+            if self.state == CLOSED and len(self.outcomes) >= self.min_requests:
+                failures = self.outcomes.count(False)
+                if failures / len(self.outcomes) >= self.failure_rate:
+                    self._open()
+
+    def release(self) -> None:
+        """Release a request that was let through without an outcome (e.g. it was cancelled)."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes = max(0, self._probes - 1)
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the state, failure rate of the window and number of rejected requests."""
+        with self._lock:
+            count = len(self.outcomes)
+            return {
+                'state': self.state,
+                'failure_rate': round(self.outcomes.count(False) / count, 4) if count else 0.0,
+                'requests': count,
+                'rejected': self.rejected,
+            }
+
+
+class CircuitBreakers(ProcessLocal):
+    """Circuit breakers of all endpoint groups of a client."""
+
+    _local = ('_lock',)
+
+    def __init__(self, failure_rate: float = 0.5, window: int = 20, min_requests: int = 10,
+                 reset_timeout: float = 30.0, half_open_requests: int = 1,
+                 group: Callable[[str], str] = endpoint_group):
+        """
+        Arguments are the settings of every breaker, see CircuitBreaker.
+
+        :param group: Function returning the group of an endpoint
+        """
+        self.settings = {
+            'failure_rate': failure_rate,
+            'window': window,
+            'min_requests': min_requests,
+            'reset_timeout': reset_timeout,
+            'half_open_requests': half_open_requests,
+        }
+        self.group = group
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        """Return the breaker of an endpoint, created on first use."""
+        group = self.group(endpoint)
+        breaker = self.breakers.get(group)
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.setdefault(group, CircuitBreaker(group, **self.settings))
+        return breaker
+
+    def call(self, endpoint: str, send: Callable[[], Any]) -> Any:
+        """
+        Send a request through the breaker of its endpoint group.
+
+        :param endpoint: API endpoint of the request
+        :param send: Function sending the request
+        :return: Result of send
+        :raises: CircuitOpenError if the breaker is open
+        """
+        breaker = self.get(endpoint)
+        breaker.before()
+        try:
+            result = send()
+        except (NetworkError, ServerError):
+            breaker.record(False)
+            raise
+        except VsesvitAIError:
+            # Client errors mean the API is answering
+            breaker.record(True)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record(True)
+        return result
+
+    async def call_async(self, endpoint: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Coroutine version of call()."""
+        breaker = self.get(endpoint)
+        breaker.before()
+        try:
+            result = await send()
+        except (NetworkError, ServerError):
+            breaker.record(False)
+            raise
+        except VsesvitAIError:
+            # Client errors mean the API is answering
+            breaker.record(True)
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record(True)
+        return result
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the stats of every endpoint group, see CircuitBreaker.stats()."""
+        return {group: breaker.stats() for group, breaker in list(self.breakers.items())}
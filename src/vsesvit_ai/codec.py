@@ -0,0 +1,148 @@
+"""
+JSON codecs used to encode request bodies and decode responses.
+
+The 'auto' codec picks the fastest JSON library that is installed
+(orjson, msgspec, ujson) and falls back to the standard library. All codecs
+decode directly from response bytes, without building an intermediate str.
+"""
+import importlib
+from typing import Any, Dict, Tuple, Type, Union
+
+# Preference order of the 'auto' codec
+AUTO_ORDER = ('orjson', 'msgspec', 'ujson', 'json')
+
+
+class JSONCodec:
+    """Standard library JSON codec."""
+
+    name = 'json'
+    # Errors raised by loads() for malformed JSON
+    decode_errors: Tuple[Type[Exception], ...] = (ValueError,)
+
+    def __init__(self):
+        import json
+        self._json = json
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Serialize an object to JSON bytes.
+
+        :param obj: JSON-serializable object
+        :return: UTF-8 encoded JSON
+        """
+        return self._json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Deserialize JSON bytes.
+
+        :param data: UTF-8 encoded JSON
+        :return: Decoded object
+        """
+        return self._json.loads(data)
+
+    def __reduce__(self):
+        # Codecs hold library modules, which can't be pickled: the other process
+        # resolves the codec by name, custom codecs are constructed again
+        if CODECS.get(self.name) is type(self):
+            return get_codec, (self.name,)
+        return type(self), ()
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by orjson."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self.loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec backed by msgspec."""
+
+    name = 'msgspec'
+
+    def __init__(self):
+        import msgspec.json
+        self.dumps = msgspec.json.encode
+        self.loads = msgspec.json.decode
+        # msgspec.DecodeError isn't a ValueError
+        self.decode_errors = (ValueError, msgspec.DecodeError)
+
+
+class UjsonCodec(JSONCodec):
+    """Codec backed by ujson."""
+
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data: bytes) -> Any:
+        return self._ujson.loads(data)
+
+
+CODECS = {
+    'json': JSONCodec,
+    'orjson': OrjsonCodec,
+    'msgspec': MsgspecCodec,
+    'ujson': UjsonCodec,
+}
+
+_instances: Dict[str, JSONCodec] = {}
+
+
+def get_codec(codec: Union[str, JSONCodec] = 'auto') -> JSONCodec:
+    """
+    Resolve a codec by name.
+
+    :param codec: Codec name ('auto', 'json', 'orjson', 'msgspec', 'ujson') or a JSONCodec instance
+    :return: JSONCodec instance
+    :raises: ValueError if the codec name is unknown
+    :raises: ImportError if the library of an explicitly requested codec is not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec in _instances:
+        return _instances[codec]
+
+    if codec == 'auto':
+        for name in AUTO_ORDER:
+            try:
+                instance = get_codec(name)
+            except ImportError:
+                continue
+            _instances['auto'] = instance
+            return instance
+
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec '{codec}', expected one of: auto, {', '.join(CODECS)}")
+
+    _instances[codec] = CODECS[codec]()
+    return _instances[codec]
+
+
+def available_codecs() -> list:
+    """
+    Return names of the codecs whose libraries are installed.
+
+    :return: List of codec names
+    """
+    names = []
+    for name in CODECS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
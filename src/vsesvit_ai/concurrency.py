@@ -0,0 +1,261 @@
+"""
+Adaptive concurrency control and rate limiting for bulk workloads.
+
+AIMDController limits the number of requests a client has in flight and
+adjusts the limit with additive increase / multiplicative decrease: every
+successful request with normal latency raises the limit by 1/limit (about one
+more request per round trip), while a 429, a server or network error, or a
+latency spike cuts it by a factor. All threads of a client (submit(), batch(),
+export, index updates, lazy lists) share the limit, so bulk jobs converge on
+the highest throughput the API sustains.
+
+TokenBucket limits the request rate of the threads of one process. A
+SharedTokenBucket keeps its tokens in a SQLite file, so every process using
+the same file draws from one budget instead of getting a full quota each.
+"""
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+from src.vsesvit_ai.base.exceptions import NetworkError, RateLimitError, ServerError
+from src.vsesvit_ai.forking import ProcessLocal
+
+
+class TokenBucket(ProcessLocal):
+    """Thread-safe token bucket limiting a request rate."""
+
+    _local = ('_lock',)
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        :param rate: Tokens added per second
+        :param burst: Maximum number of tokens, defaults to one second worth of tokens
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available.
+
+        :return: 0 if a token was taken, otherwise the number of seconds until one is available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    Token bucket stored in a SQLite file and shared by all processes that use the file.
+
+    The bucket pickles as its path and settings; every process opens its own connection.
+    """
+
+    _local = ('_lock', '_connection')
+
+    def __init__(self, path: str, rate: float, burst: Optional[int] = None, name: str = 'default'):
+        """
+        :param path: Path of the SQLite database holding the buckets, created if it doesn't exist
+        :param rate: Tokens added per second
+        :param burst: Maximum number of tokens, defaults to one second worth of tokens
+        :param name: Name of the bucket, one file can hold several buckets
+        """
+        self.path = path
+        self.name = name
+        super().__init__(rate, burst)
+
+    def _init_local(self) -> None:
+        super()._init_local()
+        self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute("CREATE TABLE IF NOT EXISTS token_buckets "
+                               "(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)")
+            self._connection = connection
+        return self._connection
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available in the shared bucket.
+
+        :return: 0 if a token was taken, otherwise the number of seconds until one is available
+        """
+        with self._lock:
+            connection = self._connect()
+            # BEGIN IMMEDIATE takes the write lock, so processes update the bucket one at a time
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute("SELECT tokens, updated FROM token_buckets WHERE name = ?",
+                                         (self.name,)).fetchone()
+                # Wall clock time, the monotonic clock isn't comparable between processes everywhere
+                now = time.time()
+                tokens = self.capacity if row is None else min(self.capacity,
+                                                               row[0] + max(0.0, now - row[1]) * self.rate)
+                wait = 0.0
+                if tokens >= 1:
+                    tokens -= 1
+                else:
+                    wait = (1 - tokens) / self.rate
+                connection.execute("INSERT OR REPLACE INTO token_buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                                   (self.name, tokens, now))
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            self.tokens = tokens
+            return wait
+
+    def close(self) -> None:
+        """Close the connection of this process."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class AIMDController(ProcessLocal):
+    """Limit on requests in flight that adapts to errors and latency."""
+
+    _local = ('_condition',)
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 64, backoff: float = 0.5,
+                 latency_tolerance: float = 2.0, window: int = 100, timeout: Optional[float] = None):
+        """
+        :param initial: Initial number of requests allowed in flight
+        :param min_limit: Lowest limit
+        :param max_limit: Highest limit
+        :param backoff: Factor the limit is multiplied with on congestion
+        :param latency_tolerance: A request slower than this multiple of the baseline latency
+            (the fastest of the recent requests) counts as congestion
+        :param window: Number of recent latencies the baseline is taken from
+        :param timeout: Maximum seconds a request waits for a slot, unlimited if not set
+        """
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.timeout = timeout
+        self.decreases = 0
+        self._latencies = deque(maxlen=window)
+        self._last_decrease = 0.0
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self.in_flight = 0
+        self._condition = threading.Condition(threading.RLock())
+
+    @property
+    def baseline(self) -> Optional[float]:
+        """Fastest recent latency in seconds, None before the first request completed."""
+        return min(self._latencies) if self._latencies else None
+
+    def acquire(self) -> None:
+        """
+        Wait for a free slot.
+
+        :raises: TimeoutError if no slot became free within timeout
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self.in_flight < int(self.limit), timeout=self.timeout):
+                raise TimeoutError("no request slot became free in time")
+            self.in_flight += 1
+
+    def release(self, latency: Optional[float], congested: bool) -> None:
+        """
+        Free a slot and adjust the limit.
+
+        :param latency: Latency of the request in seconds, None if it failed
+        :param congested: Whether the request failed in a way that signals overload
+        """
+        with self._condition:
+            self.in_flight -= 1
+            self.adjust(latency, congested)
+            self._condition.notify_all()
+
+    def adjust(self, latency: Optional[float], congested: bool) -> None:
+        """
+        Adjust the limit to the outcome of a request without changing the requests in flight.
+
+        Used by schedulers that admit requests themselves and take their capacity from limit.
+
+        :param latency: Latency of the request in seconds, None if it failed
+        :param congested: Whether the request failed in a way that signals overload
+        """
+        with self._condition:
+            if not congested and latency is not None:
+                baseline = self.baseline
+                self._latencies.append(latency)
+                congested = baseline is not None and latency > baseline * self.latency_tolerance
+                if not congested:
+                    self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            if congested:
+                self._decrease(latency)
+
+    def _decrease(self, latency: Optional[float]) -> None:
+        # Requests in flight during an overload fail or slow down together, and requests sent
+        # at the old limit complete after a decrease: cut the limit at most once per round trip
+        now = time.monotonic()
+        if now - self._last_decrease < (latency or self.baseline or 0.0):
+            return
+        self._last_decrease = now
+        self.decreases += 1
+        self.limit = max(float(self.min_limit), self.limit * self.backoff)
+
+    def hold(self) -> Callable[[Optional[float], bool], None]:
+        """
+        Wait for a free slot and return the function freeing it, see release().
+
+        :raises: TimeoutError if no slot became free within timeout
+        """
+        self.acquire()
+        return self.release
+
+    def call(self, send: Callable[[], Any]) -> Any:
+        """
+        Send a request within the limit.
+
+        :param send: Function sending the request
+        :return: Result of send
+        """
+        self.acquire()
+        start = time.perf_counter()
+        try:
+            result = send()
+        except (RateLimitError, ServerError, NetworkError):
+            self.release(None, congested=True)
+            raise
+        except BaseException:
+            self.release(None, congested=False)
+            raise
+        self.release(time.perf_counter() - start, congested=False)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the current limit, requests in flight, number of decreases and the baseline latency."""
+        return {
+            'limit': round(self.limit, 2),
+            'in_flight': self.in_flight,
+            'decreases': self.decreases,
+            'baseline': self.baseline,
+        }
@@ -1,13 +1,13 @@
 """
 Configuration settings for the VsesvitAI SDK.
 These settings provide default values which can be overridden through environment variables.
+
+Variables from a .env file are not loaded automatically, because searching the
+filesystem slows down every import. Call load_env() or pass load_env=True to the
+VsesvitAI client to load them.
 """
 import os
-from dotenv import load_dotenv
-
-# Attempt to load .env file if it exists
-# This won't cause an error if the file is missing
-load_dotenv()
+from typing import Optional
 
 SUPPORTED_RESOURCES = [
     'article',
@@ -28,4 +28,44 @@ API_KEY_LENGTH = int(os.getenv('API_KEY_LENGTH', '30'))
 
 # Base URL for API requests
 # Can be overridden for testing or using different environments
-API_BASE_URL = os.getenv('API_BASE_URL', 'https://us.vsesvit.ai/api/v1')
\ No newline at end of file
+DEFAULT_API_BASE_URL = 'https://us.vsesvit.ai/api/v1'
+API_BASE_URL = os.getenv('API_BASE_URL', DEFAULT_API_BASE_URL)
+
+
+def load_env(path: Optional[str] = None, override: bool = False) -> bool:
+    """
+    Load variables from a .env file into the environment and refresh the settings.
+
+    :param path: Path to the .env file, searched from the current directory if not set
+    :param override: Whether variables from the file override existing environment variables
+    :return: True if at least one variable was loaded
+    """
+    global API_KEY_PREFIX, API_KEY_LENGTH, API_BASE_URL
+    from dotenv import load_dotenv
+
+    loaded = load_dotenv(dotenv_path=path, override=override)
+    API_KEY_PREFIX = os.getenv('API_KEY_PREFIX', 'vsa_')
+    API_KEY_LENGTH = int(os.getenv('API_KEY_LENGTH', '30'))
+    API_BASE_URL = os.getenv('API_BASE_URL', DEFAULT_API_BASE_URL)
+    return loaded
+
+
+def get_base_url() -> str:
+    """
+    Return the base API URL from the environment.
+
+    :return: Value of API_BASE_URL or the default production URL
+    """
+    return os.getenv('API_BASE_URL', API_BASE_URL)
+
+
+def key_fingerprint(api_key: str) -> str:
+    """
+    Return a short fingerprint of an API key, stored in local files instead of the key itself.
+
+    :param api_key: API key
+    :return: First 16 hex digits of the SHA-256 of the key
+    """
+    import hashlib
+
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
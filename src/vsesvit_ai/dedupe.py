@@ -0,0 +1,214 @@
+"""
+Get-or-create of resources that are often created with identical parameters.
+
+Generators tend to create the same author, audience or knowledge base on
+every run. ResourceIndex maps a hash of the create payload to the ID of the
+record it created. get_or_create() returns the indexed record if it still
+exists, isn't archived and its generation job didn't fail. On an index miss
+it compares the payload with the details of the records of the project with
+the same name, and only creates a record when none matches. Those records are
+found in a map of the unarchived records by project and name, listed once per
+collection and process and kept up to date by get_or_create(); records
+created otherwise after that aren't found.
+
+The index is kept in memory by default; with a path it's a SQLite file that
+repeated runs and other processes reuse. API keys are stored as fingerprints,
+and accounts never share entries.
+"""
+import hashlib
+import json as jsonlib
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.vsesvit_ai.base.exceptions import AccessDeniedError, ResourceNotFoundError
+from src.vsesvit_ai.calls import list_pages
+from src.vsesvit_ai.config import key_fingerprint
+from src.vsesvit_ai.forking import ProcessLocal
+from src.vsesvit_ai.models import job_status, unwrap
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS resources (
+    owner TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    PRIMARY KEY (owner, resource, hash)
+);
+'''
+
+
+def payload_hash(data: Dict[str, Any]) -> str:
+    """
+    Return the hash of a create payload; key order doesn't change it.
+
+    :param data: Create payload
+    :return: SHA-256 hex digest of the canonical JSON of the payload
+    """
+    return hashlib.sha256(_canonical(data).encode('utf-8')).hexdigest()
+
+
+def _canonical(value: Any) -> str:
+    return jsonlib.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+# Project ID and name of a record
+NameKey = Tuple[Any, str]
+
+
+class ResourceIndex(ProcessLocal):
+    """Index of records by the hash of the payload they were created with."""
+
+    _local = ('_connection', '_names', '_locks', '_lock')
+
+    def __init__(self, path: str = ':memory:'):
+        """
+        :param path: Path of the SQLite database, created if it doesn't exist; ':memory:' keeps
+            the index in the memory of the process
+        """
+        self.path = path
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._connection = None
+        self._names: Dict[Tuple[str, str], Dict[NameKey, List[int]]] = {}
+        self._locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """SQLite connection of this process, opened on first use."""
+        with self._lock:
+            if self._connection is None:
+                connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None,
+                                             check_same_thread=False)
+                connection.executescript(_SCHEMA)
+                self._connection = connection
+            return self._connection
+
+    def get(self, owner: str, resource: str, digest: str) -> Optional[int]:
+        """Return the ID of the record created with a payload hash, None if it isn't indexed."""
+        row = self.connection.execute("SELECT id FROM resources WHERE owner = ? AND resource = ? AND hash = ?",
+                                      (owner, resource, digest)).fetchone()
+        return row[0] if row else None
+
+    def put(self, owner: str, resource: str, digest: str, record_id: int) -> None:
+        """Index the ID of the record created with a payload hash."""
+        self.connection.execute("INSERT OR REPLACE INTO resources (owner, resource, hash, id) VALUES (?, ?, ?, ?)",
+                                (owner, resource, digest, record_id))
+
+    def discard(self, owner: str, resource: str, digest: str) -> None:
+        """Drop the entry of a payload hash."""
+        self.connection.execute("DELETE FROM resources WHERE owner = ? AND resource = ? AND hash = ?",
+                                (owner, resource, digest))
+
+    def names(self, owner: str, resource: str,
+              load: Callable[[], Iterable[Tuple[NameKey, int]]]) -> Dict[NameKey, List[int]]:
+        """
+        Return the map of record IDs by project and name of a collection, loaded once per process.
+
+        :param owner: API key fingerprint
+        :param resource: Resource collection
+        :param load: Function returning the (project and name, ID) of every record, called on first use
+        :return: Dictionary of lists of record IDs by (project ID, name)
+        """
+        with self.locked(owner, resource, ''):
+            names = self._names.get((owner, resource))
+            if names is None:
+                names = {}
+                for key, record_id in load():
+                    names.setdefault(key, []).append(record_id)
+                self._names[(owner, resource)] = names
+            return names
+
+    def add_name(self, owner: str, resource: str, key: NameKey, record_id: int) -> None:
+        """Add a created record to the map of its collection, if the map was loaded."""
+        with self._lock:
+            names = self._names.get((owner, resource))
+            if names is not None:
+                names.setdefault(key, []).append(record_id)
+
+    @contextmanager
+    def locked(self, owner: str, resource: str, digest: str) -> Iterator[None]:
+        """Serialize the get-or-create calls of a payload within the process, so it's created once."""
+        with self._lock:
+            lock = self._locks.setdefault((owner, resource, digest), threading.Lock())
+        with lock:
+            yield
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM resources").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection of this process."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+def get_or_create(resource, collection: str, data: Dict[str, Any],
+                  create: Callable[[], Any], page_size: int = 100) -> Tuple[Any, bool]:
+    """
+    Return a record created with the same payload, or create one.
+
+    :param resource: Resource instance (e.g. client.author)
+    :param collection: Resource collection of the record (e.g. 'authors')
+    :param data: Create payload
+    :param create: Function creating the record and returning its response
+    :param page_size: Number of records requested per page while listing the records of the collection
+    :return: Tuple of (record response, whether it was created)
+    """
+    client = resource.client
+    index = client.resource_index
+    owner = key_fingerprint(client.api_key)
+    digest = payload_hash(data)
+    with index.locked(owner, collection, digest):
+        record_id = index.get(owner, collection, digest)
+        if record_id is not None:
+            response = _existing(resource, collection, record_id)
+            if response is not None:
+                return response, False
+            index.discard(owner, collection, digest)
+
+        key = (data.get('projectId'), data['name'])
+        names = index.names(owner, collection, lambda: _listed(resource.client, collection, page_size))
+        for candidate in list(names.get(key, ())):
+            # Summaries don't include the payload fields, candidates are compared by their details
+            response = _existing(resource, collection, candidate)
+            if response is not None and _matches(unwrap(response), data):
+                index.put(owner, collection, digest, candidate)
+                return response, False
+
+        response = create()
+        record_id = unwrap(response)['id']
+        index.put(owner, collection, digest, record_id)
+        index.add_name(owner, collection, key, record_id)
+        return response, True
+
+
+def _existing(resource, collection: str, record_id: int) -> Optional[Any]:
+    # Indexed records may have been deleted or archived since, and a record whose job
+    # failed would fail every caller reusing it
+    try:
+        response = resource.get_by_id(record_id)
+    except (ResourceNotFoundError, AccessDeniedError):
+        return None
+    record = unwrap(response)
+    if record.get('archived') or job_status(collection, record) == 'failed':
+        return None
+    return response
+
+
+def _listed(client, collection: str, page_size: int) -> Iterable[Tuple[NameKey, int]]:
+    # Lists can only be filtered by archived status, records are keyed by project and name on the client
+    for response in list_pages(client, collection, {'archived': False}, page_size):
+        for summary in response.get('data') or []:
+            if job_status(collection, summary) != 'failed':
+                yield (summary.get('projectId'), summary.get('name')), summary['id']
+
+
+def _matches(record: Dict[str, Any], data: Dict[str, Any]) -> bool:
+    return all(_canonical(record.get(key)) == _canonical(value) for key, value in data.items())
+
@@ -1,7 +1,6 @@
 import re
-import requests
 from typing import Tuple
-from src.vsesvit_ai.config import API_KEY_PREFIX, API_KEY_LENGTH
+from src.vsesvit_ai import config
 from src.vsesvit_ai.base.exceptions import *
 from src.vsesvit_ai.errors.error_massages import *
 
@@ -69,11 +68,11 @@ def is_valid_api_key_format(api_key: str) -> bool:
     :param api_key: API key to check
     :return: True if the key format is valid
     """
-    return api_key.startswith(API_KEY_PREFIX) and len(api_key) == API_KEY_LENGTH
+    return api_key.startswith(config.API_KEY_PREFIX) and len(api_key) == config.API_KEY_LENGTH
 
 
 def handle_error_response(
-        response: requests.Response,
+        response: 'requests.Response',
         endpoint: str,
         api_key: str,
         debug: bool = False) -> None:
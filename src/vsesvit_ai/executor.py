@@ -0,0 +1,138 @@
+"""
+Concurrent execution of SDK calls from synchronous code.
+
+VsesvitAI.submit() runs a call on the client's bounded thread pool and returns
+a concurrent.futures.Future. VsesvitAI.batch() returns a Batch that collects
+the futures of many calls, limits how many are pending at once and records
+the result or error of every call.
+
+Calls submitted by the SDK run with a copy of the context of the submitting
+thread (submit_in_context), so its priority class and other context
+variables apply to the requests of worker threads. run_bounded() runs a
+call for every item of an iterable with a bounded window in flight.
+"""
+import contextvars
+import threading
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+
+def submit_in_context(executor: Executor, fn: Callable[..., Any], *args, **kwargs) -> Future:
+    """
+    Submit a call that runs with the context of the calling thread, e.g. its priority class.
+
+    :param executor: Executor the call runs on
+    :param fn: Function to call
+    :return: Future of the call
+    """
+    return executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+
+def run_bounded(executor: Executor, fn: Callable[[Any], Any], items: Iterable[Any], window: int,
+                ordered: bool = False) -> Iterator[Tuple[Any, Future]]:
+    """
+    Call a function for every item, with at most window calls in flight.
+
+    Items are taken from the iterable as calls complete, so long iterables
+    aren't submitted up front.
+
+    :param executor: Executor the calls run on
+    :param fn: Function called with an item
+    :param items: Items to call the function for
+    :param window: Maximum number of calls running at once
+    :param ordered: Yield the calls in the order of the items instead of as they complete
+    :return: Iterator of (item, completed future) tuples
+    """
+    items = iter(items)
+    # Dictionaries keep the submission order
+    running: Dict[Future, Any] = {}
+
+    def fill() -> None:
+        for item in items:
+            running[submit_in_context(executor, fn, item)] = item
+            if len(running) >= window:
+                return
+
+    fill()
+    while running:
+        if ordered:
+            completed = [next(iter(running))]
+            wait(completed)
+        else:
+            completed, _ = wait(running, return_when=FIRST_COMPLETED)
+        done = [(running.pop(future), future) for future in completed]
+        # The window is refilled before the caller handles the results
+        fill()
+        yield from done
+
+
+class Batch:
+    """Group of calls running on the client executor."""
+
+    def __init__(self, executor: Executor, max_pending: int, raise_errors: bool = False):
+        """
+        :param executor: Executor the calls run on
+        :param max_pending: Maximum number of submitted calls that haven't completed; submit() blocks
+            while the limit is reached
+        :param raise_errors: Raise the first error when the batch context exits
+        """
+        self.executor = executor
+        self.raise_errors = raise_errors
+        self.futures: List[Future] = []
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Queue a call.
+
+        :param fn: Function to call, e.g. client.article.get_by_id
+        :return: Future of the call
+        """
+        self._slots.acquire()
+        try:
+            future = submit_in_context(self.executor, fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self.futures.append(future)
+        return future
+
+    def map(self, fn: Callable[..., Any], *iterables) -> List[Future]:
+        """
+        Queue a call for every item of the iterables, like the built-in map().
+
+        :return: List of futures
+        """
+        return [self.submit(fn, *args) for args in zip(*iterables)]
+
+    def wait(self) -> None:
+        """Wait until every queued call has completed."""
+        for future in list(self.futures):
+            future.exception()
+
+    @property
+    def results(self) -> List[Any]:
+        """Results of the calls in submission order, None for failed calls."""
+        self.wait()
+        return [None if future.exception() else future.result() for future in self.futures]
+
+    @property
+    def errors(self) -> Dict[int, BaseException]:
+        """Errors of the failed calls by their submission index."""
+        self.wait()
+        return {index: future.exception() for index, future in enumerate(self.futures) if future.exception()}
+
+    def __len__(self) -> int:
+        return len(self.futures)
+
+    def __enter__(self) -> 'Batch':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.wait()
+        if exc_type is None and self.raise_errors:
+            errors = self.errors
+            if errors:
+                raise errors[min(errors)]
+
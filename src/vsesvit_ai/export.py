@@ -0,0 +1,192 @@
+"""
+Bulk export of account resources to JSONL or Parquet files.
+
+Every resource is written to its own file in the output directory. List pages
+are fetched in parallel and written in order as soon as they arrive; at most a
+few pages are held in memory at a time, so exports of any size run in bounded
+memory. Parquet output requires pyarrow (pip install pyarrow).
+"""
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.vsesvit_ai.executor import run_bounded
+
+# Resources exported by default
+EXPORTED_RESOURCES = (
+    'projects',
+    'articles',
+    'landings',
+    'smart-tables',
+    'knowledge-bases',
+    'authors',
+    'audiences',
+    'referrals',
+)
+
+# Endpoints of resources that don't follow the resource name
+_ENDPOINTS = {
+    'referrals': 'user/referrals',
+}
+
+# Typed Parquet columns, other fields are stored as JSON in the 'extra' column
+PARQUET_COLUMNS = (
+    ('id', 'int64'),
+    ('name', 'string'),
+    ('projectId', 'int64'),
+    ('language', 'string'),
+    ('state', 'string'),
+    ('archived', 'bool_'),
+    ('createdAt', 'string'),
+    ('updatedAt', 'string'),
+)
+
+FORMATS = ('auto', 'jsonl', 'parquet')
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class JSONLWriter:
+    """Writes records as JSON lines."""
+
+    extension = 'jsonl'
+
+    def __init__(self, path: str, codec):
+        self.file = open(path, 'wb')
+        self.codec = codec
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        dumps = self.codec.dumps
+        self.file.write(b''.join(dumps(record) + b'\n' for record in records))
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class ParquetWriter:
+    """Writes records to a Parquet file, one row group per batch."""
+
+    extension = 'parquet'
+
+    def __init__(self, path: str, codec):
+        import pyarrow
+        import pyarrow.parquet
+
+        self.pyarrow = pyarrow
+        self.schema = pyarrow.schema(
+            [(name, getattr(pyarrow, type_name)()) for name, type_name in PARQUET_COLUMNS] +
+            [('extra', pyarrow.string())]
+        )
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        columns = {name: [record.get(name) for record in records] for name, _ in PARQUET_COLUMNS}
+        typed = {name for name, _ in PARQUET_COLUMNS}
+        columns['extra'] = [
+            json.dumps({key: value for key, value in record.items() if key not in typed}, ensure_ascii=False)
+            for record in records
+        ]
+        self.writer.write_table(self.pyarrow.Table.from_pydict(columns, schema=self.schema))
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def _pages(client, endpoint: str, page_size: int, max_workers: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the pages of a list endpoint in order, fetching up to max_workers pages concurrently."""
+    def fetch(page: int) -> Dict[str, Any]:
+        params = {'page': page, 'limit': page_size, 'sort': 'createdAt', 'direction': 'asc'}
+        return client.request('GET', endpoint, params=params)
+
+    # Records created at the same time may be listed on two pages
+    seen = set()
+
+    def new(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        items = [item for item in response.get('data') or [] if item['id'] not in seen]
+        seen.update(item['id'] for item in items)
+        return items
+
+    first = fetch(1)
+    yield new(first)
+    last_page = (first.get('meta') or {}).get('last_page', 1)
+    if last_page <= 1:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='vsesvit-export') as executor:
+        for _, future in run_bounded(executor, fetch, range(2, last_page + 1), max_workers, ordered=True):
+            yield new(future.result())
+
+
+def _offset_pages(client, endpoint: str, page_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the pages of an offset-paginated endpoint such as user/referrals."""
+    offset = 0
+    while True:
+        response = client.request('GET', endpoint, params={'offset': offset, 'limit': page_size})
+        items = response.get('data') or []
+        if items:
+            yield items
+        total = (response.get('meta') or {}).get('total')
+        offset += len(items)
+        if len(items) < page_size or (total is not None and offset >= total):
+            return
+
+
+def export(client, directory: str, resources: Optional[Iterable[str]] = None, file_format: str = 'auto',
+           page_size: int = 100, max_workers: int = 4, batch_size: int = 10000) -> Dict[str, Dict[str, Any]]:
+    """
+    Export resources to one file per resource.
+
+    :param client: VsesvitAI client instance
+    :param directory: Output directory, created if it doesn't exist
+    :param resources: Resources to export, defaults to EXPORTED_RESOURCES
+    :param file_format: 'jsonl', 'parquet', or 'auto' for Parquet when pyarrow is installed
+    :param page_size: Number of records requested per page
+    :param max_workers: Number of pages fetched concurrently
+    :param batch_size: Number of rows buffered before they are written (a Parquet row group)
+    :return: Dictionary with the file path and number of rows per resource
+    :raises: ValueError if the format is unknown
+    :raises: ImportError if Parquet is requested and pyarrow is not installed
+    :raises: VsesvitAIError or one of its subclasses on API errors
+    """
+    if file_format not in FORMATS:
+        raise ValueError(f"file_format must be one of: {', '.join(FORMATS)}")
+    if file_format == 'auto':
+        file_format = 'parquet' if _has_pyarrow() else 'jsonl'
+    if file_format == 'parquet' and not _has_pyarrow():
+        raise ImportError("Parquet export requires pyarrow, install it with: pip install pyarrow")
+    writer_class = ParquetWriter if file_format == 'parquet' else JSONLWriter
+
+    os.makedirs(directory, exist_ok=True)
+    results = {}
+    for resource in resources or EXPORTED_RESOURCES:
+        endpoint = _ENDPOINTS.get(resource, resource)
+        path = os.path.join(directory, f'{resource}.{writer_class.extension}')
+        if resource == 'referrals':
+            pages = _offset_pages(client, endpoint, page_size)
+        else:
+            pages = _pages(client, endpoint, page_size, max_workers)
+
+        rows = 0
+        batch = []
+        writer = writer_class(path, client.codec)
+        try:
+            for items in pages:
+                batch.extend(items)
+                if len(batch) >= batch_size:
+                    writer.write(batch)
+                    rows += len(batch)
+                    batch = []
+            if batch:
+                writer.write(batch)
+                rows += len(batch)
+        finally:
+            writer.close()
+        results[resource] = {'path': path, 'rows': rows}
+    return results
@@ -0,0 +1,59 @@
+"""
+Pickling and fork safety of SDK objects.
+
+Clients, transports, routers, breakers and limiters hold locks, worker threads
+and open connections that are only valid in the process that created them.
+Those attributes are left out when an object is pickled and created anew when
+it is unpickled, so a configured client can be passed to a ProcessPoolExecutor.
+After os.fork() the child process resets them in every live object before it
+runs any code, so it never writes to a socket or waits on a lock inherited
+from the parent.
+"""
+import os
+import weakref
+from typing import Any, Dict, Tuple
+
+_instances = weakref.WeakSet()
+
+
+class ProcessLocal:
+    """
+    Mixin for objects with attributes that can't be shared between processes.
+
+    Subclasses list those attributes in _local and create them in _init_local(),
+    which runs from __init__ (through _setup_local()), after unpickling and in
+    the child process after a fork. _init_local() therefore starts from nothing:
+    connections and worker threads are set to None and opened again on first use,
+    since a forked child shares the parent's sockets and SQLite handles but none
+    of its threads; counters of requests in flight start at zero, since those
+    requests belong to the threads of the process that sent them; locks are new,
+    since one may have been held by a parent thread at the time of the fork.
+    """
+
+    _local: Tuple[str, ...] = ()
+
+    def _init_local(self) -> None:
+        raise NotImplementedError
+
+    def _setup_local(self) -> None:
+        self._init_local()
+        _instances.add(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in self._local:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._setup_local()
+
+
+def _after_fork_in_child() -> None:
+    for instance in list(_instances):
+        instance._init_local()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,198 @@
+"""
+Hedged GET requests that cut tail latency.
+
+Hedger keeps a window of recent request latencies. Once enough samples are
+collected, a request that hasn't completed after the configured percentile of
+that window is sent a second time and the first successful response wins.
+The number of hedged requests is limited to a share of all requests, so the
+extra load on the API stays bounded.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.vsesvit_ai.executor import submit_in_context
+from src.vsesvit_ai.forking import ProcessLocal
+
+
+class LatencyWindow(ProcessLocal):
+    """Thread-safe window of the most recent request latencies."""
+
+    _local = ('_lock',)
+
+    def __init__(self, size: int = 200):
+        self.samples = deque(maxlen=size)
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self.samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """
+        Return the pct-th percentile of the window using linear interpolation.
+
+        :param pct: Percentile between 0 and 100
+        :return: Latency in seconds, None if the window is empty
+        """
+        with self._lock:
+            ordered = sorted(self.samples)
+        if not ordered:
+            return None
+        rank = (len(ordered) - 1) * pct / 100.0
+        low = int(rank)
+        high = min(low + 1, len(ordered) - 1)
+        return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class Hedger(ProcessLocal):
+    """Sends a second copy of slow requests and returns the first response."""
+
+    _local = ('_executor', '_lock')
+
+    def __init__(self, percentile: float = 95.0, budget: float = 0.05, min_samples: int = 20,
+                 min_delay: float = 0.005, window: int = 200, max_workers: int = 32):
+        """
+        :param percentile: Percentile of recent latencies after which a request is hedged
+        :param budget: Maximum share of requests that may be hedged (0.05 = 5% extra requests)
+        :param min_samples: Number of latency samples collected before requests are hedged
+        :param min_delay: Minimum delay in seconds before a request is hedged
+        :param window: Number of recent latencies the percentile is computed over
+        :param max_workers: Maximum number of requests in flight in the worker threads
+        """
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.latencies = LatencyWindow(window)
+        self.max_workers = max_workers
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                        thread_name_prefix='vsesvit-hedge')
+        return self._executor
+
+    def delay(self) -> Optional[float]:
+        """Return the seconds after which a request is hedged, None while there are too few samples."""
+        if len(self.latencies) < self.min_samples:
+            return None
+        return max(self.min_delay, self.latencies.percentile(self.percentile))
+
+    def call(self, send: Callable[[], Any]) -> Any:
+        """
+        Send a request, hedging it if it's slower than the latency percentile.
+
+        :param send: Function sending the request and returning its result; must be idempotent
+        :return: Result of the first successful attempt
+        :raises: The error of the first attempt if both attempts failed
+        """
+        delay = self._start()
+        if delay is None:
+            return self._timed(send)
+
+        primary = submit_in_context(self.executor, self._timed, send)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._take_hedge():
+            return primary.result()
+
+        hedge = submit_in_context(self.executor, self._timed, send)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self._hedge_won()
+                    # The other attempt completes in the background, its result is discarded
+                    return future.result()
+        return primary.result()
+
+    async def call_async(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Coroutine version of call(); the slower attempt is cancelled."""
+        delay = self._start()
+        if delay is None:
+            return await self._timed_async(send)
+
+        primary = asyncio.ensure_future(self._timed_async(send))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not self._take_hedge():
+            return await primary
+
+        hedge = asyncio.ensure_future(self._timed_async(send))
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self._hedge_won()
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of requests, hedged requests, hedges that won and the current delay."""
+        return {
+            'requests': self.requests,
+            'hedged': self.hedged,
+            'hedge_wins': self.hedge_wins,
+            'delay': self.delay(),
+        }
+
+    def close(self) -> None:
+        """Stop the worker threads; requests still in flight complete in the background."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _start(self) -> Optional[float]:
+        with self._lock:
+            self.requests += 1
+        return self.delay()
+
+    def _take_hedge(self) -> bool:
+        with self._lock:
+            if self.hedged + 1 > self.budget * self.requests:
+                return False
+            self.hedged += 1
+            return True
+
+    def _hedge_won(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+    def _timed(self, send: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        result = send()
+        self.latencies.add(time.perf_counter() - start)
+        return result
+
+    async def _timed_async(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        start = time.perf_counter()
+        result = await send()
+        self.latencies.add(time.perf_counter() - start)
+        return result
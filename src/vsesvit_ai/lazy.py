@@ -0,0 +1,160 @@
+"""
+Lazy list results that fetch record details on demand.
+
+List endpoints return summaries (id, name, state, language, ...). A lazy item
+answers summary fields immediately and fetches the full record with get_by_id
+the first time a detail-only field such as content is read. When one item of a
+page needs its details, the details of the other items of the page are fetched
+in the background, so iterating over a page and reading content doesn't pay the
+latency of every request in sequence. Scans that only read summary fields never
+download the details.
+"""
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from src.vsesvit_ai.executor import submit_in_context
+from src.vsesvit_ai.models import unwrap
+
+_CAMEL_BOUNDARY = re.compile(r'_([a-z])')
+
+
+def _camel_case(name: str) -> str:
+    return _CAMEL_BOUNDARY.sub(lambda match: match.group(1).upper(), name)
+
+
+class LazyItem:
+    """
+    A list item whose detail-only fields are fetched on first access.
+
+    Fields are available as items (item['content']) and as snake_case
+    attributes (item.content, item.project_id).
+    """
+
+    __slots__ = ('_summary', '_page', '_index', '_detail')
+
+    def __init__(self, summary: Dict[str, Any], page: 'LazyList', index: int):
+        self._summary = summary
+        self._page = page
+        self._index = index
+        self._detail = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the full record has been fetched."""
+        return self._detail is not None
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Fetch the full record if it's not fetched yet.
+
+        :return: Full record dictionary
+        :raises: VsesvitAIError or one of its subclasses on API errors
+        """
+        if self._detail is None:
+            self._detail = self._page._fetch(self._index)
+        return self._detail
+
+    def __getitem__(self, key: str) -> Any:
+        if self._detail is None and key in self._summary:
+            return self._summary[key]
+        return self.load()[key]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[_camel_case(name)]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return a field, fetching the full record if the field is not in the summary.
+
+        :param key: Name of the field in the API payload
+        :param default: Value returned when the field is missing
+        :return: Field value
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the full record if it was fetched, the summary otherwise."""
+        return dict(self._detail if self._detail is not None else self._summary)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self._summary.get('id')!r}, loaded={self.loaded})"
+
+
+class LazyList(list):
+    """
+    Page of lazy items with the pagination meta attached.
+
+    With batch enabled, the first detail access on the page starts fetching the
+    details of all items of the page that are not loaded yet in background
+    threads.
+    """
+
+    def __init__(self, response: Dict[str, Any], fetch: Callable[[int], Any], batch: bool = True,
+                 max_workers: int = 4):
+        """
+        Initialize the page
+
+        :param response: get_list response dictionary
+        :param fetch: Function returning the get_by_id response for a record ID
+        :param batch: Fetch details of the whole page in the background on first access
+        :param max_workers: Number of concurrent background requests
+        """
+        summaries = response.get('data') or ()
+        super().__init__(LazyItem(summary, self, index) for index, summary in enumerate(summaries))
+        self.meta = response.get('meta') or {}
+        self.batch = batch
+        self.max_workers = max_workers
+        self._fetch_record = fetch
+        self._futures: Optional[List[Future]] = None
+        self._lock = threading.Lock()
+
+    def _fetch(self, index: int) -> Dict[str, Any]:
+        if not self.batch:
+            return unwrap(self._fetch_record(self[index]['id']))
+
+        with self._lock:
+            if self._futures is None:
+                self._futures = self._start_batch()
+            future = self._futures[index]
+        if future is None:
+            return unwrap(self._fetch_record(self[index]['id']))
+        try:
+            return unwrap(future.result())
+        except Exception:
+            # A failed background fetch is retried directly on the next access
+            with self._lock:
+                self._futures[index] = None
+            raise
+
+    def _start_batch(self) -> List[Future]:
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='vsesvit-lazy')
+        futures = []
+        for item in self:
+            if item.loaded:
+                future = Future()
+                future.set_result({'data': item._detail})
+            else:
+                future = submit_in_context(executor, self._fetch_record, item._summary['id'])
+            futures.append(future)
+        # Workers exit once the submitted requests are done
+        executor.shutdown(wait=False)
+        return futures
+
+    def load_all(self) -> None:
+        """
+        Fetch the details of every item of the page.
+
+        :raises: VsesvitAIError or one of its subclasses on API errors
+        """
+        for item in self:
+            item.load()
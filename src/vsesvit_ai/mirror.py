@@ -0,0 +1,252 @@
+"""
+Local SQLite mirror of account resources.
+
+Mirror keeps a copy of every record returned by the get_list endpoints in a
+SQLite database. The first sync lists everything; later syncs list records
+sorted by updatedAt (newest first) and stop at the watermark of the previous
+sync, so only records changed since then are fetched.
+
+Queries on project, state and language are answered from indexed columns,
+the complete record is stored as JSON.
+"""
+import json
+import sqlite3
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.vsesvit_ai.calls import list_pages
+
+# Resource collections mirrored by default, in sync order
+MIRRORED_RESOURCES = (
+    'projects',
+    'articles',
+    'landings',
+    'smart-tables',
+    'knowledge-bases',
+    'authors',
+    'audiences',
+)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS records (
+    resource TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    project_id INTEGER,
+    name TEXT,
+    state TEXT,
+    language TEXT,
+    archived INTEGER,
+    created_at TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (resource, id)
+);
+CREATE INDEX IF NOT EXISTS records_project ON records (resource, project_id);
+CREATE INDEX IF NOT EXISTS records_state ON records (resource, state);
+CREATE INDEX IF NOT EXISTS records_language ON records (resource, language);
+CREATE INDEX IF NOT EXISTS records_updated ON records (resource, updated_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at REAL
+);
+'''
+
+_UPSERT = '''
+INSERT OR REPLACE INTO records
+    (resource, id, project_id, name, state, language, archived, created_at, updated_at, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def scan_changes(client, resource: str, watermark: Optional[str], stored: Callable[[List[int]], Dict[int, str]],
+                 store: Callable[[List[Dict[str, Any]]], None], page_size: int = 100,
+                 params: Optional[Dict[str, Any]] = None) -> Tuple[Optional[str], int, int]:
+    """
+    List the records of a resource changed since a watermark, newest first.
+
+    updatedAt has a resolution of one second, so every record at the watermark
+    is compared with the locally stored copy; the first record older than the
+    watermark ends the scan.
+
+    :param client: VsesvitAI client instance
+    :param resource: Resource collection (e.g. 'articles')
+    :param watermark: updatedAt watermark of the previous scan, None to list everything
+    :param stored: Function returning the stored updatedAt of the given record IDs
+    :param store: Function called with the changed records of every page
+    :param page_size: Number of records requested per page
+    :param params: Additional query parameters (filters)
+    :return: Tuple of (new watermark, number of changed records, number of requests)
+    :raises: VsesvitAIError or one of its subclasses on API errors
+    """
+    # The newest updatedAt seen when the scan starts becomes the next watermark.
+    # Records updated while paging move to the first page and are fetched by the next scan.
+    new_watermark = watermark
+    records = requests = 0
+    query = dict(params or {}, sort='updatedAt', direction='desc')
+    for response in list_pages(client, resource, query, page_size):
+        requests += 1
+        items = response.get('data') or []
+        if requests == 1 and items:
+            new_watermark = max(new_watermark or '', items[0].get('updatedAt') or '') or None
+
+        changed = items
+        done = False
+        if watermark is not None and items:
+            known = stored([item['id'] for item in items])
+            changed = []
+            for item in items:
+                updated_at = item.get('updatedAt') or ''
+                if updated_at < watermark:
+                    done = True
+                    break
+                # Records tying the watermark may have changed later within its second
+                if updated_at > watermark or known.get(item['id']) != updated_at:
+                    changed.append(item)
+        if changed:
+            store(changed)
+        records += len(changed)
+        if done:
+            break
+    return new_watermark, records, requests
+
+
+class Mirror:
+    """SQLite database holding a copy of the account resources."""
+
+    def __init__(self, path: str = 'vsesvit.db'):
+        """
+        Open or create a mirror database
+
+        :param path: Path of the SQLite database file, ':memory:' for an in-memory mirror
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(_SCHEMA)
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def sync(self, client, resources: Optional[Iterable[str]] = None,
+             page_size: int = 100) -> Dict[str, Dict[str, int]]:
+        """
+        Fetch records changed since the last sync and store them.
+
+        Active and archived records are listed separately, each with its own watermark.
+
+        :param client: VsesvitAI client instance
+        :param resources: Resource collections to sync, defaults to MIRRORED_RESOURCES
+        :param page_size: Number of records requested per page
+        :return: Dictionary with the number of fetched records and requests per resource
+        :raises: VsesvitAIError or one of its subclasses on API errors
+        """
+        self.stats = {}
+        for resource in resources or MIRRORED_RESOURCES:
+            stats = {'records': 0, 'requests': 0}
+            for archived in (False, True):
+                records, requests = self._sync_scope(client, resource, archived, page_size)
+                stats['records'] += records
+                stats['requests'] += requests
+            self.stats[resource] = stats
+        return self.stats
+
+    def _sync_scope(self, client, resource: str, archived: bool, page_size: int):
+        scope = f'{resource}:archived={int(archived)}'
+        row = self.connection.execute('SELECT watermark FROM sync_state WHERE scope = ?', (scope,)).fetchone()
+        watermark = row['watermark'] if row else None
+
+        def stored(ids: List[int]) -> Dict[int, str]:
+            return dict(self.connection.execute(
+                f'SELECT id, updated_at FROM records WHERE resource = ? AND id IN ({",".join("?" * len(ids))})',
+                [resource] + ids
+            ).fetchall())
+
+        new_watermark, records, requests = scan_changes(
+            client, resource, watermark, stored, lambda items: self._store(resource, items),
+            page_size=page_size, params={'archived': archived}
+        )
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO sync_state (scope, watermark, synced_at) VALUES (?, ?, ?)',
+                (scope, new_watermark, time.time())
+            )
+        return records, requests
+
+    def _store(self, resource: str, items: List[Dict[str, Any]]) -> None:
+        rows = [
+            (resource, item['id'], item.get('projectId'), item.get('name'), item.get('state'), item.get('language'),
+             None if item.get('archived') is None else int(bool(item['archived'])),
+             item.get('createdAt'), item.get('updatedAt'), json.dumps(item, ensure_ascii=False))
+            for item in items
+        ]
+        with self.connection:
+            self.connection.executemany(_UPSERT, rows)
+
+    def _where(self, resource: str, project_id: Optional[int], state: Optional[str], language: Optional[str],
+               archived: Optional[bool]):
+        clauses, args = ['resource = ?'], [resource]
+        for column, value in (('project_id', project_id), ('state', state), ('language', language)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                args.append(value)
+        if archived is not None:
+            clauses.append('archived = ?')
+            args.append(int(archived))
+        return ' AND '.join(clauses), args
+
+    def query(self, resource: str, project_id: Optional[int] = None, state: Optional[str] = None,
+              language: Optional[str] = None, archived: Optional[bool] = None,
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return mirrored records matching the filters, ordered by ID.
+
+        :param resource: Resource collection (e.g. 'articles')
+        :param project_id: Only records of this project
+        :param state: Only records in this job state
+        :param language: Only records in this language
+        :param archived: Only archived (True) or active (False) records
+        :param limit: Maximum number of records to return
+        :return: List of record dictionaries as returned by the API
+        """
+        where, args = self._where(resource, project_id, state, language, archived)
+        sql = f'SELECT data FROM records WHERE {where} ORDER BY id'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            args.append(limit)
+        return [json.loads(row['data']) for row in self.connection.execute(sql, args)]
+
+    def count(self, resource: str, project_id: Optional[int] = None, state: Optional[str] = None,
+              language: Optional[str] = None, archived: Optional[bool] = None) -> int:
+        """
+        Count mirrored records matching the filters.
+
+        Arguments are the same as for query().
+
+        :return: Number of records
+        """
+        where, args = self._where(resource, project_id, state, language, archived)
+        return self.connection.execute(f'SELECT COUNT(*) FROM records WHERE {where}', args).fetchone()[0]
+
+    def get(self, resource: str, record_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Return a mirrored record by ID.
+
+        :param resource: Resource collection (e.g. 'articles')
+        :param record_id: ID of the record
+        :return: Record dictionary or None if it's not mirrored
+        """
+        row = self.connection.execute('SELECT data FROM records WHERE resource = ? AND id = ?',
+                                      (resource, record_id)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def watermarks(self) -> Dict[str, Optional[str]]:
+        """Return the updatedAt watermark of every synced scope."""
+        return {row['scope']: row['watermark'] for row in self.connection.execute('SELECT * FROM sync_state')}
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> 'Mirror':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,355 @@
+"""
+Compact typed models for API responses.
+
+Models keep the raw field values of a record in a tuple. The mapping from
+field name to tuple index (the "shape") is shared by every record with the
+same set of fields, so a model takes a fraction of the memory of a dict.
+Values are decoded on access: timestamps become datetime objects, nested
+objects stay as they were received.
+
+Models are opt-in, enable them with VsesvitAI(..., models=True) or wrap a
+response explicitly with ArticleModel.from_response() / ModelList.from_response().
+"""
+import sys
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+# Shapes shared between model instances, keyed by model class and field names
+_SHAPES: Dict[Tuple[type, Tuple[str, ...]], '_Shape'] = {}
+
+
+def parse_timestamp(value: str) -> Any:
+    """
+    Decode an API timestamp.
+
+    :param value: Timestamp string in "YYYY-MM-DD HH:MM:SS" or ISO 8601 format
+    :return: datetime object, or the original value if it can't be parsed
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return value
+
+
+class _Shape:
+    """Field name to tuple index mapping shared by records with the same fields."""
+
+    __slots__ = ('keys', 'index', 'interned')
+
+    def __init__(self, keys: Tuple[str, ...], interned: Tuple[str, ...]):
+        self.keys = keys
+        self.index = {key: i for i, key in enumerate(keys)}
+        self.interned = tuple(i for i, key in enumerate(keys) if key in interned)
+
+
+def _get_shape(model: type, keys: Tuple[str, ...]) -> _Shape:
+    shape = _SHAPES.get((model, keys))
+    if shape is None:
+        shape = _SHAPES.setdefault((model, keys), _Shape(keys, model.INTERNED))
+    return shape
+
+
+class Field:
+    """Model attribute that reads and decodes a raw field on access."""
+
+    __slots__ = ('key', 'decode')
+
+    def __init__(self, key: str, decode: Optional[Callable[[Any], Any]] = None):
+        """
+        Initialize the field
+
+        :param key: Name of the field in the API payload
+        :param decode: Function applied to the raw value on access
+        """
+        self.key = key
+        self.decode = decode
+
+    def __get__(self, instance: Optional['Model'], owner: type) -> Any:
+        if instance is None:
+            return self
+        index = instance._shape.index.get(self.key)
+        if index is None:
+            return None
+        value = instance._values[index]
+        if self.decode is None or value is None:
+            return value
+        return self.decode(value)
+
+
+class Model:
+    """
+    Base class of the typed response models.
+
+    Declared fields are available as snake_case attributes, any field of the
+    payload can be read with model['fieldName'] or model.get('fieldName').
+    """
+
+    __slots__ = ('_shape', '_values')
+
+    # Fields whose string values repeat across records and are interned to share memory
+    INTERNED: Tuple[str, ...] = ('state', 'language')
+
+    id = Field('id')
+    created_at = Field('createdAt', parse_timestamp)
+    updated_at = Field('updatedAt', parse_timestamp)
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Initialize the model
+
+        :param data: Raw record as returned by the API
+        """
+        shape = _get_shape(type(self), tuple(data))
+        values = tuple(data.values())
+        if shape.interned:
+            values = list(values)
+            for i in shape.interned:
+                if type(values[i]) is str:
+                    values[i] = sys.intern(values[i])
+            values = tuple(values)
+        self._shape = shape
+        self._values = values
+
+    @classmethod
+    def from_response(cls, response: Dict[str, Any]) -> 'Model':
+        """
+        Build a model from a single-record API response.
+
+        :param response: Response dictionary with the record under 'data'
+        :return: Model instance
+        """
+        return cls(response['data'])
+
+    def __getitem__(self, key: str) -> Any:
+        index = self._shape.index.get(key)
+        if index is None:
+            raise KeyError(key)
+        return self._values[index]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._shape.index
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Return a raw field value.
+
+        :param key: Name of the field in the API payload
+        :param default: Value returned when the field is missing
+        :return: Raw field value
+        """
+        index = self._shape.index.get(key)
+        return default if index is None else self._values[index]
+
+    def keys(self) -> Tuple[str, ...]:
+        """Return the names of the fields present in the payload."""
+        return self._shape.keys
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dictionary, as received from the API."""
+        return dict(zip(self._shape.keys, self._values))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Model):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return type(self), (self.to_dict(),)
+
+    def __repr__(self) -> str:
+        name = self.get('name')
+        if name is None:
+            return f"{type(self).__name__}(id={self.id!r})"
+        return f"{type(self).__name__}(id={self.id!r}, name={name!r})"
+
+
+class ProjectModel(Model):
+    __slots__ = ()
+
+    name = Field('name')
+    description = Field('description')
+    archived = Field('archived')
+
+
+class _JobModel(Model):
+    """Records produced by a generation job."""
+
+    __slots__ = ()
+
+    name = Field('name')
+    project_id = Field('projectId')
+    language = Field('language')
+    state = Field('state')
+    archived = Field('archived')
+
+
+class ArticleModel(_JobModel):
+    __slots__ = ()
+
+    brief = Field('brief')
+    content = Field('content')
+    keywords = Field('keywords')
+    sections = Field('sections')
+    rules = Field('rules')
+
+
+class LandingModel(_JobModel):
+    __slots__ = ()
+
+    brief = Field('brief')
+
+
+class SmartTableModel(_JobModel):
+    __slots__ = ()
+
+    brief = Field('brief')
+    input_asset_id = Field('inputAssetId')
+
+
+class KnowledgeBaseModel(_JobModel):
+    __slots__ = ()
+
+    description = Field('description')
+
+
+class AuthorModel(_JobModel):
+    __slots__ = ()
+
+    biography = Field('biography')
+
+
+class AudienceModel(_JobModel):
+    __slots__ = ()
+
+
+class UserModel(Model):
+    __slots__ = ()
+
+    email = Field('email')
+    full_name = Field('fullName')
+    company = Field('company')
+    balance = Field('balance')
+
+
+class ReferralModel(Model):
+    __slots__ = ()
+
+    name = Field('name')
+
+
+class ModelList(list):
+    """
+    List of models built from a get_list page, with the pagination meta attached.
+
+    Pages can be merged into one inventory with extend(); meta then describes
+    the last page added.
+    """
+
+    __slots__ = ('meta',)
+
+    def __init__(self, items: Any = (), meta: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the list
+
+        :param items: Models of the page
+        :param meta: Pagination info of the page
+        """
+        super().__init__(items)
+        self.meta = meta or {}
+
+    @classmethod
+    def from_response(cls, response: Dict[str, Any], model: Type[Model]) -> 'ModelList':
+        """
+        Build a model list from a list API response.
+
+        :param response: Response dictionary with records under 'data' and pagination under 'meta'
+        :param model: Model class of the records
+        :return: ModelList instance
+        """
+        return cls(map(model, response.get('data') or ()), response.get('meta'))
+
+    def extend(self, items: Any) -> None:
+        super().extend(items)
+        if isinstance(items, ModelList):
+            self.meta = items.meta
+
+    @property
+    def total(self) -> Optional[int]:
+        """Total number of records reported by the API."""
+        return self.meta.get('total')
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Return the records as plain dictionaries."""
+        return [item.to_dict() for item in self]
+
+    def __reduce__(self):
+        return type(self), (list(self), self.meta)
+
+
+def wrap(client, response: Any, model: Type[Model]) -> Any:
+    """
+    Convert a response to models when the client has models enabled.
+
+    Single records become a model, lists become a ModelList. Other responses
+    and responses of clients without models are returned unchanged.
+
+    :param client: VsesvitAI client instance
+    :param response: Response dictionary
+    :param model: Model class of the records
+    :return: Model, ModelList or the original response
+    """
+    if getattr(client, 'models', False) is not True or not isinstance(response, dict):
+        return response
+    data = response.get('data')
+    if isinstance(data, list):
+        return ModelList.from_response(response, model)
+    if isinstance(data, dict):
+        return model(data)
+    return response
+
+
+def unwrap(response: Any) -> Dict[str, Any]:
+    """
+    Return the record of a single-record response as a dictionary.
+
+    :param response: Response dictionary, or a model when the client has models enabled
+    :return: Record dictionary
+    """
+    if isinstance(response, dict):
+        return response['data']
+    return response.to_dict()
+
+
+# State of the records of every resource collection once their generation job completed
+JOB_STATES: Dict[str, str] = {
+    'projects': 'active',
+    'articles': 'content completed',
+    'landings': 'completed',
+    'smart-tables': 'completed',
+    'knowledge-bases': 'ready',
+    'authors': 'ready',
+    'audiences': 'ready',
+}
+
+# States of a generation job that ended without a result
+FAILED_STATES = ('failed', 'error')
+
+
+def job_status(resource: str, record: Dict[str, Any]) -> str:
+    """
+    Return the status of the generation job of a record.
+
+    States the SDK doesn't know count as pending, so callers waiting for a job
+    should give up after a timeout.
+
+    :param resource: Resource collection of the record (e.g. 'articles')
+    :param record: Record dictionary
+    :return: 'ready' for records without a job or whose job completed, 'failed' for a failed job,
+        'pending' for any other state
+    """
+    state = record.get('state')
+    if state is None or resource not in JOB_STATES or state == JOB_STATES[resource]:
+        return 'ready'
+    return 'failed' if state in FAILED_STATES else 'pending'
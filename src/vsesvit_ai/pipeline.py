@@ -0,0 +1,337 @@
+"""
+Dependency-aware pipelines of SDK calls.
+
+A Pipeline is a graph of named steps. Steps that create resources (knowledge
+bases, authors, audiences, articles, ...) wait until the generation job of
+the record is ready; their result is the record. A job that failed
+(models.FAILED_STATES) fails the step, and so does a job that isn't ready
+after the timeout (30 minutes by default). Arguments of a step may reference
+the results of other steps (step.id, step['field']), which makes the step
+depend on them:
+
+    pipeline = client.pipeline()
+    kb = pipeline.knowledge_base('kb', project_id, 'Docs', 'Product docs',
+                                 {'sources': [{'url': 'https://example.com/docs'}]})
+    author = pipeline.author('author', project_id, 'Jane', 'Technical writer')
+    post = pipeline.article('post', project_id, 'Guide', 'Getting started',
+                            {'knowledgeIds': [kb.id], 'authorId': author.id})
+    pipeline.step('docx', client.article.download, post.id, 'docx', path='guide.docx')
+    results = pipeline.run()
+
+run() starts every step as soon as its dependencies completed, so
+independent steps run in parallel. Failed steps are retried with backoff on
+errors that may be temporary; steps depending on a step that failed are
+skipped and reported in the PipelineError. A create request is only sent
+again when it can't have reached the API (connection errors, rate limits),
+since every create starts a new generation job. With reuse=True, knowledge
+bases, authors and audiences are created with get_or_create(), so running
+the pipeline again reuses those created by earlier runs, and a record whose
+job failed is replaced by a new one. When the client
+validates payloads, run() checks the payloads of all create steps first:
+invalid steps fail without a request and only their dependents are skipped.
+"""
+import inspect
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.vsesvit_ai.base.exceptions import (
+    JobFailedError,
+    NetworkError,
+    PipelineError,
+    RateLimitError,
+    ValidationError,
+)
+from src.vsesvit_ai.calls import with_retries
+from src.vsesvit_ai.executor import submit_in_context
+from src.vsesvit_ai.models import job_status, unwrap
+
+# Errors after which a create request is sent again, if it wasn't received (see _not_received)
+CREATE_ERRORS = (NetworkError, RateLimitError)
+
+
+class Ref:
+    """Reference to the result of a step, or to a field of it, resolved when the step has run."""
+
+    __slots__ = ('step', 'key')
+
+    def __init__(self, step: 'Step', key: Optional[str] = None):
+        self.step = step
+        self.key = key
+
+    def resolve(self, results: Dict[str, Any]) -> Any:
+        result = results[self.step.name]
+        return result if self.key is None else result[self.key]
+
+    def __repr__(self) -> str:
+        return f"Ref({self.step.name!r}, {self.key!r})"
+
+
+class Step:
+    """Node of a pipeline."""
+
+    def __init__(self, name: str, fn: Callable[..., Any], args: Tuple, kwargs: Dict[str, Any],
+                 after: Iterable['Step'], retries: int):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.retries = retries
+        self.attempts = 0
+        # Resource collection of a step creating a record, its payload can be validated up front
+        self.collection: Optional[str] = None
+        self.depends = {step.name for step in after} | {ref.step.name for ref in _refs((args, kwargs))}
+
+    @property
+    def id(self) -> Ref:
+        """Reference to the ID of the record the step created."""
+        return Ref(self, 'id')
+
+    @property
+    def result(self) -> Ref:
+        """Reference to the result of the step."""
+        return Ref(self)
+
+    def __getitem__(self, key: str) -> Ref:
+        return Ref(self, key)
+
+    def __repr__(self) -> str:
+        return f"Step({self.name!r})"
+
+
+class Pipeline:
+    """Runs the steps of a dependency graph in parallel."""
+
+    def __init__(self, client, max_workers: int = 8, retries: int = 2, retry_delay: float = 1.0,
+                 poll_interval: float = 2.0, timeout: Optional[float] = 1800.0, reuse: bool = False):
+        """
+        :param client: VsesvitAI client instance
+        :param max_workers: Maximum number of steps running at once
+        :param retries: Number of times a failed step is run again, unless set for the step
+        :param retry_delay: Seconds before the first retry, doubled for every further retry
+        :param poll_interval: Seconds between checks of the state of a generation job
+        :param timeout: Maximum seconds a step waits for a generation job, None to wait without limit
+        :param reuse: Reuse knowledge bases, authors and audiences created with the same parameters
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.reuse = reuse
+        self.steps: Dict[str, Step] = {}
+
+    def step(self, name: str, fn: Callable[..., Any], *args, after: Iterable[Step] = (),
+             retries: Optional[int] = None, **kwargs) -> Step:
+        """
+        Add a step calling a function.
+
+        :param name: Unique name of the step, the key of its result
+        :param fn: Function to call, e.g. client.article.download
+        :param args: Positional arguments; Refs, also inside lists and dictionaries, are replaced
+            by the results they reference
+        :param after: Steps that must complete first, in addition to those referenced by the arguments
+        :param retries: Number of times the step is run again after a temporary error
+        :param kwargs: Keyword arguments, resolved like args
+        :return: Step
+        :raises: ValueError if the name is taken or a dependency isn't part of the pipeline
+        """
+        if name in self.steps:
+            raise ValueError(f"step '{name}' already exists")
+        step = Step(name, fn, args, kwargs, after, self.retries if retries is None else retries)
+        unknown = step.depends - set(self.steps)
+        if unknown:
+            raise ValueError(f"step '{name}' depends on unknown steps: {', '.join(sorted(unknown))}")
+        self.steps[name] = step
+        return step
+
+    def project(self, name: str, *args, **kwargs) -> Step:
+        """Add a step creating a project, arguments as for Project.create()."""
+        return self._create_step(name, self.client.project, 'projects', args, kwargs)
+
+    def knowledge_base(self, name: str, *args, **kwargs) -> Step:
+        """Add a step creating a knowledge base and waiting until it's indexed."""
+        return self._create_step(name, self.client.knowledge_base, 'knowledge-bases', args, kwargs)
+
+    def author(self, name: str, *args, **kwargs) -> Step:
+        """Add a step creating an author and waiting until it's ready."""
+        return self._create_step(name, self.client.author, 'authors', args, kwargs)
+
+    def audience(self, name: str, *args, **kwargs) -> Step:
+        """Add a step creating an audience and waiting until it's ready."""
+        return self._create_step(name, self.client.audience, 'audiences', args, kwargs)
+
+    def article(self, name: str, *args, **kwargs) -> Step:
+        """Add a step creating an article and waiting until its content is completed."""
+        return self._create_step(name, self.client.article, 'articles', args, kwargs)
+
+    def landing(self, name: str, *args, **kwargs) -> Step:
+        """Add a step creating a landing page and waiting until it's completed."""
+        return self._create_step(name, self.client.landing, 'landings', args, kwargs)
+
+    def smart_table(self, name: str, *args, **kwargs) -> Step:
+        """Add a step creating a smart table and waiting until it's completed."""
+        return self._create_step(name, self.client.smart_table, 'smart-tables', args, kwargs)
+
+    def validate(self) -> Dict[str, ValidationError]:
+        """
+        Check the payloads of the create steps without running them.
+
+        Parameters referencing the results of other steps are checked when the step runs.
+
+        :return: Validation errors of the steps with invalid payloads by step name
+        """
+        from src.vsesvit_ai.validation import check_payload
+
+        invalid: Dict[str, ValidationError] = {}
+        for step in self.steps.values():
+            if step.collection is None:
+                continue
+            try:
+                arguments = inspect.signature(step.args[1].create).bind(*step.args[2:], **step.kwargs).arguments
+            except TypeError as error:
+                invalid[step.name] = ValidationError(f"Invalid arguments of step '{step.name}': {error}",
+                                                     status_code=None)
+                continue
+            additional = arguments.pop('additional_params', None) or {}
+            if isinstance(additional, Ref):
+                continue
+            data = {_payload_field(param): value for param, value in arguments.items()}
+            data.update(additional)
+            deferred = {field for field, value in data.items() if _refs(value)}
+            errors = check_payload(step.collection, {field: value for field, value in data.items()
+                                                     if field not in deferred})
+            errors = {path: messages for path, messages in errors.items() if path not in deferred}
+            if errors:
+                invalid[step.name] = ValidationError(f"Invalid {step.collection} payload", errors=errors,
+                                                     status_code=None)
+        return invalid
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run the pipeline.
+
+        :return: Results of the steps by name
+        :raises: PipelineError if a step failed; completed results are available on the error
+        """
+        results: Dict[str, Any] = {}
+        errors: Dict[str, Exception] = {}
+        waiting = dict(self.steps)
+        if self.client.validator is not None:
+            # Invalid rows are rejected before anything is sent
+            errors.update(self.validate())
+            for name in errors:
+                del waiting[name]
+        running: Dict[Future, Step] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='vsesvit-pipeline') as executor:
+            while waiting or running:
+                for name, step in list(waiting.items()):
+                    if step.depends & set(errors):
+                        continue
+                    if step.depends <= set(results):
+                        del waiting[name]
+                        future = submit_in_context(executor, self._run_step, step, dict(results))
+                        running[future] = step
+                if not running:
+                    # The remaining steps depend on steps that failed
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    if future.exception() is None:
+                        results[step.name] = future.result()
+                    else:
+                        errors[step.name] = future.exception()
+        if errors:
+            raise PipelineError(errors, sorted(waiting), results)
+        return results
+
+    def _create_step(self, name: str, resource, collection: str, args: Tuple, kwargs: Dict[str, Any]) -> Step:
+        step = self.step(name, self._create, collection, resource, *args, **kwargs)
+        step.collection = collection
+        return step
+
+    def _run_step(self, step: Step, results: Dict[str, Any]) -> Any:
+        args = _resolve(step.args, results)
+        kwargs = _resolve(step.kwargs, results)
+        step.attempts = 0
+        if step.collection is not None:
+            return self._create(step, *args, **kwargs)
+
+        def attempt() -> Any:
+            step.attempts += 1
+            return step.fn(*args, **kwargs)
+
+        return with_retries(attempt, step.retries, self.retry_delay)
+
+    def _create(self, step: Step, collection: str, resource, *args, **kwargs) -> Dict[str, Any]:
+        # Creates a record, or finds one created with the same arguments, and waits until
+        # its generation job is ready
+        reuse = self.reuse and hasattr(resource, 'get_or_create')
+
+        def create() -> Dict[str, Any]:
+            step.attempts += 1
+            if reuse:
+                return unwrap(resource.get_or_create(*args, **kwargs)[0])
+            return unwrap(resource.create(*args, **kwargs))
+
+        def create_and_wait() -> Dict[str, Any]:
+            if reuse:
+                record = with_retries(create, step.retries, self.retry_delay)
+            else:
+                # Every create starts a paid generation job, a request the API may have
+                # received isn't sent again
+                record = with_retries(create, step.retries, self.retry_delay, CREATE_ERRORS, _not_received)
+            return self._wait(step, collection, resource, record)
+
+        # get_or_create() skips records whose job failed, create() would only add a duplicate
+        return with_retries(create_and_wait, step.retries if reuse else 0, self.retry_delay, (JobFailedError,))
+
+    def _wait(self, step: Step, collection: str, resource, record: Dict[str, Any]) -> Dict[str, Any]:
+        # States the SDK doesn't know count as pending, the timeout ends the wait
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        record_id = record.get('id')
+        while True:
+            status = job_status(collection, record)
+            if status == 'ready':
+                return record
+            if status == 'failed':
+                raise JobFailedError(type(resource).__name__, record_id, record['state'])
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"{type(resource).__name__} {record_id} is still in state '{record['state']}'")
+            time.sleep(self.poll_interval)
+            record = unwrap(with_retries(lambda: resource.get_by_id(record_id), step.retries, self.retry_delay))
+
+
+def _not_received(error: Exception) -> bool:
+    # Rate limited requests and requests that couldn't connect never reached the API
+    return not isinstance(error, NetworkError) or error.connect
+
+
+def _payload_field(param: str) -> str:
+    # Arguments of create() are sent as camelCase fields, e.g. project_id as projectId
+    head, *rest = param.split('_')
+    return head + ''.join(part.title() for part in rest)
+
+
+def _refs(value: Any) -> List[Ref]:
+    if isinstance(value, Ref):
+        return [value]
+    if isinstance(value, dict):
+        return [ref for item in value.values() for ref in _refs(item)]
+    if isinstance(value, (list, tuple)):
+        return [ref for item in value for ref in _refs(item)]
+    return []
+
+
+def _resolve(value: Any, results: Dict[str, Any]) -> Any:
+    if isinstance(value, Ref):
+        return value.resolve(results)
+    if isinstance(value, dict):
+        return {key: _resolve(item, results) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_resolve(item, results) for item in value)
+    if isinstance(value, list):
+        return [_resolve(item, results) for item in value]
+    return value
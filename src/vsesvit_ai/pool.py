@@ -0,0 +1,361 @@
+"""
+Client pool that spreads requests across several API keys.
+
+VsesvitAIPool is a drop-in VsesvitAI whose requests are routed to one of its
+keys. Every key has its own token bucket and health state: a key answered with
+429 cools down for Retry-After seconds, a key rejected with an authentication
+error is taken out of rotation. Requests without a resource ID go round robin
+to the next healthy key.
+
+Resources are only accessible with the key of the account that owns them, so
+requests for a resource ID are sticky: the owner is learned from create and
+list responses, or found by trying the keys until one isn't denied access.
+
+Key rate limits are kept per process unless shared_limits names a SQLite file,
+in which case every process using the file draws from the same bucket per key.
+"""
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.base.exceptions import (
+    AccessDeniedError,
+    AuthenticationError,
+    RateLimitError,
+    VsesvitAIError,
+)
+from src.vsesvit_ai.codec import JSONCodec
+from src.vsesvit_ai.config import key_fingerprint
+from src.vsesvit_ai.concurrency import SharedTokenBucket, TokenBucket
+from src.vsesvit_ai.errors.error_handlers import parse_resource_info
+from src.vsesvit_ai.transport.base import Transport
+
+
+class _Member:
+    """API key of a pool with its client and health state."""
+
+    __slots__ = ('api_key', 'client', 'bucket', 'disabled', 'cooldown_until', 'requests', 'rate_limited')
+
+    def __init__(self, api_key: str, bucket: Optional[TokenBucket]):
+        self.api_key = api_key
+        self.client: Optional[VsesvitAI] = None
+        self.bucket = bucket
+        self.disabled = False
+        self.cooldown_until = 0.0
+        self.requests = 0
+        self.rate_limited = 0
+
+
+class _Route:
+    """Key selection for a single request."""
+
+    def __init__(self, pool: 'VsesvitAIPool', method: str, endpoint: str):
+        self.pool = pool
+        self.deadline = time.monotonic() + pool.max_wait
+        self.error: Optional[VsesvitAIError] = None
+        self.tried = set()
+
+        resource_type, resource_id = parse_resource_info(endpoint)
+        self.resource = (resource_type, resource_id) if resource_id else None
+        self.creates = method.upper() == 'POST' and endpoint.rstrip('/').endswith('/create')
+        self.resource_type = resource_type
+        self.owner = pool._owner(self.resource) if self.resource else None
+        self.candidates = [self.owner] if self.owner is not None else pool._rotation()
+
+    def next(self) -> Tuple[Optional[_Member], float]:
+        """
+        Pick the key for the next attempt.
+
+        :return: Tuple of (key, 0) to send now, (None, seconds) to wait, or (None, 0) to give up
+        """
+        now = time.monotonic()
+        wait = None
+        for member in self.candidates:
+            if member.disabled or member in self.tried:
+                continue
+            if member.cooldown_until > now:
+                delay = member.cooldown_until - now
+            else:
+                delay = member.bucket.try_acquire() if member.bucket is not None else 0.0
+                if not delay:
+                    return member, 0.0
+            wait = delay if wait is None else min(wait, delay)
+        if wait is None or now + wait > self.deadline:
+            if self.error is None:
+                self.error = RateLimitError(retry_after=int(wait) + 1 if wait is not None else None)
+            return None, 0.0
+        return None, wait
+
+    def failed(self, member: _Member, error: VsesvitAIError) -> bool:
+        """Record a failed attempt, return True if the request should be retried with another key."""
+        self.error = error
+        if isinstance(error, RateLimitError):
+            self.pool._cool_down(member, error.retry_after)
+            return True
+        if isinstance(error, AuthenticationError):
+            self.pool._disable(member)
+            return True
+        if isinstance(error, AccessDeniedError) and self.resource and self.owner is None:
+            # The resource belongs to the account of another key
+            self.tried.add(member)
+            return True
+        return False
+
+    def succeeded(self, member: _Member, result: Any) -> None:
+        if self.resource:
+            if self.owner is None:
+                self.pool._remember(self.resource, member)
+        elif isinstance(result, dict) and self.resource_type:
+            data = result.get('data')
+            if self.creates and isinstance(data, dict) and 'id' in data:
+                self.pool._remember((self.resource_type, str(data['id'])), member)
+            elif isinstance(data, list):
+                for item in data:
+                    if isinstance(item, dict) and 'id' in item:
+                        self.pool._remember((self.resource_type, str(item['id'])), member)
+
+
+class VsesvitAIPool(VsesvitAI):
+    """VsesvitAI client that routes requests across several API keys."""
+
+    _local = VsesvitAI._local + ('_lock',)
+
+    def __init__(self, api_keys: List[str], base_url: Optional[Union[str, List[str]]] = None, debug: bool = False,
+                 transport: Optional[Transport] = None, load_env: bool = False,
+                 json_codec: Union[str, JSONCodec] = 'json', models: bool = False,
+                 rate_limit: Optional[float] = None, burst: Optional[int] = None,
+                 cooldown: float = 60.0, max_wait: float = 30.0, max_owners: int = 100000,
+                 failover_cooldown: float = 30.0, circuit_breaker: Union[bool, 'CircuitBreakers'] = False,
+                 hedge: Union[bool, 'Hedger'] = False, max_workers: int = 8,
+                 adaptive_concurrency: Union[bool, 'AIMDController'] = False,
+                 scheduler: Union[bool, 'Scheduler'] = False, shared_limits: Optional[str] = None,
+                 validate: bool = False):
+        """
+        Initializes the client pool
+
+        :param api_keys: API keys to route requests to
+        :param base_url: Base API URL or a list of URLs to fail over between, defaults to the API_BASE_URL
+            environment variable or the production URL
+        :param debug: Enable debug mode to get more detailed error information
+        :param transport: HTTP transport shared by all keys, defaults to RequestsTransport
+        :param load_env: Load variables from a .env file before reading settings from the environment
+        :param json_codec: JSON codec name or a JSONCodec instance
+        :param models: Return compact typed models from resource methods
+        :param rate_limit: Requests per second allowed for every key, unlimited if not set
+        :param burst: Number of requests a key may send at once, defaults to rate_limit
+        :param cooldown: Seconds a key is out of rotation after a 429 response without Retry-After
+        :param max_wait: Maximum number of seconds a request waits for a key to become available
+        :param max_owners: Maximum number of remembered resource owners
+        :param failover_cooldown: Seconds a base URL is out of rotation after it failed repeatedly
+        :param circuit_breaker: Fail fast with CircuitOpenError while an endpoint group keeps failing
+        :param hedge: Send a second copy of GET requests slower than the 95th percentile of recent latencies
+        :param max_workers: Number of threads running calls queued with submit() and batch()
+        :param adaptive_concurrency: Adapt the number of requests in flight to 429s, server errors and latency
+        :param scheduler: Admit requests by priority class under shared concurrency and rate limits
+        :param shared_limits: Path of a SQLite file holding the rate limits of the keys, so that
+            all processes using the file share one rate limit per key
+        :param validate: Check the payloads of create requests and raise ValidationError without sending invalid ones
+        :raises: ValueError if no API key is given
+        """
+        keys = list(dict.fromkeys(api_keys))
+        if not keys:
+            raise ValueError("api_keys must contain at least one API key")
+        super().__init__(api_key=keys[0], base_url=base_url, debug=debug, transport=transport,
+                         load_env=load_env, json_codec=json_codec, models=models,
+                         failover_cooldown=failover_cooldown, circuit_breaker=circuit_breaker, hedge=hedge,
+                         max_workers=max_workers, adaptive_concurrency=adaptive_concurrency,
+                         scheduler=scheduler, validate=validate)
+        self.cooldown = cooldown
+        self.max_wait = max_wait
+        self.max_owners = max_owners
+        self._members = [_Member(key, self._bucket(key, rate_limit, burst, shared_limits)) for key in keys]
+        self._owners: Dict[Tuple[str, str], _Member] = {}
+        self._next = 0
+
+    def _init_local(self) -> None:
+        super()._init_local()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bucket(api_key: str, rate_limit: Optional[float], burst: Optional[int],
+                shared_limits: Optional[str]) -> Optional[TokenBucket]:
+        if not rate_limit:
+            return None
+        if shared_limits is None:
+            return TokenBucket(rate_limit, burst)
+        # Buckets are named by a fingerprint, API keys aren't written to the file
+        return SharedTokenBucket(shared_limits, rate_limit, burst, name=key_fingerprint(api_key))
+
+    @property
+    def api_keys(self) -> List[str]:
+        """API keys of the pool."""
+        return [member.api_key for member in self._members]
+
+    def health(self) -> List[Dict[str, Any]]:
+        """
+        Return the state of every key.
+
+        :return: List of dictionaries with the masked key, number of requests and 429 responses,
+            whether the key is disabled and the remaining cool-down in seconds
+        """
+        now = time.monotonic()
+        return [{
+            'key': f'{member.api_key[:8]}...',
+            'requests': member.requests,
+            'rate_limited': member.rate_limited,
+            'disabled': member.disabled,
+            'cooldown': round(max(0.0, member.cooldown_until - now), 3),
+        } for member in self._members]
+
+    def request(
+            self,
+            method: str,
+            endpoint: str,
+            params: Dict[str, Any] = None,
+            data: Dict[str, Any] = None,
+            headers: Dict[str, str] = None,
+            files: Dict[str, Any] = None,
+            timeout: Optional[float] = None,
+            return_json: bool = True,
+            priority: Optional[str] = None,
+    ) -> Union[Dict[str, Any], bytes]:
+        """
+        Makes a request to the VsesvitAI API with one of the pool keys.
+
+        Arguments and return value are the same as for VsesvitAI.request().
+
+        :raises: VsesvitAIError or one of its subclasses on API errors,
+            RateLimitError if no key became available within max_wait
+        """
+        return self._route_call(method, endpoint, lambda client: client.request(
+            method, endpoint, params=params, data=data, headers=headers, files=files,
+            timeout=timeout, return_json=return_json, priority=priority
+        ))
+
+    async def request_async(
+            self,
+            method: str,
+            endpoint: str,
+            params: Dict[str, Any] = None,
+            data: Dict[str, Any] = None,
+            headers: Dict[str, str] = None,
+            files: Dict[str, Any] = None,
+            timeout: Optional[float] = None,
+            return_json: bool = True,
+    ) -> Union[Dict[str, Any], bytes]:
+        """
+        Makes a request to the VsesvitAI API with one of the pool keys from a coroutine.
+
+        Arguments and return value are the same as for VsesvitAI.request().
+
+        :raises: VsesvitAIError or one of its subclasses on API errors
+        """
+        route = _Route(self, method, endpoint)
+        while True:
+            member, wait = route.next()
+            if member is None:
+                if not wait:
+                    raise route.error
+                await asyncio.sleep(wait)
+                continue
+            self._count(member)
+            try:
+                result = await self._client(member).request_async(
+                    method, endpoint, params=params, data=data, headers=headers, files=files,
+                    timeout=timeout, return_json=return_json
+                )
+            except VsesvitAIError as error:
+                if not route.failed(member, error):
+                    raise
+                continue
+            route.succeeded(member, result)
+            return result
+
+    def stream_list(
+            self,
+            endpoint: str,
+            params: Dict[str, Any] = None,
+            headers: Dict[str, str] = None,
+            timeout: Optional[float] = None,
+            model: Optional[type] = None,
+            chunk_size: int = 65536,
+    ) -> 'ListStream':
+        """
+        Streams a list endpoint with one of the pool keys.
+
+        Arguments and return value are the same as for VsesvitAI.stream_list().
+
+        :raises: VsesvitAIError or one of its subclasses on API errors
+        """
+        return self._route_call('GET', endpoint, lambda client: client.stream_list(
+            endpoint, params=params, headers=headers, timeout=timeout, model=model, chunk_size=chunk_size
+        ))
+
+    def _route_call(self, method: str, endpoint: str, send: Callable[[VsesvitAI], Any]) -> Any:
+        route = _Route(self, method, endpoint)
+        while True:
+            member, wait = route.next()
+            if member is None:
+                if not wait:
+                    raise route.error
+                time.sleep(wait)
+                continue
+            self._count(member)
+            try:
+                result = send(self._client(member))
+            except VsesvitAIError as error:
+                if not route.failed(member, error):
+                    raise
+                continue
+            route.succeeded(member, result)
+            return result
+
+    def _client(self, member: _Member) -> VsesvitAI:
+        # Keys share the transport (and its connection pool), the codec, the endpoint router,
+        # the circuit breakers, the hedger, the concurrency limit, the scheduler and the validator of the pool
+        if member.client is None:
+            member.client = VsesvitAI(api_key=member.api_key, base_url=self.base_url, debug=self.debug,
+                                      transport=self.transport, json_codec=self.codec, models=self.models)
+            member.client.router = self.router
+            member.client.breakers = self.breakers
+            member.client.hedger = self.hedger
+            member.client.concurrency = self.concurrency
+            member.client.scheduler = self.scheduler
+            member.client.validator = self.validator
+        return member.client
+
+    def _rotation(self) -> List[_Member]:
+        with self._lock:
+            start = self._next
+            self._next = (start + 1) % len(self._members)
+        return self._members[start:] + self._members[:start]
+
+    def _owner(self, resource: Tuple[str, str]) -> Optional[_Member]:
+        member = self._owners.get(resource)
+        if member is not None and member.disabled:
+            # Find the resource with the remaining keys
+            self._owners.pop(resource, None)
+            return None
+        return member
+
+    def _remember(self, resource: Tuple[str, str], member: _Member) -> None:
+        with self._lock:
+            self._owners.pop(resource, None)
+            self._owners[resource] = member
+            while len(self._owners) > self.max_owners:
+                del self._owners[next(iter(self._owners))]
+
+    def _count(self, member: _Member) -> None:
+        with self._lock:
+            member.requests += 1
+
+    def _cool_down(self, member: _Member, retry_after: Optional[int]) -> None:
+        with self._lock:
+            member.rate_limited += 1
+            member.cooldown_until = time.monotonic() + (retry_after if retry_after is not None else self.cooldown)
+
+    def _disable(self, member: _Member) -> None:
+        with self._lock:
+            member.disabled = True
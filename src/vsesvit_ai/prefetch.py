@@ -0,0 +1,158 @@
+"""
+Background prefetch of detail records after list calls.
+
+A list page is usually followed by get_by_id calls for its first items. When
+a client has a Prefetcher, every list response of a resource collection
+starts background requests for the details of its first items. A following
+get_by_id for one of them returns the prefetched response, or waits for the
+request already in flight instead of sending another one.
+
+Prefetch requests run on a few worker threads of their own with the 'batch'
+priority, so they don't delay interactive calls under a scheduler. Prefetches
+that aren't used within their TTL, or that belong to a previous page of the
+same collection, are dropped; those that haven't started yet are cancelled.
+A write request (archive, unarchive, ...) drops the prefetch of its record.
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from src.vsesvit_ai.executor import submit_in_context
+from src.vsesvit_ai.forking import ProcessLocal
+
+# Collections whose list responses are followed by prefetches
+DEFAULT_RESOURCES = ('articles', 'projects', 'landings', 'smart-tables', 'knowledge-bases', 'authors', 'audiences')
+
+
+class Prefetcher(ProcessLocal):
+    """Fetches the details of the first items of list responses in the background."""
+
+    _local = ('_entries', '_executor', '_lock')
+
+    def __init__(self, top: int = 3, max_concurrency: int = 2, ttl: float = 30.0,
+                 resources: Iterable[str] = DEFAULT_RESOURCES):
+        """
+        :param top: Number of items of every list response whose details are prefetched
+        :param max_concurrency: Maximum number of prefetch requests in flight
+        :param ttl: Seconds a prefetched response is kept for a get_by_id call
+        :param resources: Resource collections whose list responses start prefetches
+        """
+        self.top = top
+        self.max_concurrency = max_concurrency
+        self.ttl = ttl
+        self.resources = frozenset(resources)
+        self.prefetched = 0
+        self.used = 0
+        self.dropped = 0
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._entries: Dict[str, Tuple[str, float, Future]] = {}
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                    thread_name_prefix='vsesvit-prefetch')
+            return self._executor
+
+    def take(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """
+        Return the prefetched response of a detail request.
+
+        Waits for the prefetch request if it's still in flight.
+
+        :param endpoint: API endpoint of the request (e.g. 'articles/42')
+        :param params: Query string parameters; requests with parameters aren't prefetched
+        :return: Response, None if it wasn't prefetched or the prefetch failed
+        """
+        if params:
+            return None
+        key = endpoint.strip('/')
+        with self._lock:
+            self._expire()
+            entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        future = entry[2]
+        if future.cancelled() or future.exception() is not None:
+            # The request is sent again and reports its own error
+            return None
+        with self._lock:
+            self.used += 1
+        return future.result()
+
+    def schedule(self, endpoint: str, response: Any, fetch: Callable[[str], Any]) -> None:
+        """
+        Start prefetching the details of the first items of a list response.
+
+        :param endpoint: API endpoint of the list request (e.g. 'articles')
+        :param response: Decoded list response
+        :param fetch: Function sending a detail request for an endpoint
+        """
+        resource = endpoint.strip('/')
+        if resource not in self.resources or not isinstance(response, dict):
+            return
+        items = response.get('data')
+        if not isinstance(items, list):
+            return
+        ids = [item['id'] for item in items[:self.top] if isinstance(item, dict) and 'id' in item]
+        executor = self.executor
+        with self._lock:
+            self._expire()
+            # A new page of a collection replaces the unused prefetches of the previous one
+            for key, entry in list(self._entries.items()):
+                if entry[0] == resource:
+                    self._drop(key)
+            now = time.monotonic()
+            for record_id in ids:
+                key = f'{resource}/{record_id}'
+                future = submit_in_context(executor, fetch, key)
+                self._entries[key] = (resource, now, future)
+                self.prefetched += 1
+
+    def invalidate(self, endpoint: str) -> None:
+        """
+        Drop the prefetched response of the record a write request changes.
+
+        :param endpoint: API endpoint of the write request (e.g. 'articles/42/archive')
+        """
+        key = '/'.join(endpoint.strip('/').split('/', 2)[:2])
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of prefetched, used and dropped responses, and those waiting to be used."""
+        with self._lock:
+            return {
+                'prefetched': self.prefetched,
+                'used': self.used,
+                'dropped': self.dropped,
+                'pending': len(self._entries),
+            }
+
+    def close(self) -> None:
+        """Cancel the prefetches that haven't started and stop the worker threads."""
+        with self._lock:
+            for key in list(self._entries):
+                self._drop(key)
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _expire(self) -> None:
+        deadline = time.monotonic() - self.ttl
+        for key, entry in list(self._entries.items()):
+            if entry[1] < deadline:
+                self._drop(key)
+
+    def _drop(self, key: str) -> None:
+        # Requests already in flight complete in the background, their responses are discarded
+        _, _, future = self._entries.pop(key)
+        future.cancel()
+        self.dropped += 1
@@ -0,0 +1,181 @@
+"""
+Latency-aware routing across several API base URLs.
+
+EndpointRouter keeps a moving average of the latency and error rate of every
+base URL (regions or mirrors of the API) and sends requests to the fastest
+healthy one. A request that fails with NetworkError or ServerError is retried
+on the next endpoint. Requests that aren't idempotent are only retried if the
+connection couldn't be established, so the server never saw them; an endpoint that fails several times in a row is taken
+out of rotation for a cool-down, after which a single request probes it again.
+"""
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.vsesvit_ai.base.exceptions import NetworkError, ServerError, VsesvitAIError
+from src.vsesvit_ai.forking import ProcessLocal
+
+
+class Endpoint:
+    """Base URL with its latency and health statistics."""
+
+    __slots__ = ('url', 'latency', 'error_rate', 'requests', 'failures', 'consecutive_failures',
+                 'open_until', 'last_used')
+
+    def __init__(self, url: str):
+        self.url = url
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.last_used = 0.0
+
+    @property
+    def score(self) -> float:
+        """Expected seconds per successful request, lower is better."""
+        if self.latency is None:
+            # Endpoints without a measurement are tried first, unless they only failed so far
+            return float('inf') if self.failures else 0.0
+        return self.latency / (1.0 - min(self.error_rate, 0.9))
+
+
+class EndpointRouter(ProcessLocal):
+    """Chooses the base URL of every request and fails over between them."""
+
+    _local = ('_lock',)
+
+    def __init__(self, urls: List[str], cooldown: float = 30.0, max_failures: int = 2,
+                 smoothing: float = 0.2, probe_every: int = 50):
+        """
+        :param urls: Base URLs of the API
+        :param cooldown: Seconds an endpoint is out of rotation after max_failures failures in a row
+        :param max_failures: Number of failures in a row that take an endpoint out of rotation
+        :param smoothing: Weight of the latest request in the latency and error rate averages
+        :param probe_every: Every n-th request goes to the least recently used healthy endpoint,
+            so the latency of the others stays up to date
+        """
+        if not urls:
+            raise ValueError("at least one base URL is required")
+        self.endpoints = [Endpoint(url) for url in urls]
+        self.cooldown = cooldown
+        self.max_failures = max_failures
+        self.smoothing = smoothing
+        self.probe_every = probe_every
+        self._calls = 0
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._lock = threading.Lock()
+
+    def select(self) -> List[Endpoint]:
+        """
+        Return the endpoints in the order they should be tried.
+
+        Healthy endpoints come first, fastest first; endpoints in cool-down are
+        only used when every other endpoint failed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._calls += 1
+            probe = self.probe_every and self._calls % self.probe_every == 0
+        healthy = sorted((e for e in self.endpoints if e.open_until <= now), key=lambda e: e.score)
+        if probe and len(healthy) > 1:
+            oldest = min(healthy, key=lambda e: e.last_used)
+            healthy.remove(oldest)
+            healthy.insert(0, oldest)
+        cooling = sorted((e for e in self.endpoints if e.open_until > now), key=lambda e: e.open_until)
+        return healthy + cooling
+
+    def record_success(self, endpoint: Endpoint, elapsed: float) -> None:
+        with self._lock:
+            endpoint.requests += 1
+            endpoint.last_used = time.monotonic()
+            endpoint.consecutive_failures = 0
+            endpoint.open_until = 0.0
+            endpoint.error_rate *= 1.0 - self.smoothing
+            if endpoint.latency is None:
+                endpoint.latency = elapsed
+            else:
+                endpoint.latency += self.smoothing * (elapsed - endpoint.latency)
+
+    def record_failure(self, endpoint: Endpoint) -> None:
+        with self._lock:
+            endpoint.requests += 1
+            endpoint.failures += 1
+            endpoint.last_used = time.monotonic()
+            endpoint.consecutive_failures += 1
+            endpoint.error_rate += self.smoothing * (1.0 - endpoint.error_rate)
+            if endpoint.consecutive_failures >= self.max_failures:
+                endpoint.open_until = endpoint.last_used + self.cooldown
+
+    def call(self, send: Callable[[str], Any], idempotent: bool = True) -> Any:
+        """
+        Send a request to the best endpoint, failing over to the others.
+
+        :param send: Function sending the request to a base URL and returning the processed response
+        :param idempotent: Whether the request may be repeated after it reached the server; requests
+            that aren't are only failed over on a NetworkError raised while connecting
+        :return: Result of send
+        :raises: The error of the last endpoint if every endpoint failed
+        """
+        error = None
+        for endpoint in self.select():
+            start = time.perf_counter()
+            try:
+                result = send(endpoint.url)
+            except VsesvitAIError as exc:
+                if not self._failed(endpoint, exc, time.perf_counter() - start, idempotent):
+                    raise
+                error = exc
+                continue
+            self.record_success(endpoint, time.perf_counter() - start)
+            return result
+        raise error
+
+    async def call_async(self, send: Callable[[str], Awaitable[Any]], idempotent: bool = True) -> Any:
+        """Coroutine version of call()."""
+        error = None
+        for endpoint in self.select():
+            start = time.perf_counter()
+            try:
+                result = await send(endpoint.url)
+            except VsesvitAIError as exc:
+                if not self._failed(endpoint, exc, time.perf_counter() - start, idempotent):
+                    raise
+                error = exc
+                continue
+            self.record_success(endpoint, time.perf_counter() - start)
+            return result
+        raise error
+
+    def _failed(self, endpoint: Endpoint, error: VsesvitAIError, elapsed: float, idempotent: bool) -> bool:
+        """Record the outcome of a failed request, return True if it should go to the next endpoint."""
+        if isinstance(error, NetworkError):
+            self.record_failure(endpoint)
+            # A read timeout or a dropped connection may come after the server received the request
+            return idempotent or error.connect
+        if isinstance(error, ServerError):
+            self.record_failure(endpoint)
+            return idempotent
+        # Client errors are answered by a healthy endpoint
+        self.record_success(endpoint, elapsed)
+        return False
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Return the statistics of every endpoint.
+
+        :return: List of dictionaries with the URL, average latency in seconds, error rate,
+            number of requests and failures and the remaining cool-down in seconds
+        """
+        now = time.monotonic()
+        return [{
+            'url': endpoint.url,
+            'latency': endpoint.latency,
+            'error_rate': round(endpoint.error_rate, 4),
+            'requests': endpoint.requests,
+            'failures': endpoint.failures,
+            'cooldown': round(max(0.0, endpoint.open_until - now), 3),
+        } for endpoint in self.endpoints]
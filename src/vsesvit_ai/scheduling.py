@@ -0,0 +1,228 @@
+"""
+Priority scheduling of requests that share a client.
+
+Scheduler admits requests under a concurrency cap and an optional rate limit.
+When capacity frees up, waiting requests are served by priority class first
+and in arrival order within a class, so interactive calls don't queue behind
+bulk jobs. Quotas cap the share of the capacity a class may hold, which keeps
+room for other classes even while one of them has a deep backlog.
+
+The priority of a request is passed to VsesvitAI.request() or set for a block
+of code with client.priority('batch'); it is carried into submit() and
+batch() worker threads.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from src.vsesvit_ai.base.exceptions import NetworkError, RateLimitError, ServerError
+from src.vsesvit_ai.concurrency import AIMDController, TokenBucket
+from src.vsesvit_ai.forking import ProcessLocal
+
+# Priority classes, lower values are served first
+PRIORITIES = {
+    'interactive': 0,
+    'default': 1,
+    'batch': 2,
+}
+
+_current = contextvars.ContextVar('vsesvit_priority', default='default')
+
+
+@contextmanager
+def priority(name: str) -> Iterator[None]:
+    """
+    Set the priority class of the requests made in a block of code.
+
+    :param name: Priority class (e.g. 'interactive' or 'batch')
+    """
+    if name not in PRIORITIES:
+        raise ValueError(f"priority must be one of: {', '.join(PRIORITIES)}")
+    token = _current.set(name)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def current_priority() -> str:
+    """Return the priority class set for the current thread or task."""
+    return _current.get()
+
+
+class _Waiter:
+    __slots__ = ('priority', 'rank', 'seq')
+
+    def __init__(self, priority: str, seq: int):
+        self.priority = priority
+        self.rank = PRIORITIES[priority]
+        self.seq = seq
+
+
+class Scheduler(ProcessLocal):
+    """Admits requests by priority under shared concurrency and rate limits."""
+
+    _local = ('_waiters', '_condition')
+
+    def __init__(self, max_concurrency: Union[int, AIMDController] = 8,
+                 rate_limit: Optional[Union[float, TokenBucket]] = None,
+                 burst: Optional[int] = None, quotas: Optional[Dict[str, float]] = None,
+                 timeout: Optional[float] = None):
+        """
+        :param max_concurrency: Maximum number of requests in flight, or an AIMDController whose
+            adaptive limit is used
+        :param rate_limit: Maximum number of requests started per second, or a TokenBucket (e.g. a
+            SharedTokenBucket to share the rate between processes); unlimited if not set
+        :param burst: Number of requests that may start at once under the rate limit
+        :param quotas: Maximum share of the concurrency a priority class may hold, e.g. {'batch': 0.7};
+            a class always gets at least one slot
+        :param timeout: Maximum seconds a request waits to be admitted, unlimited if not set
+        :raises: ValueError if a quota names an unknown priority class
+        """
+        unknown = set(quotas or {}) - set(PRIORITIES)
+        if unknown:
+            raise ValueError(f"unknown priority classes: {', '.join(sorted(unknown))}")
+        self.controller = max_concurrency if isinstance(max_concurrency, AIMDController) else None
+        self.max_concurrency = None if self.controller else max_concurrency
+        self.bucket = None
+        if isinstance(rate_limit, TokenBucket):
+            self.bucket = rate_limit
+        elif rate_limit:
+            self.bucket = TokenBucket(rate_limit, burst)
+        self.quotas = dict(quotas or {})
+        self.timeout = timeout
+        self.served = {name: 0 for name in PRIORITIES}
+        self._seq = 0
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self.in_flight = 0
+        self.active = {name: 0 for name in PRIORITIES}
+        self._waiters: List[_Waiter] = []
+        self._condition = threading.Condition()
+
+    @property
+    def capacity(self) -> int:
+        """Current number of requests allowed in flight."""
+        if self.controller is not None:
+            return int(self.controller.limit)
+        return self.max_concurrency
+
+    def _class_limit(self, name: str) -> int:
+        quota = self.quotas.get(name)
+        if quota is None:
+            return self.capacity
+        return max(1, int(self.capacity * quota))
+
+    def _next(self) -> Optional[_Waiter]:
+        # Highest priority waiter whose class is below its quota; classes at their quota
+        # don't block the others
+        best = None
+        for waiter in self._waiters:
+            if self.active[waiter.priority] >= self._class_limit(waiter.priority):
+                continue
+            if best is None or (waiter.rank, waiter.seq) < (best.rank, best.seq):
+                best = waiter
+        return best
+
+    def acquire(self, priority: str = 'default') -> None:
+        """
+        Wait until a request of a priority class may be sent.
+
+        :param priority: Priority class of the request
+        :raises: TimeoutError if the request wasn't admitted within timeout
+        """
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+        with self._condition:
+            self._seq += 1
+            waiter = _Waiter(priority, self._seq)
+            self._waiters.append(waiter)
+            try:
+                while True:
+                    wait = None
+                    if self.in_flight < self.capacity and self._next() is waiter:
+                        wait = self.bucket.try_acquire() if self.bucket is not None else 0.0
+                        if not wait:
+                            break
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise TimeoutError("request was not admitted in time")
+                        wait = min(wait, remaining) if wait else remaining
+                    self._condition.wait(wait)
+            finally:
+                self._waiters.remove(waiter)
+                # The next waiter may be admitted now
+                self._condition.notify_all()
+            self.in_flight += 1
+            self.active[priority] += 1
+            self.served[priority] += 1
+
+    def release(self, priority: str = 'default') -> None:
+        """Free the slot of a completed request."""
+        with self._condition:
+            self.in_flight -= 1
+            self.active[priority] -= 1
+            self._condition.notify_all()
+
+    def hold(self, priority: Optional[str] = None) -> Callable[[Optional[float], bool], None]:
+        """
+        Wait until a request is admitted and return the function freeing its slot.
+
+        Used for requests whose slot is held after send returned, e.g. while a
+        streamed response is read.
+
+        :param priority: Priority class, defaults to the class set with priority()
+        :return: Function called with the latency (None if the request failed) and whether
+            the request failed in a way that signals overload
+        """
+        priority = priority or current_priority()
+        if priority not in PRIORITIES:
+            raise ValueError(f"priority must be one of: {', '.join(PRIORITIES)}")
+        self.acquire(priority)
+
+        def done(latency: Optional[float], congested: bool) -> None:
+            self.release(priority)
+            if self.controller is not None:
+                self.controller.adjust(latency, congested)
+                with self._condition:
+                    self._condition.notify_all()
+
+        return done
+
+    def call(self, send: Callable[[], Any], priority: Optional[str] = None) -> Any:
+        """
+        Send a request once it's admitted.
+
+        :param send: Function sending the request
+        :param priority: Priority class, defaults to the class set with priority()
+        :return: Result of send
+        """
+        done = self.hold(priority)
+        start = time.perf_counter()
+        latency, congested = None, False
+        try:
+            result = send()
+            latency = time.perf_counter() - start
+            return result
+        except (RateLimitError, ServerError, NetworkError):
+            congested = True
+            raise
+        finally:
+            done(latency, congested)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the capacity, requests in flight, and waiting, active and served requests per class."""
+        with self._condition:
+            waiting = {name: 0 for name in PRIORITIES}
+            for waiter in self._waiters:
+                waiting[waiter.priority] += 1
+            return {
+                'capacity': self.capacity,
+                'in_flight': self.in_flight,
+                'waiting': waiting,
+                'active': dict(self.active),
+                'served': dict(self.served),
+            }
@@ -0,0 +1,208 @@
+"""
+Local full-text search over article content.
+
+ContentIndex fetches articles through the SDK, converts their HTML content to
+plain text and stores it in a SQLite FTS5 index. update() only fetches the
+articles whose updatedAt changed since the previous update, and drops the
+articles archived since unless archived articles are indexed as well;
+search() runs locally and returns article IDs with highlighted snippets.
+"""
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+
+from src.vsesvit_ai.executor import submit_in_context
+from src.vsesvit_ai.mirror import scan_changes
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    project_id INTEGER,
+    language TEXT,
+    updated_at TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(name, body, tokenize = 'unicode61 remove_diacritics 2');
+CREATE TABLE IF NOT EXISTS index_state (
+    scope TEXT PRIMARY KEY,
+    watermark TEXT,
+    updated REAL
+);
+'''
+
+# Elements whose text is not part of the article
+_SKIPPED_TAGS = ('script', 'style', 'template')
+
+# Elements that separate blocks of text
+_BLOCK_TAGS = ('p', 'div', 'br', 'li', 'tr', 'td', 'th', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'section')
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIPPED_TAGS:
+            self._skipping += 1
+        elif tag in _BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TAGS and self._skipping:
+            self._skipping -= 1
+        elif tag in _BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_data(self, data):
+        if not self._skipping:
+            self.parts.append(data)
+
+
+def html_to_text(html: str) -> str:
+    """
+    Convert HTML to plain text for indexing.
+
+    :param html: HTML markup
+    :return: Text with one line per block element
+    """
+    extractor = _TextExtractor()
+    extractor.feed(html or '')
+    extractor.close()
+    lines = (' '.join(line.split()) for line in ''.join(extractor.parts).splitlines())
+    return '\n'.join(line for line in lines if line)
+
+
+class ContentIndex:
+    """SQLite FTS5 index over the text of article content."""
+
+    def __init__(self, path: str = 'vsesvit_search.db'):
+        """
+        Open or create a search index
+
+        :param path: Path of the SQLite database file, ':memory:' for an in-memory index
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(_SCHEMA)
+        self.stats: Dict[str, int] = {}
+
+    def update(self, client, include_archived: bool = False, page_size: int = 100,
+               max_workers: int = 4) -> Dict[str, int]:
+        """
+        Index articles changed since the previous update.
+
+        Changed articles are found through get_list sorted by updatedAt, their
+        content is fetched with get_by_id using parallel requests. Archived
+        articles are listed as well; unless they are indexed, those archived
+        since the previous update are removed from the index.
+
+        :param client: VsesvitAI client instance
+        :param include_archived: Also index archived articles
+        :param page_size: Number of articles requested per list page
+        :param max_workers: Number of concurrent get_by_id requests
+        :return: Dictionary with the number of indexed and removed articles and requests
+        :raises: VsesvitAIError or one of its subclasses on API errors
+        """
+        self.stats = {'articles': 0, 'removed': 0, 'requests': 0}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='vsesvit-index') as executor:
+            def store(items: List[Dict[str, Any]]) -> None:
+                futures = [submit_in_context(executor, client.request, 'GET', f"articles/{item['id']}")
+                           for item in items]
+                self._store([future.result()['data'] for future in futures])
+                self.stats['requests'] += len(items)
+
+            def remove(items: List[Dict[str, Any]]) -> None:
+                self.stats['removed'] += self._remove([item['id'] for item in items])
+
+            for archived in (False, True):
+                indexed = include_archived or not archived
+                scope = f'articles:archived={int(archived)}'
+                if not indexed:
+                    # Archived articles are only removed, with a watermark of their own; once
+                    # removed, they must be listed in full when they're indexed again
+                    self.connection.execute('DELETE FROM index_state WHERE scope = ?', (scope,))
+                    scope += ':removed'
+                row = self.connection.execute('SELECT watermark FROM index_state WHERE scope = ?',
+                                              (scope,)).fetchone()
+                watermark, articles, requests = scan_changes(
+                    client, 'articles', row['watermark'] if row else None, self._stored,
+                    store if indexed else remove, page_size=page_size, params={'archived': archived}
+                )
+                with self.connection:
+                    self.connection.execute(
+                        'INSERT OR REPLACE INTO index_state (scope, watermark, updated) VALUES (?, ?, ?)',
+                        (scope, watermark, time.time())
+                    )
+                if indexed:
+                    self.stats['articles'] += articles
+                self.stats['requests'] += requests
+        return self.stats
+
+    def _stored(self, ids: List[int]) -> Dict[int, str]:
+        placeholders = ','.join('?' * len(ids))
+        return dict(self.connection.execute(f'SELECT id, updated_at FROM articles WHERE id IN ({placeholders})',
+                                            ids).fetchall())
+
+    def _remove(self, ids: List[int]) -> int:
+        placeholders = ','.join('?' * len(ids))
+        with self.connection:
+            self.connection.execute(f'DELETE FROM articles_fts WHERE rowid IN ({placeholders})', ids)
+            return self.connection.execute(f'DELETE FROM articles WHERE id IN ({placeholders})', ids).rowcount
+
+    def _store(self, articles: List[Dict[str, Any]]) -> None:
+        rows = [(article, html_to_text(article.get('content') or '')) for article in articles]
+        with self.connection:
+            for article, text in rows:
+                self.connection.execute('DELETE FROM articles_fts WHERE rowid = ?', (article['id'],))
+                self.connection.execute('INSERT INTO articles_fts (rowid, name, body) VALUES (?, ?, ?)',
+                                        (article['id'], article.get('name') or '', text))
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO articles (id, project_id, language, updated_at) VALUES (?, ?, ?, ?)',
+                    (article['id'], article.get('projectId'), article.get('language'), article.get('updatedAt'))
+                )
+
+    def search(self, query: str, limit: int = 20, project_id: Optional[int] = None,
+               language: Optional[str] = None, snippet_tokens: int = 12) -> List[Dict[str, Any]]:
+        """
+        Search indexed articles, best matches first.
+
+        :param query: FTS5 query, e.g. 'python sdk', '"error handling"' or 'seo NOT ads'
+        :param limit: Maximum number of results
+        :param project_id: Only articles of this project
+        :param language: Only articles in this language
+        :param snippet_tokens: Approximate number of words in a snippet
+        :return: List of dictionaries with id, name, snippet and rank
+        """
+        sql = '''
+            SELECT articles_fts.rowid AS id, articles_fts.name AS name, bm25(articles_fts) AS rank,
+                   snippet(articles_fts, 1, '[', ']', '...', ?) AS snippet
+            FROM articles_fts JOIN articles ON articles.id = articles_fts.rowid
+            WHERE articles_fts MATCH ?
+        '''
+        args: List[Any] = [snippet_tokens, query]
+        if project_id is not None:
+            sql += ' AND articles.project_id = ?'
+            args.append(project_id)
+        if language is not None:
+            sql += ' AND articles.language = ?'
+            args.append(language)
+        sql += ' ORDER BY rank LIMIT ?'
+        args.append(limit)
+        return [dict(row) for row in self.connection.execute(sql, args)]
+
+    def count(self) -> int:
+        """Return the number of indexed articles."""
+        return self.connection.execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> 'ContentIndex':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
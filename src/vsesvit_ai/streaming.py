@@ -0,0 +1,187 @@
+"""
+Incremental parsing of list responses.
+
+A list response such as {"success": true, "data": [...], "meta": {...}} is
+parsed while its body is downloaded: items of the data array are yielded as
+soon as they are complete, the other top-level fields (meta, success) are
+collected and become available once the whole body is parsed. Memory use is
+bounded by the size of a single item instead of the whole page.
+"""
+import codecs
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from src.vsesvit_ai.base.exceptions import NetworkError, VsesvitAIError
+
+_WHITESPACE = ' \t\n\r'
+
+# Consumed text is dropped from the buffer once it exceeds this many characters
+_COMPACT_AT = 1 << 16
+
+
+class _Reader:
+    """Text buffer over a stream of UTF-8 chunks, decoding JSON values as they complete."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._scan = json.JSONDecoder().raw_decode
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> None:
+        """Append the next chunk of the body to the buffer."""
+        text = ''
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                break
+        else:
+            text = self._decoder.decode(b'', final=True)
+            self.eof = True
+
+        if self.pos >= _COMPACT_AT:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        self.buffer += text
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or '' at the end of the body."""
+        while True:
+            buffer, pos = self.buffer, self.pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if self.eof:
+                return ''
+            self.fill()
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise VsesvitAIError(f"Malformed list response: expected one of {chars!r} at offset {self.pos}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more of the body as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._scan(self.buffer, self.pos)
+                # A value ending exactly at the buffer end may be a truncated number or literal
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise VsesvitAIError(f"Malformed list response: {e}")
+
+            # Grow the pending text geometrically so large items aren't re-scanned for every chunk
+            pending = len(self.buffer) - self.pos
+            self.fill()
+            while not self.eof and len(self.buffer) - self.pos < pending * 2:
+                self.fill()
+
+
+def iter_items(chunks: Iterable[bytes], fields: Dict[str, Any], key: str = 'data') -> Iterator[Any]:
+    """
+    Yield the items of a list response while its body is read.
+
+    :param chunks: Raw body chunks
+    :param fields: Dictionary that receives the other top-level fields of the response
+    :param key: Name of the top-level field with the items
+    :return: Iterator of decoded items
+    :raises: VsesvitAIError if the body is not a JSON object
+    """
+    reader = _Reader(chunks)
+    reader.expect('{')
+    if reader.peek() == '}':
+        reader.pos += 1
+        return
+
+    while True:
+        name = reader.value()
+        reader.expect(':')
+        if name == key and reader.peek() == '[':
+            reader.pos += 1
+            if reader.peek() == ']':
+                reader.pos += 1
+            else:
+                while True:
+                    yield reader.value()
+                    if reader.expect(',]') == ']':
+                        break
+        else:
+            fields[name] = reader.value()
+        if reader.expect(',}') == '}':
+            return
+
+
+class ListStream:
+    """
+    Items of a list response, parsed while the response is downloaded.
+
+    Iterate over the stream to get the items one by one. meta (and the other
+    top-level fields in fields) are available when the iteration finishes.
+    A stream can be iterated only once; close() releases the connection if
+    iteration is stopped early.
+    """
+
+    def __init__(self, response, item_factory: Optional[Callable[[Any], Any]] = None,
+                 on_close: Optional[Callable[[bool], None]] = None):
+        """
+        Initialize the stream
+
+        :param response: StreamResponse with a successful status
+        :param item_factory: Function applied to every decoded item, e.g. a model class
+        :param on_close: Function called once when the stream is closed, with whether reading
+            the response failed with a NetworkError
+        """
+        self.response = response
+        self.item_factory = item_factory
+        self.on_close = on_close
+        self.fields: Dict[str, Any] = {}
+        self.finished = False
+        self._started = False
+        self._failed = False
+
+    @property
+    def meta(self) -> Optional[Dict[str, Any]]:
+        """Pagination info, None until the whole response is parsed."""
+        return self.fields.get('meta') if self.finished else None
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._started:
+            raise VsesvitAIError("A list stream can only be iterated once")
+        self._started = True
+        return self._iterate()
+
+    def _iterate(self) -> Iterator[Any]:
+        factory = self.item_factory
+        try:
+            for item in iter_items(self.response.iter_chunks(), self.fields):
+                yield item if factory is None else factory(item)
+            self.finished = True
+        except NetworkError:
+            self._failed = True
+            raise
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Release the connection of the response."""
+        self.response.close()
+        on_close, self.on_close = self.on_close, None
+        if on_close is not None:
+            on_close(self._failed)
+
+    def __enter__(self) -> 'ListStream':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
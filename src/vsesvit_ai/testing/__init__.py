@@ -0,0 +1,13 @@
+"""
+Testing utilities for the VsesvitAI SDK.
+
+StubServer is a local, in-memory implementation of the Vsesvit AI API that can be
+used to test and benchmark code built on the SDK without network access.
+"""
+from src.vsesvit_ai.testing.server import StubServer
+from src.vsesvit_ai.testing.state import StubState
+
+__all__ = [
+    'StubServer',
+    'StubState'
+]
@@ -0,0 +1,386 @@
+"""
+Local stub of the Vsesvit AI HTTP API.
+
+The stub speaks real HTTP, so the full SDK transport (sessions, headers, error
+handling, binary downloads) is exercised without touching the network.
+"""
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional, Union, Tuple, Iterable
+from urllib.parse import urlsplit, parse_qsl
+
+from src.vsesvit_ai.testing.state import StubState, RESOURCES, SUMMARY_FIELDS
+
+API_PREFIX = '/api/v1'
+
+ARTICLE_FORMATS = ('pdf', 'docx')
+SMART_TABLE_FORMATS = ('xlsx', 'csv')
+
+_RESOURCE_PATTERN = '|'.join(re.escape(name) for name in RESOURCES)
+ROUTES = [
+    ('GET', re.compile(rf'^(?P<resource>{_RESOURCE_PATTERN})$'), 'list'),
+    ('POST', re.compile(rf'^(?P<resource>{_RESOURCE_PATTERN})/create$'), 'create'),
+    ('GET', re.compile(rf'^(?P<resource>{_RESOURCE_PATTERN})/(?P<id>\d+)$'), 'detail'),
+    ('PUT', re.compile(rf'^(?P<resource>{_RESOURCE_PATTERN})/(?P<id>\d+)/(?P<action>archive|unarchive)$'), 'archive'),
+    ('GET', re.compile(r'^(?P<resource>articles)/(?P<id>\d+)/download/(?P<format>\w+)$'), 'download'),
+    ('GET', re.compile(r'^(?P<resource>landings)/(?P<id>\d+)/download$'), 'download'),
+    ('GET', re.compile(r'^(?P<resource>smart-tables)/(?P<id>\d+)/download$'), 'download'),
+    ('POST', re.compile(r'^smart-tables/upload-file$'), 'upload'),
+    ('GET', re.compile(r'^user/me$'), 'me'),
+    ('GET', re.compile(r'^user/referrals$'), 'referrals'),
+]
+
+_CHUNK = bytes(range(256)) * 256
+
+
+class _Fault:
+    """A queued failure that is returned instead of the next matching responses."""
+
+    def __init__(self, status: int, times: int, endpoint: Optional[str], retry_after: Optional[int],
+                 api_key: Optional[str] = None):
+        self.status = status
+        self.times = times
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        self.api_key = api_key
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Request handler that dispatches API calls to the owning StubServer."""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'VsesvitAIStub/1.0'
+    # Headers and body are written separately, Nagle's algorithm would delay keep-alive responses
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.stub.handle(self)
+
+    def do_POST(self):
+        self.server.stub.handle(self)
+
+    def do_PUT(self):
+        self.server.stub.handle(self)
+
+    def do_DELETE(self):
+        self.server.stub.handle(self)
+
+
+class StubServer:
+    """
+    Stub Vsesvit AI API server running in a background thread.
+
+    Example:
+        with StubServer(latency=0.01) as server:
+            server.state.seed(articles=500)
+            client = VsesvitAI(api_key=server.api_key, base_url=server.base_url)
+            client.article.get_list(params={'limit': 100})
+    """
+
+    api_key = 'vsa_stub_key_0123456789abcdefg'
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0,
+                 latency: Union[float, Tuple[float, float]] = 0.0,
+                 error_rate: float = 0.0, rate_limit_rate: float = 0.0, retry_after: int = 1,
+                 job_duration: float = 0.0, download_size: int = 1024 * 1024,
+                 content_size: int = 20000, api_keys: Optional[Iterable[str]] = None,
+                 key_scoped: bool = False, seed: Optional[int] = None):
+        """
+        Initialize the stub server
+
+        :param host: Interface to bind to
+        :param port: Port to bind to, 0 picks a free port
+        :param latency: Delay added to every response in seconds, or a (min, max) range
+        :param error_rate: Probability of answering any request with HTTP 503
+        :param rate_limit_rate: Probability of answering any request with HTTP 429
+        :param retry_after: Retry-After value sent with injected 429 responses
+        :param job_duration: Seconds a created resource takes to reach its final state
+        :param download_size: Size of every downloaded file in bytes
+        :param content_size: Approximate size of article HTML content in bytes
+        :param api_keys: API keys accepted by the server, any non-empty key if not set
+        :param key_scoped: Records created through the API are only accessible with the key that created them,
+            other keys get 401 like from the real API
+        :param seed: Seed for the fault injection random generator
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.download_size = download_size
+        self.api_keys = set(api_keys) if api_keys is not None else None
+        self.key_scoped = key_scoped
+        self.state = StubState(job_duration=job_duration, content_size=content_size)
+        self.request_count = 0
+        self.request_log = deque(maxlen=10000)
+        self._faults = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """Base API URL to pass to the VsesvitAI client."""
+        return f'http://{self.host}:{self.port}{API_PREFIX}'
+
+    def start(self) -> 'StubServer':
+        """
+        Start serving in a background daemon thread.
+
+        :return: The server itself
+        """
+        self._httpd = ThreadingHTTPServer((self.host, self.port), StubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, kwargs={'poll_interval': 0.05},
+                                        name='vsesvit-ai-stub', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and release the port."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = None
+            self._thread = None
+
+    def __enter__(self) -> 'StubServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def fail_next(self, status: int, times: int = 1, endpoint: Optional[str] = None,
+                  retry_after: Optional[int] = None, api_key: Optional[str] = None) -> None:
+        """
+        Answer the next matching requests with an error status.
+
+        :param status: HTTP status code to return (e.g. 429, 500, 503)
+        :param times: Number of requests to fail
+        :param endpoint: Only fail requests whose endpoint starts with this prefix
+        :param retry_after: Retry-After header value for 429 responses
+        :param api_key: Only fail requests made with this API key
+        """
+        with self._lock:
+            self._faults.append(_Fault(status, times, endpoint, retry_after, api_key))
+
+    def reset_faults(self) -> None:
+        """Drop all queued failures."""
+        with self._lock:
+            self._faults.clear()
+
+    # Request processing
+
+    def handle(self, handler: StubHandler) -> None:
+        """
+        Process a single HTTP request.
+
+        :param handler: Handler of the current connection
+        """
+        split = urlsplit(handler.path)
+        length = int(handler.headers.get('Content-Length') or 0)
+        body = handler.rfile.read(length) if length else b''
+
+        with self._lock:
+            self.request_count += 1
+            self.request_log.append((handler.command, split.path))
+
+        self._sleep()
+
+        if not split.path.startswith(API_PREFIX + '/'):
+            return self._send_json(handler, 404, {'error': 'Not found'})
+        endpoint = split.path[len(API_PREFIX) + 1:]
+
+        api_key = handler.headers.get('X-API-KEY')
+        fault = self._take_fault(endpoint, api_key)
+        if fault is not None:
+            return self._send_json(handler, fault.status, {'error': 'Injected failure'},
+                                   retry_after=fault.retry_after)
+        if self.rate_limit_rate and self._random.random() < self.rate_limit_rate:
+            return self._send_json(handler, 429, {'error': 'Too many requests'}, retry_after=self.retry_after)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return self._send_json(handler, 503, {'error': 'Service unavailable'})
+
+        if not api_key or (self.api_keys is not None and api_key not in self.api_keys):
+            return self._send_json(handler, 401, {'error': 'Invalid API key'})
+        handler.api_key = api_key
+
+        for method, pattern, action in ROUTES:
+            match = pattern.match(endpoint)
+            if match and method == handler.command:
+                params = dict(parse_qsl(split.query))
+                try:
+                    return getattr(self, f'_handle_{action}')(handler, match.groupdict(), params, body)
+                except ValueError as e:
+                    return self._send_json(handler, 400, {'message': 'Validation failed', 'errors': {'params': str(e)}})
+
+        return self._send_json(handler, 404, {'error': 'Not found'})
+
+    def _sleep(self) -> None:
+        latency = self.latency
+        if isinstance(latency, (tuple, list)):
+            with self._lock:
+                latency = self._random.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+
+    def _take_fault(self, endpoint: str, api_key: Optional[str]) -> Optional[_Fault]:
+        with self._lock:
+            for fault in self._faults:
+                if (fault.endpoint is None or endpoint.startswith(fault.endpoint)) \
+                        and (fault.api_key is None or fault.api_key == api_key):
+                    fault.times -= 1
+                    if fault.times <= 0:
+                        self._faults.remove(fault)
+                    return fault
+        return None
+
+    def _send_json(self, handler: StubHandler, status: int, payload: Dict[str, Any],
+                   retry_after: Optional[int] = None) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(body)))
+        if retry_after is not None:
+            handler.send_header('Retry-After', str(retry_after))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _send_binary(self, handler: StubHandler, size: int) -> None:
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'application/octet-stream')
+        handler.send_header('Content-Length', str(size))
+        handler.end_headers()
+        remaining = size
+        while remaining > 0:
+            chunk = _CHUNK[:remaining]
+            handler.wfile.write(chunk)
+            remaining -= len(chunk)
+
+    def _not_found(self, handler: StubHandler, resource: str) -> None:
+        name = resource.rstrip('s').replace('-', ' ')
+        self._send_json(handler, 404, {'error': f'{name.capitalize()} not found'})
+
+    def _owner(self, handler: StubHandler) -> Optional[str]:
+        return handler.api_key if self.key_scoped else None
+
+    def _get_record(self, handler: StubHandler, resource: str, record_id: str,
+                    archived: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """Return a record, sending 404 or 401 (record of another key) and returning None on failure."""
+        if archived is None:
+            record = self.state.get(resource, int(record_id))
+        else:
+            record = self.state.get(resource, int(record_id))
+            if record is not None and record.get('_owner') in (None, self._owner(handler)):
+                record = self.state.set_archived(resource, int(record_id), archived)
+        if record is None:
+            self._not_found(handler, resource)
+            return None
+        if record.get('_owner') not in (None, self._owner(handler)):
+            self._send_json(handler, 401, {'error': 'Access denied'})
+            return None
+        return record
+
+    def _detail(self, resource: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        data = {key: value for key, value in record.items() if not key.startswith('_')}
+        if resource == 'articles' and record['state'] == RESOURCES['articles']['states'][-1]:
+            data['content'] = self.state.content(record)
+        return data
+
+    # Endpoint handlers
+
+    def _handle_list(self, handler, match, params, body):
+        records, meta = self.state.query(match['resource'], params, owner=self._owner(handler))
+        data = [{field: record.get(field) for field in SUMMARY_FIELDS} for record in records]
+        self._send_json(handler, 200, {'success': True, 'data': data, 'meta': meta})
+
+    def _handle_detail(self, handler, match, params, body):
+        record = self._get_record(handler, match['resource'], match['id'])
+        if record is not None:
+            self._send_json(handler, 200, {'success': True, 'data': self._detail(match['resource'], record)})
+
+    def _handle_create(self, handler, match, params, body):
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            return self._send_json(handler, 400, {'error': 'Malformed JSON body'})
+
+        resource = match['resource']
+        errors = {
+            field: f'{field} is required'
+            for field in RESOURCES[resource]['required']
+            if payload.get(field) in (None, '')
+        }
+        if 'projectId' in payload and payload['projectId'] is not None \
+                and self.state.get('projects', int(payload['projectId'])) is None:
+            errors['projectId'] = 'Project not found'
+        if errors:
+            return self._send_json(handler, 400, {'message': 'Validation failed', 'errors': errors})
+
+        record = self.state.create(resource, payload, owner=self._owner(handler))
+        self._send_json(handler, 200, {'success': True, 'data': self._detail(resource, record)})
+
+    def _handle_archive(self, handler, match, params, body):
+        record = self._get_record(handler, match['resource'], match['id'], archived=match['action'] == 'archive')
+        if record is not None:
+            self._send_json(handler, 200, {'success': True, 'data': self._detail(match['resource'], record)})
+
+    def _handle_download(self, handler, match, params, body):
+        resource = match['resource']
+        file_format = match.get('format') or params.get('format', 'xlsx')
+        if resource == 'articles' and file_format not in ARTICLE_FORMATS:
+            return self._send_json(handler, 400, {'errors': {
+                'format': f"Invalid format specified. Available formats: {', '.join(ARTICLE_FORMATS)}"}})
+        if resource == 'smart-tables' and file_format not in SMART_TABLE_FORMATS:
+            return self._send_json(handler, 400, {'errors': {
+                'format': f"Invalid format specified. Available formats: {', '.join(SMART_TABLE_FORMATS)}"}})
+
+        record = self._get_record(handler, resource, match['id'])
+        if record is None:
+            return
+        if record['state'] != RESOURCES[resource]['states'][-1]:
+            return self._send_json(handler, 400, {'error': f"Generation is not finished (state: {record['state']})"})
+        self._send_binary(handler, self.download_size)
+
+    def _handle_upload(self, handler, match, params, body):
+        content_type = handler.headers.get('Content-Type', '')
+        message = BytesParser(policy=default_policy).parsebytes(
+            b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body
+        )
+        if not message.is_multipart():
+            return self._send_json(handler, 400, {'errors': {'file': 'A multipart file upload is required'}})
+
+        for part in message.iter_parts():
+            if part.get_param('name', header='content-disposition') == 'file':
+                asset = self.state.add_asset(part.get_filename() or 'upload', part.get_payload(decode=True) or b'')
+                return self._send_json(handler, 200, {'success': True, 'data': asset})
+
+        self._send_json(handler, 400, {'errors': {'file': 'file is required'}})
+
+    def _handle_me(self, handler, match, params, body):
+        self._send_json(handler, 200, {'success': True, 'data': dict(self.state.user)})
+
+    def _handle_referrals(self, handler, match, params, body):
+        offset = max(0, int(params.get('offset', 0)))
+        limit = max(1, int(params.get('limit', 10)))
+        referrals = self.state.referrals
+        if params.get('search'):
+            needle = params['search'].lower()
+            referrals = [r for r in referrals if needle in r['name'].lower()]
+        meta = {'offset': offset, 'limit': limit, 'total': len(referrals)}
+        self._send_json(handler, 200, {'success': True, 'data': referrals[offset:offset + limit], 'meta': meta})
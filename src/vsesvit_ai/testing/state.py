@@ -0,0 +1,306 @@
+"""
+In-memory state used by the stub API server.
+
+Every resource collection behaves like the real API: records get sequential IDs,
+generation jobs move through their states over time and list endpoints support
+pagination, sorting and filtering.
+"""
+import random
+import threading
+import time
+from typing import Dict, Any, Optional, List, Tuple
+
+# Configuration of every resource collection served by the stub.
+# required - fields that must be present in the create payload
+# states - job states a record passes through after creation (None for static resources)
+RESOURCES = {
+    'projects': {
+        'required': ('name', 'description'),
+        'states': None,
+    },
+    'articles': {
+        'required': ('projectId', 'name', 'brief'),
+        'states': ('draft', 'in progress', 'content completed'),
+    },
+    'landings': {
+        'required': ('projectId', 'name', 'brief'),
+        'states': ('draft', 'in progress', 'completed'),
+    },
+    'smart-tables': {
+        'required': ('projectId', 'name', 'brief', 'inputAssetId'),
+        'states': ('draft', 'processing', 'completed'),
+    },
+    'knowledge-bases': {
+        'required': ('projectId', 'name', 'description'),
+        'states': ('pending', 'indexing', 'ready'),
+    },
+    'authors': {
+        'required': ('projectId', 'name', 'biography'),
+        'states': ('pending', 'training', 'ready'),
+    },
+    'audiences': {
+        'required': ('projectId', 'name'),
+        'states': ('pending', 'generating', 'ready'),
+    },
+}
+
+# Fields returned by list endpoints, everything else is detail-only
+SUMMARY_FIELDS = ('id', 'name', 'projectId', 'language', 'state', 'archived', 'createdAt', 'updatedAt')
+
+SORT_FIELDS = ('id', 'name', 'createdAt', 'updatedAt')
+
+LANGUAGES = ('en', 'de', 'fr', 'es', 'uk')
+
+WORDS = (
+    'content', 'marketing', 'search', 'engine', 'optimization', 'python', 'sdk', 'landing',
+    'conversion', 'audience', 'keyword', 'strategy', 'analytics', 'growth', 'product', 'brand',
+    'design', 'traffic', 'email', 'campaign', 'social', 'video', 'commerce', 'catalog',
+    'pricing', 'customer', 'journey', 'funnel', 'retention', 'automation', 'knowledge',
+    'writing', 'research', 'trend', 'guide', 'tutorial', 'review', 'comparison', 'checklist',
+)
+
+
+def format_timestamp(timestamp: float) -> str:
+    """
+    Format a UNIX timestamp the way the API does.
+
+    :param timestamp: UNIX timestamp
+    :return: Timestamp string in "YYYY-MM-DD HH:MM:SS" format
+    """
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(timestamp))
+
+
+def _is_true(value: str) -> bool:
+    return str(value).lower() in ('1', 'true', 'yes')
+
+
+class StubState:
+    """Thread-safe in-memory storage behind the stub API server."""
+
+    def __init__(self, job_duration: float = 0.0, content_size: int = 20000):
+        """
+        Initialize the stub state
+
+        :param job_duration: Seconds a generation job takes to go from the first to the last state
+        :param content_size: Approximate size of generated article HTML content in bytes
+        """
+        self.job_duration = job_duration
+        self.content_size = content_size
+        self.lock = threading.RLock()
+        self.records = {name: {} for name in RESOURCES}
+        self.assets = {}
+        self.referrals = []
+        self.user = {
+            'id': 1,
+            'email': 'stub@vsesvit.ai',
+            'fullName': 'Stub User',
+            'company': 'Vsesvit AI',
+            'balance': 1000.0,
+        }
+        self._next_id = 1000
+        rnd = random.Random(0)
+        self._paragraphs = [
+            '<p>' + ' '.join(rnd.choice(WORDS) for _ in range(60)) + '.</p>'
+            for _ in range(256)
+        ]
+
+    def _new_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    def _refresh(self, resource: str, record: Dict[str, Any]) -> None:
+        """Move a record to the job state matching the time elapsed since creation."""
+        states = RESOURCES[resource]['states']
+        if not states or record['state'] == states[-1]:
+            return
+
+        if self.job_duration <= 0:
+            stage = len(states) - 1
+        else:
+            elapsed = time.monotonic() - record['_started']
+            stage = min(len(states) - 1, int(elapsed / (self.job_duration / (len(states) - 1))))
+
+        if states[stage] != record['state']:
+            record['state'] = states[stage]
+            record['updatedAt'] = format_timestamp(time.time())
+
+    def content(self, record: Dict[str, Any]) -> str:
+        """
+        Generate deterministic HTML content for an article-like record.
+
+        Content is derived from the record ID so it never has to be stored.
+
+        :param record: Stored record
+        :return: HTML string of roughly content_size bytes
+        """
+        header = f"<h1>{record['name']}</h1>"
+        count = max(1, (self.content_size - len(header)) // len(self._paragraphs[0]) + 1)
+        start = record['id'] * 7
+        paragraphs = self._paragraphs
+        return header + ''.join(paragraphs[(start + i * 13) % len(paragraphs)] for i in range(count))
+
+    def create(self, resource: str, payload: Dict[str, Any], completed: bool = False,
+               owner: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Store a new record.
+
+        :param resource: Resource collection name (e.g. 'articles')
+        :param payload: Create payload as sent by the SDK
+        :param completed: Create the record in its final job state
+        :param owner: API key the record belongs to, None for records visible to every key
+        :return: Stored record
+        """
+        states = RESOURCES[resource]['states']
+        now = time.time()
+        with self.lock:
+            record = dict(payload)
+            record.update({
+                'id': self._new_id(),
+                'language': payload.get('language', 'en'),
+                'state': (states[-1] if completed else states[0]) if states else 'active',
+                'archived': False,
+                'createdAt': format_timestamp(now),
+                'updatedAt': format_timestamp(now),
+                '_started': float('-inf') if completed else time.monotonic(),
+                '_owner': owner,
+            })
+            self.records[resource][record['id']] = record
+            return record
+
+    def get(self, resource: str, record_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Return a record by ID with its job state brought up to date.
+
+        :param resource: Resource collection name
+        :param record_id: ID of the record
+        :return: Stored record or None if it doesn't exist
+        """
+        with self.lock:
+            record = self.records[resource].get(record_id)
+            if record is not None:
+                self._refresh(resource, record)
+            return record
+
+    def set_archived(self, resource: str, record_id: int, archived: bool) -> Optional[Dict[str, Any]]:
+        """
+        Archive or unarchive a record.
+
+        :param resource: Resource collection name
+        :param record_id: ID of the record
+        :param archived: New archived flag
+        :return: Updated record or None if it doesn't exist
+        """
+        with self.lock:
+            record = self.get(resource, record_id)
+            if record is not None and record['archived'] != archived:
+                record['archived'] = archived
+                record['updatedAt'] = format_timestamp(time.time())
+            return record
+
+    def query(self, resource: str, params: Dict[str, str],
+              owner: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Filter, sort and paginate a resource collection.
+
+        Supported parameters: page, limit, sort, direction, archived, projectId,
+        state, language and search (substring of the name).
+
+        :param resource: Resource collection name
+        :param params: Query string parameters
+        :param owner: API key of the request, records of other keys are skipped
+        :return: Tuple of (records on the page, pagination meta)
+        """
+        page = max(1, int(params.get('page', 1)))
+        limit = max(1, int(params.get('limit', 10)))
+        sort = params.get('sort', 'id')
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"sort must be one of: {', '.join(SORT_FIELDS)}")
+        reverse = params.get('direction', 'asc').lower() == 'desc'
+
+        with self.lock:
+            records = [r for r in self.records[resource].values() if r.get('_owner') in (None, owner)]
+            for record in records:
+                self._refresh(resource, record)
+
+            if 'archived' in params:
+                archived = _is_true(params['archived'])
+                records = [r for r in records if r['archived'] == archived]
+            if 'projectId' in params:
+                records = [r for r in records if str(r.get('projectId')) == str(params['projectId'])]
+            for field in ('state', 'language'):
+                if field in params:
+                    records = [r for r in records if r.get(field) == params[field]]
+            if params.get('search'):
+                needle = params['search'].lower()
+                records = [r for r in records if needle in str(r.get('name', '')).lower()]
+
+            records.sort(key=lambda r: (r[sort], r['id']), reverse=reverse)
+
+        total = len(records)
+        meta = {
+            'current_page': page,
+            'last_page': max(1, -(-total // limit)),
+            'per_page': limit,
+            'total': total,
+        }
+        return records[(page - 1) * limit:page * limit], meta
+
+    def add_asset(self, file_name: str, data: bytes) -> Dict[str, Any]:
+        """
+        Store an uploaded input asset.
+
+        :param file_name: Name of the uploaded file
+        :param data: File content
+        :return: Asset description as returned by the upload endpoint
+        """
+        with self.lock:
+            asset = {'id': self._new_id(), 'name': file_name, 'size': len(data)}
+            self.assets[asset['id']] = asset
+            return asset
+
+    def seed(self, projects: int = 1, articles: int = 0, landings: int = 0, smart_tables: int = 0,
+             knowledge_bases: int = 0, authors: int = 0, audiences: int = 0, referrals: int = 0) -> None:
+        """
+        Populate the state with completed records, e.g. for pagination and load tests.
+
+        Records other than projects are spread evenly across the seeded projects
+        and the stub languages.
+
+        :param projects: Number of projects to create
+        :param articles: Number of articles to create
+        :param landings: Number of landings to create
+        :param smart_tables: Number of smart tables to create
+        :param knowledge_bases: Number of knowledge bases to create
+        :param authors: Number of authors to create
+        :param audiences: Number of audiences to create
+        :param referrals: Number of referrals of the current user
+        """
+        project_ids = [
+            self.create('projects', {'name': f'Project {i}', 'description': 'Seeded project'}, completed=True)['id']
+            for i in range(1, projects + 1)
+        ] or [None]
+
+        counts = {
+            'articles': articles,
+            'landings': landings,
+            'smart-tables': smart_tables,
+            'knowledge-bases': knowledge_bases,
+            'authors': authors,
+            'audiences': audiences,
+        }
+        for resource, count in counts.items():
+            for i in range(count):
+                payload = {
+                    'projectId': project_ids[i % len(project_ids)],
+                    'name': f'{resource.rstrip("s").replace("-", " ").title()} {i + 1}',
+                    'language': LANGUAGES[i % len(LANGUAGES)],
+                }
+                self.create(resource, payload, completed=True)
+
+        with self.lock:
+            for i in range(referrals):
+                self.referrals.append({
+                    'id': self._new_id(),
+                    'name': f'Referral {len(self.referrals) + 1}',
+                    'createdAt': format_timestamp(time.time()),
+                })
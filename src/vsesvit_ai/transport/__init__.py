@@ -0,0 +1,33 @@
+"""
+HTTP transports used by the VsesvitAI client.
+
+- RequestsTransport: default, one-off requests.request call per API call
+- PooledTransport: keep-alive connection pool shared between threads
+- AsyncTransport: httpx-based transport with native asyncio support
+- FakeTransport: in-memory canned responses for unit tests
+- CassetteTransport: record real traffic and replay it offline
+
+Transports are imported on first access, so HTTP libraries are only loaded
+when they are actually used.
+"""
+import importlib
+
+_TRANSPORTS = {
+    'Transport': 'src.vsesvit_ai.transport.base',
+    'TransportResponse': 'src.vsesvit_ai.transport.base',
+    'StreamResponse': 'src.vsesvit_ai.transport.base',
+    'RequestsTransport': 'src.vsesvit_ai.transport.requests_transport',
+    'PooledTransport': 'src.vsesvit_ai.transport.requests_transport',
+    'AsyncTransport': 'src.vsesvit_ai.transport.async_transport',
+    'FakeTransport': 'src.vsesvit_ai.transport.fake',
+    'FakeRequest': 'src.vsesvit_ai.transport.fake',
+    'CassetteTransport': 'src.vsesvit_ai.transport.cassette',
+}
+
+__all__ = list(_TRANSPORTS)
+
+
+def __getattr__(name):
+    if name in _TRANSPORTS:
+        return getattr(importlib.import_module(_TRANSPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,102 @@
+import threading
+from typing import Optional, Dict, Any, Iterator
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+from src.vsesvit_ai.forking import ProcessLocal
+from src.vsesvit_ai.transport.base import Transport, StreamResponse, network_error
+
+
+class AsyncTransport(ProcessLocal, Transport):
+    """
+    Transport backed by httpx with native asyncio support.
+
+    Coroutines should use VsesvitAI.request_async, which awaits send_async on a
+    pooled httpx.AsyncClient. Synchronous calls go through a pooled httpx.Client.
+    Requires the optional httpx dependency (pip install httpx).
+    """
+
+    _local = ('_client', '_async_client', '_lock')
+
+    def __init__(self, max_connections: int = 100, max_keepalive_connections: int = 20, http2: bool = False):
+        """
+        Initialize the async transport
+
+        :param max_connections: Maximum number of concurrent connections
+        :param max_keepalive_connections: Maximum number of idle connections kept alive
+        :param http2: Use HTTP/2 when the server supports it (requires httpx[http2])
+        """
+        if httpx is None:
+            raise ImportError("AsyncTransport requires httpx, install it with: pip install httpx")
+        self.limits = httpx.Limits(max_connections=max_connections,
+                                   max_keepalive_connections=max_keepalive_connections)
+        self.http2 = http2
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._client = None
+        self._async_client = None
+        self._lock = threading.Lock()
+
+    def _get_client(self) -> 'httpx.Client':
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(limits=self.limits, http2=self.http2)
+        return self._client
+
+    def _get_async_client(self) -> 'httpx.AsyncClient':
+        # An AsyncClient is bound to the event loop it was first used in
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(limits=self.limits, http2=self.http2)
+        return self._async_client
+
+    def send(self, method: str, url: str, params: Dict[str, Any] = None, json: Any = None,
+             data: Optional[bytes] = None, headers: Dict[str, str] = None,
+             files: Dict[str, Any] = None, timeout: Optional[float] = None) -> 'httpx.Response':
+        try:
+            return self._get_client().request(method, url, params=params, json=json, content=data,
+                                              headers=headers, files=files, timeout=timeout)
+        except httpx.HTTPError as e:
+            raise network_error(e)
+
+    async def send_async(self, method: str, url: str, params: Dict[str, Any] = None, json: Any = None,
+                         data: Optional[bytes] = None, headers: Dict[str, str] = None,
+                         files: Dict[str, Any] = None, timeout: Optional[float] = None) -> 'httpx.Response':
+        try:
+            return await self._get_async_client().request(method, url, params=params, json=json, content=data,
+                                                          headers=headers, files=files, timeout=timeout)
+        except httpx.HTTPError as e:
+            raise network_error(e)
+
+    def stream(self, method: str, url: str, params: Dict[str, Any] = None, headers: Dict[str, str] = None,
+               timeout: Optional[float] = None, chunk_size: int = 65536) -> StreamResponse:
+        client = self._get_client()
+        try:
+            request = client.build_request(method, url, params=params, headers=headers, timeout=timeout)
+            response = client.send(request, stream=True)
+        except httpx.HTTPError as e:
+            raise network_error(e)
+
+        def chunks() -> Iterator[bytes]:
+            try:
+                yield from response.iter_bytes(chunk_size)
+            except httpx.HTTPError as e:
+                raise network_error(e)
+
+        return StreamResponse(response.status_code, chunks(), response.headers, response.close)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
@@ -0,0 +1,237 @@
+import socket
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple, Callable
+
+from src.vsesvit_ai.base.exceptions import NetworkError
+from src.vsesvit_ai.errors.error_massages import ERROR_NETWORK
+
+
+class Headers(dict):
+    """Dictionary of HTTP headers with case-insensitive lookups."""
+
+    def __init__(self, items: Optional[Iterable[Tuple[str, str]]] = None):
+        super().__init__()
+        for key, value in dict(items or {}).items():
+            self[key] = value
+
+    def __setitem__(self, key: str, value: str) -> None:
+        super().__setitem__(key.lower(), value)
+
+    def __getitem__(self, key: str) -> str:
+        return super().__getitem__(key.lower())
+
+    def __contains__(self, key) -> bool:
+        return super().__contains__(key.lower())
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        return super().get(key.lower(), default)
+
+
+class TransportResponse:
+    """
+    Minimal HTTP response returned by transports that don't wrap an HTTP library.
+
+    It exposes the subset of the requests.Response interface used by the SDK.
+    """
+
+    def __init__(self, status_code: int, content: bytes = b'', headers: Optional[Dict[str, str]] = None):
+        """
+        Initialize the response
+
+        :param status_code: HTTP status code
+        :param content: Raw response body
+        :param headers: Response headers
+        """
+        self.status_code = status_code
+        self.content = content
+        self.headers = Headers(headers)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        import json
+
+        return json.loads(self.content)
+
+
+class StreamResponse:
+    """
+    HTTP response whose body is read incrementally.
+
+    Returned by Transport.stream(). The body is consumed with iter_chunks();
+    close() releases the connection if the body was not read to the end.
+    """
+
+    def __init__(self, status_code: int, chunks: Iterable[bytes], headers: Optional[Dict[str, str]] = None,
+                 close: Optional[Callable[[], None]] = None):
+        """
+        Initialize the response
+
+        :param status_code: HTTP status code
+        :param chunks: Iterable of raw body chunks
+        :param headers: Response headers
+        :param close: Function that releases the underlying connection
+        """
+        self.status_code = status_code
+        self.headers = Headers(headers)
+        self._chunks = iter(chunks)
+        self._close = close
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Iterate over the remaining chunks of the body."""
+        return self._chunks
+
+    def read(self) -> TransportResponse:
+        """
+        Read the rest of the body and close the response.
+
+        :return: TransportResponse with the remaining body
+        """
+        try:
+            content = b''.join(self._chunks)
+        finally:
+            self.close()
+        return TransportResponse(self.status_code, content, self.headers)
+
+    def close(self) -> None:
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def __enter__(self) -> 'StreamResponse':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def split_chunks(content: bytes, chunk_size: int) -> Iterator[bytes]:
+    """
+    Split a body that is already in memory into chunks.
+
+    :param content: Raw response body
+    :param chunk_size: Size of the chunks in bytes
+    :return: Iterator of chunks
+    """
+    for start in range(0, len(content), chunk_size):
+        yield content[start:start + chunk_size]
+
+
+# Errors of the HTTP libraries raised before a connection is established, matched by name
+# so the libraries aren't imported: requests, urllib3 and httpx
+CONNECT_ERRORS = frozenset(('ConnectTimeout', 'ConnectTimeoutError', 'NewConnectionError', 'ConnectError'))
+
+
+def connect_failed(error: BaseException) -> bool:
+    """
+    Check whether an error was raised while connecting, before any of the request was sent.
+
+    The wrapped errors of the HTTP libraries (causes, arguments, urllib3 reasons) are checked as
+    well. Other errors, such as read timeouts or a connection closed by the server, may come after
+    the server received the request.
+
+    :param error: Exception raised by the HTTP library
+    :return: True if the request didn't reach the server
+    """
+    pending = [error]
+    seen = set()
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, (ConnectionRefusedError, socket.gaierror)):
+            return True
+        if any(cls.__name__ in CONNECT_ERRORS for cls in type(current).__mro__):
+            return True
+        nested = [current.__cause__, current.__context__, getattr(current, 'reason', None)]
+        nested.extend(current.args)
+        pending.extend(item for item in nested if isinstance(item, BaseException))
+    return False
+
+
+def network_error(error: Exception) -> NetworkError:
+    """
+    Wrap a low-level connection error into the SDK NetworkError.
+
+    :param error: Exception raised by the HTTP library
+    :return: NetworkError to raise
+    """
+    return NetworkError(
+        message=ERROR_NETWORK.format(error=str(error)),
+        original_exception=error,
+        connect=connect_failed(error)
+    )
+
+
+class Transport:
+    """
+    Base class of the HTTP transports used by the VsesvitAI client.
+
+    A transport receives a fully prepared request (absolute URL, headers with the
+    API key) and returns a response object with status_code, headers, content,
+    text and json(). Connection problems must be raised as NetworkError, HTTP
+    error statuses are returned as regular responses.
+    """
+
+    def send(self, method: str, url: str, params: Dict[str, Any] = None, json: Any = None,
+             data: Optional[bytes] = None, headers: Dict[str, str] = None,
+             files: Dict[str, Any] = None, timeout: Optional[float] = None):
+        """
+        Send a request synchronously.
+
+        :param method: HTTP Method (GET, POST, PUT, DELETE)
+        :param url: Absolute request URL
+        :param params: Query string parameters
+        :param json: JSON-serializable request body
+        :param data: Pre-encoded request body, sent as is
+        :param headers: HTTP headers
+        :param files: Files to upload
+        :param timeout: Request timeout in seconds
+        :returns: Response object
+        :raises: NetworkError on connection problems
+        """
+        raise NotImplementedError
+
+    async def send_async(self, method: str, url: str, params: Dict[str, Any] = None, json: Any = None,
+                         data: Optional[bytes] = None, headers: Dict[str, str] = None,
+                         files: Dict[str, Any] = None, timeout: Optional[float] = None):
+        """
+        Send a request from a coroutine.
+
+        Transports without native async support run send() in a worker thread.
+        Arguments are the same as for send().
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.send, method, url, params=params, json=json, data=data,
+                                       headers=headers, files=files, timeout=timeout)
+
+    def stream(self, method: str, url: str, params: Dict[str, Any] = None, headers: Dict[str, str] = None,
+               timeout: Optional[float] = None, chunk_size: int = 65536) -> StreamResponse:
+        """
+        Send a request and return a response whose body is read incrementally.
+
+        Transports without streaming support read the whole body with send()
+        and return it in chunks.
+
+        :param method: HTTP Method (GET, POST, PUT, DELETE)
+        :param url: Absolute request URL
+        :param params: Query string parameters
+        :param headers: HTTP headers
+        :param timeout: Request timeout in seconds
+        :param chunk_size: Preferred size of body chunks in bytes
+        :returns: StreamResponse
+        :raises: NetworkError on connection problems
+        """
+        response = self.send(method, url, params=params, headers=headers, timeout=timeout)
+        return StreamResponse(response.status_code, split_chunks(response.content or b'', chunk_size),
+                              response.headers)
+
+    def close(self) -> None:
+        """Release connections held by the transport."""
+
+    async def aclose(self) -> None:
+        """Release connections held by the transport from a coroutine."""
+        self.close()
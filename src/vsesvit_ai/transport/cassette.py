@@ -0,0 +1,179 @@
+import base64
+import json as jsonlib
+import os
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple
+from urllib.parse import urlsplit
+
+from src.vsesvit_ai.base.exceptions import CassetteError
+from src.vsesvit_ai.forking import ProcessLocal
+from src.vsesvit_ai.transport.base import Transport, TransportResponse
+
+CASSETTE_VERSION = 1
+
+# Request headers that are never written to a cassette
+REDACTED_HEADERS = ('x-api-key', 'authorization', 'cookie')
+
+
+def _request_key(method: str, url: str, params: Optional[Dict[str, Any]], body: Any) -> Tuple:
+    """Build the key used to match a request against recorded interactions."""
+    params = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    return method.upper(), urlsplit(url).path, jsonlib.dumps(params), jsonlib.dumps(body, sort_keys=True)
+
+
+class CassetteTransport(ProcessLocal, Transport):
+    """
+    Transport that records real traffic to a JSON cassette and replays it offline.
+
+    In 'record' mode every request goes to the wrapped transport and the exchange,
+    including its latency, is stored. In 'replay' mode responses come from the
+    cassette only; with replay_timing enabled each response is delayed by its
+    recorded latency, so performance incidents can be reproduced deterministically.
+    'auto' replays when the cassette file exists and records otherwise.
+
+    API keys and other credentials are never written to the cassette.
+    """
+
+    _local = ('_lock',)
+
+    def __init__(self, path: str, mode: str = 'auto', transport: Optional[Transport] = None,
+                 replay_timing: bool = False, speed: float = 1.0):
+        """
+        Initialize the cassette transport
+
+        :param path: Path of the cassette JSON file
+        :param mode: 'record', 'replay' or 'auto'
+        :param transport: Transport used for real requests while recording
+        :param replay_timing: Delay replayed responses by their recorded latency
+        :param speed: Replay speed factor, 2.0 replays twice as fast as recorded
+        """
+        if mode not in ('record', 'replay', 'auto'):
+            raise ValueError("mode must be one of: record, replay, auto")
+        if mode == 'auto':
+            mode = 'replay' if os.path.exists(path) else 'record'
+        if mode == 'record' and transport is None:
+            from src.vsesvit_ai.transport.requests_transport import PooledTransport
+            transport = PooledTransport()
+
+        self.path = path
+        self.mode = mode
+        self.transport = transport
+        self.replay_timing = replay_timing
+        self.speed = speed
+        self.interactions = []
+        self._pending = {}
+        self._started = time.monotonic()
+        self._setup_local()
+
+        if mode == 'replay':
+            self.load()
+
+    def _init_local(self) -> None:
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Load recorded interactions from the cassette file."""
+        with open(self.path, 'r', encoding='utf-8') as file:
+            cassette = jsonlib.load(file)
+        self.interactions = cassette['interactions']
+        self._pending = {}
+        for interaction in self.interactions:
+            request = interaction['request']
+            key = _request_key(request['method'], request['url'], request['params'], request['json'])
+            self._pending.setdefault(key, []).append(interaction)
+
+    def save(self) -> None:
+        """Write recorded interactions to the cassette file."""
+        with self._lock:
+            cassette = {
+                'version': CASSETTE_VERSION,
+                'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'interactions': list(self.interactions),
+            }
+        with open(self.path, 'w', encoding='utf-8') as file:
+            jsonlib.dump(cassette, file, indent=1)
+
+    def send(self, method: str, url: str, params: Dict[str, Any] = None, json: Any = None,
+             data: Optional[bytes] = None, headers: Dict[str, str] = None,
+             files: Dict[str, Any] = None, timeout: Optional[float] = None):
+        # Bodies pre-encoded by a JSON codec are stored and matched as JSON
+        body = jsonlib.loads(data) if data is not None and json is None else json
+        if self.mode == 'replay':
+            return self._replay(method, url, params, body)
+
+        offset = time.monotonic() - self._started
+        started = time.perf_counter()
+        response = self.transport.send(method, url, params=params, json=json, data=data, headers=headers,
+                                       files=files, timeout=timeout)
+        elapsed = time.perf_counter() - started
+        self._record(method, url, params, body, headers, files, response, offset, elapsed)
+        return response
+
+    def _record(self, method, url, params, body, headers, files, response, offset, elapsed) -> None:
+        content = response.content or b''
+        try:
+            text = content.decode('utf-8')
+            encoded = {'body': text}
+        except UnicodeDecodeError:
+            encoded = {'body_base64': base64.b64encode(content).decode('ascii')}
+
+        interaction = {
+            'offset': round(offset, 6),
+            'elapsed': round(elapsed, 6),
+            'request': {
+                'method': method.upper(),
+                'url': url,
+                'params': params,
+                'json': body,
+                'headers': {k: v for k, v in (headers or {}).items() if k.lower() not in REDACTED_HEADERS},
+                'files': {name: len(spec[1]) if isinstance(spec, tuple) else None
+                          for name, spec in (files or {}).items()},
+            },
+            'response': dict({
+                'status_code': response.status_code,
+                'headers': dict(response.headers),
+            }, **encoded),
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def _replay(self, method: str, url: str, params: Optional[Dict[str, Any]], body: Any) -> TransportResponse:
+        key = _request_key(method, url, params, body)
+        with self._lock:
+            queue = self._pending.get(key)
+            if not queue:
+                raise CassetteError(f"No recorded interaction for {method.upper()} {urlsplit(url).path}")
+            interaction = queue.pop(0) if len(queue) > 1 else queue[0]
+
+        if self.replay_timing and interaction['elapsed'] > 0:
+            time.sleep(interaction['elapsed'] / self.speed)
+
+        recorded = interaction['response']
+        if 'body_base64' in recorded:
+            content = base64.b64decode(recorded['body_base64'])
+        else:
+            content = recorded['body'].encode('utf-8')
+        return TransportResponse(recorded['status_code'], content, recorded['headers'])
+
+    def timeline(self) -> List[Dict[str, Any]]:
+        """
+        Return a compact view of recorded traffic for profiling.
+
+        :return: List of dictionaries with offset, elapsed, method, path and status
+        """
+        return [
+            {
+                'offset': interaction['offset'],
+                'elapsed': interaction['elapsed'],
+                'method': interaction['request']['method'],
+                'path': urlsplit(interaction['request']['url']).path,
+                'status_code': interaction['response']['status_code'],
+            }
+            for interaction in self.interactions
+        ]
+
+    def close(self) -> None:
+        if self.mode == 'record':
+            self.save()
+            self.transport.close()
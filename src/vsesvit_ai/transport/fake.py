@@ -0,0 +1,121 @@
+import json as jsonlib
+import threading
+from typing import Optional, Dict, Any, Union, Callable, List
+from urllib.parse import urlsplit
+
+from src.vsesvit_ai.forking import ProcessLocal
+from src.vsesvit_ai.transport.base import Transport, TransportResponse
+
+
+class FakeRequest:
+    """A request received by FakeTransport."""
+
+    def __init__(self, method: str, url: str, endpoint: str, params: Optional[Dict[str, Any]], json: Any,
+                 data: Optional[bytes], headers: Optional[Dict[str, str]], files: Optional[Dict[str, Any]]):
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.params = params
+        # Bodies pre-encoded by a JSON codec are decoded, so tests can inspect them the same way
+        self.json = jsonlib.loads(data) if data is not None and json is None else json
+        self.data = data
+        self.headers = headers or {}
+        self.files = files
+
+
+ResponseSpec = Union[Dict[str, Any], bytes, TransportResponse, Callable[[FakeRequest], Any]]
+
+
+class FakeTransport(ProcessLocal, Transport):
+    """
+    In-memory transport returning canned responses, for unit tests without HTTP.
+
+    Example:
+        transport = FakeTransport()
+        transport.add('GET', 'articles/1', {'success': True, 'data': {'id': 1}})
+        client = VsesvitAI(api_key='vsa_...', transport=transport)
+    """
+
+    _local = ('_lock',)
+
+    def __init__(self, base_path: str = '/api/v1'):
+        """
+        Initialize the fake transport
+
+        :param base_path: URL path prefix stripped from request URLs to get the endpoint
+        """
+        self.base_path = base_path.rstrip('/')
+        self.calls = []
+        self._routes = {}
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._lock = threading.Lock()
+
+    def add(self, method: str, endpoint: str, response: ResponseSpec = None, status: int = 200,
+            headers: Optional[Dict[str, str]] = None, times: Optional[int] = None) -> None:
+        """
+        Register a response for an endpoint.
+
+        Responses registered for the same endpoint are returned in order; the last
+        one keeps being returned once the others are used up.
+
+        :param method: HTTP method to match
+        :param endpoint: API endpoint to match (without base URL), e.g. 'articles/1'
+        :param response: JSON-serializable body, raw bytes, a TransportResponse or a
+                         callable taking a FakeRequest and returning any of those
+        :param status: HTTP status code of the response
+        :param headers: Response headers
+        :param times: Number of times the response is returned before moving on to the next one
+        """
+        with self._lock:
+            self._routes.setdefault((method.upper(), endpoint.strip('/')), []).append(
+                [response, status, headers, times]
+            )
+
+    def _endpoint(self, url: str) -> str:
+        path = urlsplit(url).path
+        if path.startswith(self.base_path + '/'):
+            path = path[len(self.base_path):]
+        return path.strip('/')
+
+    def send(self, method: str, url: str, params: Dict[str, Any] = None, json: Any = None,
+             data: Optional[bytes] = None, headers: Dict[str, str] = None,
+             files: Dict[str, Any] = None, timeout: Optional[float] = None) -> TransportResponse:
+        request = FakeRequest(method.upper(), url, self._endpoint(url), params, json, data, headers, files)
+
+        with self._lock:
+            self.calls.append(request)
+            queue = self._routes.get((request.method, request.endpoint))
+            if not queue:
+                return TransportResponse(404, b'{"error": "No fake response registered"}')
+            spec = queue[0]
+            if spec[3] is not None:
+                spec[3] -= 1
+                if spec[3] <= 0 and len(queue) > 1:
+                    queue.pop(0)
+            elif len(queue) > 1:
+                queue.pop(0)
+
+        response, status, response_headers, _ = spec
+        if callable(response):
+            response = response(request)
+        return self._build(response, status, response_headers)
+
+    @staticmethod
+    def _build(response: Any, status: int, headers: Optional[Dict[str, str]]) -> TransportResponse:
+        if isinstance(response, TransportResponse):
+            return response
+        if isinstance(response, bytes):
+            return TransportResponse(status, response, headers)
+        content = jsonlib.dumps(response).encode('utf-8') if response is not None else b''
+        return TransportResponse(status, content, dict({'Content-Type': 'application/json'}, **(headers or {})))
+
+    def requests_for(self, endpoint: str) -> List[FakeRequest]:
+        """
+        Return the received requests for an endpoint.
+
+        :param endpoint: API endpoint (without base URL)
+        :return: List of FakeRequest objects in the order they were received
+        """
+        return [call for call in self.calls if call.endpoint == endpoint.strip('/')]
@@ -0,0 +1,141 @@
+import threading
+from typing import Optional, Dict, Any, Iterator
+
+from src.vsesvit_ai.forking import ProcessLocal
+from src.vsesvit_ai.transport.base import Transport, StreamResponse, network_error
+
+
+def _stream_response(response: 'requests.Response', chunk_size: int) -> StreamResponse:
+    import requests
+
+    def chunks() -> Iterator[bytes]:
+        try:
+            yield from response.iter_content(chunk_size)
+        except requests.RequestException as e:
+            raise network_error(e)
+
+    return StreamResponse(response.status_code, chunks(), response.headers, response.close)
+
+
+class RequestsTransport(Transport):
+    """
+    Default transport, sends every request with a one-off requests.request call.
+
+    No connections are kept between requests. Use PooledTransport for workloads
+    that make many calls. requests is imported on the first call.
+    """
+
+    def send(self, method: str, url: str, params: Dict[str, Any] = None, json: Any = None,
+             data: Optional[bytes] = None, headers: Dict[str, str] = None,
+             files: Dict[str, Any] = None, timeout: Optional[float] = None) -> 'requests.Response':
+        import requests
+
+        # data is only passed when set, to keep the call identical to a plain requests.request
+        extra = {'data': data} if data is not None else {}
+        try:
+            return requests.request(
+                method=method,
+                url=url,
+                params=params,
+                json=json,
+                headers=headers,
+                files=files,
+                timeout=timeout,
+                **extra
+            )
+        except requests.RequestException as e:
+            raise network_error(e)
+
+    def stream(self, method: str, url: str, params: Dict[str, Any] = None, headers: Dict[str, str] = None,
+               timeout: Optional[float] = None, chunk_size: int = 65536) -> StreamResponse:
+        import requests
+
+        try:
+            response = requests.request(method=method, url=url, params=params, headers=headers,
+                                        timeout=timeout, stream=True)
+        except requests.RequestException as e:
+            raise network_error(e)
+        return _stream_response(response, chunk_size)
+
+
+class PooledTransport(ProcessLocal, Transport):
+    """
+    Transport that keeps connections alive in a shared requests.Session pool.
+
+    Safe to use from multiple threads; pool_maxsize should be at least the number
+    of threads issuing requests concurrently. The session isn't pickled, and a
+    child process started with fork opens its own connections.
+    """
+
+    _local = ('_session', '_lock')
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, max_retries: int = 0):
+        """
+        Initialize the pooled transport
+
+        :param pool_connections: Number of hosts to keep connection pools for
+        :param pool_maxsize: Maximum number of connections kept per host
+        :param max_retries: Number of retries on connection errors (not on HTTP error statuses)
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self._setup_local()
+
+    def _init_local(self) -> None:
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> 'requests.Session':
+        """The underlying session, created on first use."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            with self._lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                                          pool_maxsize=self.pool_maxsize,
+                                          max_retries=self.max_retries)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    self._session = session
+        return self._session
+
+    def send(self, method: str, url: str, params: Dict[str, Any] = None, json: Any = None,
+             data: Optional[bytes] = None, headers: Dict[str, str] = None,
+             files: Dict[str, Any] = None, timeout: Optional[float] = None) -> 'requests.Response':
+        import requests
+
+        try:
+            return self.session.request(
+                method=method,
+                url=url,
+                params=params,
+                json=json,
+                data=data,
+                headers=headers,
+                files=files,
+                timeout=timeout
+            )
+        except requests.RequestException as e:
+            raise network_error(e)
+
+    def stream(self, method: str, url: str, params: Dict[str, Any] = None, headers: Dict[str, str] = None,
+               timeout: Optional[float] = None, chunk_size: int = 65536) -> StreamResponse:
+        import requests
+
+        try:
+            response = self.session.request(method=method, url=url, params=params, headers=headers,
+                                            timeout=timeout, stream=True)
+        except requests.RequestException as e:
+            raise network_error(e)
+        return _stream_response(response, chunk_size)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
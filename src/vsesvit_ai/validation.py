@@ -0,0 +1,289 @@
+"""
+Client-side validation of create payloads.
+
+A malformed parameter of a create call (keywords that aren't a list of
+{'value', 'quantity'} objects, a temperature outside 0.0-2.0, a misspelled
+flag) is otherwise only reported by the API after a full round trip. The
+schemas below follow the parameters documented on the create() methods of
+the resources. Each schema is compiled once, on first use, into a tuple of
+required fields and a dictionary of checks by parameter, so validating a
+payload costs a few dictionary lookups and type checks per parameter.
+
+Clients created with validate=True check the payload of every create request
+and raise ValidationError without sending it. check_payload() returns the
+errors instead, e.g. to reject the bad rows of a batch up front.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.vsesvit_ai.base.exceptions import ValidationError
+
+# A check returns the errors of a value by field path, empty if the value is valid
+Check = Callable[[str, Any], List[Tuple[str, str]]]
+
+
+def _integer(minimum: Optional[int] = None) -> Check:
+    def check(path: str, value: Any) -> List[Tuple[str, str]]:
+        # bool is a subclass of int, but True isn't a valid ID or count
+        if not isinstance(value, int) or isinstance(value, bool):
+            return [(path, "must be an integer")]
+        if minimum is not None and value < minimum:
+            return [(path, f"must be at least {minimum}")]
+        return []
+    return check
+
+
+def _string(choices: Tuple[str, ...] = (), required: bool = False) -> Check:
+    def check(path: str, value: Any) -> List[Tuple[str, str]]:
+        if not isinstance(value, str):
+            return [(path, "must be a string")]
+        if required and not value.strip():
+            return [(path, "must not be empty")]
+        if choices and value not in choices:
+            return [(path, f"must be one of: {', '.join(choices)}")]
+        return []
+    return check
+
+
+def _boolean(path: str, value: Any) -> List[Tuple[str, str]]:
+    return [] if isinstance(value, bool) else [(path, "must be a boolean")]
+
+
+def _dictionary(path: str, value: Any) -> List[Tuple[str, str]]:
+    return [] if isinstance(value, dict) else [(path, "must be an object")]
+
+
+def _number(minimum: float, maximum: float) -> Check:
+    # Documented as a string ('1.0'), numbers are accepted as well
+    def check(path: str, value: Any) -> List[Tuple[str, str]]:
+        if isinstance(value, bool):
+            return [(path, "must be a number")]
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return [(path, "must be a number")]
+        if not minimum <= number <= maximum:
+            return [(path, f"must be between {minimum} and {maximum}")]
+        return []
+    return check
+
+
+def _list(item: Optional[Check] = None) -> Check:
+    def check(path: str, value: Any) -> List[Tuple[str, str]]:
+        if not isinstance(value, list):
+            return [(path, "must be a list")]
+        if item is None:
+            return []
+        return [error for index, element in enumerate(value) for error in item(f"{path}[{index}]", element)]
+    return check
+
+
+def _object(fields: Dict[str, Check], any_of: bool = False) -> Check:
+    # Objects need all of their fields, or one of them with any_of
+    def check(path: str, value: Any) -> List[Tuple[str, str]]:
+        if not isinstance(value, dict):
+            return [(path, "must be an object")]
+        present = [name for name in fields if name in value]
+        if any_of and not present:
+            return [(path, f"must have one of: {', '.join(fields)}")]
+        errors = [(f"{path}.{name}", "is required") for name in fields if name not in value and not any_of]
+        for name in present:
+            errors.extend(fields[name](f"{path}.{name}", value[name]))
+        return errors
+    return check
+
+
+ID = _integer(minimum=1)
+TEXT = _string()
+QUALITY = _string(choices=('premium', 'standard'))
+IDS = _list(ID)
+KEYWORDS = _list(_object({'value': _string(required=True), 'quantity': _integer(minimum=1)}))
+RULES = _list(_object({'rule': _string(required=True)}))
+LINKS = _list(_object({'url': _string(required=True)}))
+
+# Parameters of the create payload of every resource collection: (required, optional, open).
+# Open schemas accept parameters that aren't listed.
+SCHEMAS: Dict[str, Tuple[Dict[str, Check], Dict[str, Check], bool]] = {
+    'projects': (
+        {'name': _string(required=True), 'description': _string(required=True)},
+        {},
+        True,
+    ),
+    'articles': (
+        {'projectId': ID, 'name': _string(required=True), 'brief': _string(required=True)},
+        {
+            'requestWords': _integer(minimum=1),
+            'quality': QUALITY,
+            'country': TEXT,
+            'language': TEXT,
+            'website': TEXT,
+            'temperature': _number(0.0, 2.0),
+            'imageModel': TEXT,
+            'imageOrientation': TEXT,
+            **{flag: _boolean for flag in (
+                'useImages', 'useQuotes', 'useTables', 'useBulletLists', 'useDiagrams', 'useTOC', 'useFAQ',
+                'useAuthorInfo', 'useStrongTag', 'useDelTag', 'useSubTag', 'useSupTag', 'useEmTag',
+                'useEmoji', 'useProtection', 'allowAdditionalLinks',
+            )},
+            'knowledgeIds': IDS,
+            'authorId': ID,
+            'audienceId': ID,
+            'keywords': KEYWORDS,
+            'rules': RULES,
+            'externalLinks': LINKS,
+            'contentSources': LINKS,
+            'sections': _list(),
+        },
+        False,
+    ),
+    'landings': (
+        {'projectId': ID, 'name': _string(required=True), 'brief': _string(required=True)},
+        {
+            'requestSections': _integer(minimum=1),
+            'quality': QUALITY,
+            'country': TEXT,
+            'language': TEXT,
+            'imageModel': TEXT,
+            'publishUrl': TEXT,
+            'formHandlerUrl': TEXT,
+            'privacyPolicy': TEXT,
+            'termsAndConditions': TEXT,
+            **{flag: _boolean for flag in (
+                'useChartJs', 'useSwiper', 'useAOS', 'useTypedJs', 'useVanilaTiltJs', 'useScrollReveal',
+                'useCountUpJs', 'useRellax', 'useGlowCookies',
+            )},
+            'templateId': ID,
+            'audienceId': ID,
+            'knowledgeIds': IDS,
+            'keywords': KEYWORDS,
+            'rules': RULES,
+            'externalLinks': LINKS,
+            'contentSources': LINKS,
+            'sections': _list(),
+        },
+        False,
+    ),
+    'smart-tables': (
+        {'projectId': ID, 'name': _string(required=True), 'brief': _string(required=True), 'inputAssetId': ID},
+        {
+            'quality': QUALITY,
+            'limitRows': _integer(minimum=0),
+            'offsetRows': _integer(minimum=0),
+            'columns': _list(),
+        },
+        False,
+    ),
+    'knowledge-bases': (
+        {'projectId': ID, 'name': _string(required=True), 'description': _string(required=True)},
+        {
+            'language': TEXT,
+            'sources': _list(_object({'url': _string(required=True), 'query': _string(required=True)},
+                                     any_of=True)),
+        },
+        False,
+    ),
+    'authors': (
+        {'projectId': ID, 'name': _string(required=True), 'biography': _string(required=True)},
+        {'ppm': _dictionary, 'sources': LINKS},
+        False,
+    ),
+    'audiences': (
+        {'projectId': ID, 'name': _string(required=True)},
+        {field: TEXT for field in (
+            'ageGroup', 'gender', 'occupation', 'educationLevel', 'incomeBracket', 'relationshipStatus',
+            'lifeStage', 'goals', 'coreValues', 'hobbies', 'behavioralTraits', 'visualPreferences',
+            'communicationStyle', 'interests', 'painPoints', 'triggers', 'languageVarieties',
+        )},
+        False,
+    ),
+}
+
+
+class Validator:
+    """Compiled schema of the create payload of a resource collection."""
+
+    __slots__ = ('required', 'checks', 'open')
+
+    def __init__(self, required: Dict[str, Check], optional: Dict[str, Check], open: bool):
+        self.required = tuple(required)
+        self.checks = {**required, **optional}
+        self.open = open
+
+    def errors(self, data: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Return the errors of a payload.
+
+        :param data: Create payload
+        :return: Error messages by field path, empty if the payload is valid
+        """
+        errors: Dict[str, List[str]] = {}
+        for name in self.required:
+            if data.get(name) is None:
+                errors.setdefault(name, []).append("is required")
+        checks = self.checks
+        for name, value in data.items():
+            check = checks.get(name)
+            if check is None:
+                if not self.open:
+                    errors.setdefault(name, []).append("is not a known parameter")
+            elif value is not None:
+                # Optional parameters set to None are left to their defaults
+                for path, message in check(name, value):
+                    errors.setdefault(path, []).append(message)
+        return errors
+
+
+_validators: Dict[str, Validator] = {}
+
+
+def get_validator(resource: str) -> Optional[Validator]:
+    """
+    Return the compiled validator of a resource collection.
+
+    :param resource: Resource collection (e.g. 'articles')
+    :return: Validator, None if the collection has no schema
+    """
+    validator = _validators.get(resource)
+    if validator is None and resource in SCHEMAS:
+        validator = _validators[resource] = Validator(*SCHEMAS[resource])
+    return validator
+
+
+def check_payload(resource: str, data: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Return the errors of a create payload.
+
+    :param resource: Resource collection (e.g. 'articles')
+    :param data: Create payload, as sent by the create() method of the resource
+    :return: Error messages by field path, empty if the payload is valid or the collection has no schema
+    """
+    validator = get_validator(resource)
+    return validator.errors(data) if validator is not None else {}
+
+
+def validate_payload(resource: str, data: Dict[str, Any]) -> None:
+    """
+    Check a create payload before it's sent.
+
+    :param resource: Resource collection (e.g. 'articles')
+    :param data: Create payload
+    :raises: ValidationError if the payload is invalid
+    """
+    errors = check_payload(resource, data)
+    if errors:
+        raise ValidationError(f"Invalid {resource} payload", errors=errors, status_code=None)
+
+
+def validate_request(method: str, endpoint: str, data: Optional[Dict[str, Any]]) -> None:
+    """
+    Check the payload of a request if it creates a record.
+
+    :param method: HTTP method of the request
+    :param endpoint: API endpoint of the request (e.g. 'articles/create')
+    :param data: Request body
+    :raises: ValidationError if the payload is invalid
+    """
+    if method.upper() != 'POST' or not isinstance(data, dict):
+        return
+    resource, _, action = endpoint.strip('/').partition('/')
+    if action == 'create':
+        validate_payload(resource, data)
@@ -0,0 +1,60 @@
+"""
+Fixtures of the tests that run against the stub API server.
+
+StubServer options and the records to seed are set with the server marker,
+the options of the client fixture with the client marker, on a test, a class
+or a module:
+
+    pytestmark = pytest.mark.server(latency=0.02, records={'projects': 1, 'articles': 20})
+
+    @pytest.mark.client(models=True)
+    def test_models(client):
+        ...
+"""
+import pytest
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.testing import StubServer
+from src.vsesvit_ai.transport import PooledTransport
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'server(records=None, **options): StubServer options and records to seed')
+    config.addinivalue_line('markers', 'client(**options): VsesvitAI options of the client fixture')
+
+
+def _marker_options(request, name):
+    marker = request.node.get_closest_marker(name)
+    return dict(marker.kwargs) if marker is not None else {}
+
+
+@pytest.fixture
+def server(request):
+    """Starts a stub API server for a single test."""
+    options = _marker_options(request, 'server')
+    records = options.pop('records', None) or {}
+    with StubServer(**options) as stub:
+        stub.state.seed(**records)
+        yield stub
+
+
+@pytest.fixture
+def make_client(server):
+    """Returns a factory of clients of the stub server, closed after the test."""
+    clients = []
+
+    def make(**options):
+        # Pooled unless the test sets a transport, None for the default one
+        options.setdefault('transport', PooledTransport())
+        client = VsesvitAI(api_key=server.api_key, base_url=server.base_url, **options)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def client(make_client, request):
+    return make_client(**_marker_options(request, 'client'))
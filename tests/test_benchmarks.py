@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from benchmarks.harness import percentile, Result
+from benchmarks.run import compare, main
+
+
+class TestBenchmarks:
+    """Smoke tests for the benchmark suite."""
+
+    def test_percentile(self):
+        """Test percentile interpolation."""
+        samples = [float(i) for i in range(1, 101)]
+
+        assert percentile([], 50) == 0.0
+        assert percentile(samples, 50) == 50.5
+        assert percentile(samples, 100) == 100.0
+        assert round(percentile(samples, 99), 2) == 99.01
+
+    def test_result_to_dict(self):
+        """Test throughput and latency statistics of a result."""
+        result = Result('get_by_id', 'sync', [0.001, 0.003], elapsed=0.5, transferred=1024 * 1024)
+        data = result.to_dict()
+
+        assert data['operations'] == 2
+        assert data['ops_per_s'] == 4.0
+        assert data['p50_ms'] == 2.0
+        assert data['mb_per_s'] == 2.0
+
+    def test_run_writes_results(self, tmp_path):
+        """Test a tiny end-to-end run against the stub server."""
+        output = tmp_path / 'results.json'
+        main([
+            '--requests', '5', '--articles', '30', '--page-size', '10',
+            '--downloads', '2', '--download-size', '1000',
+            '--uploads', '2', '--upload-size', '1000',
+            '--output', str(output),
+        ])
+
+        report = json.loads(output.read_text())
+        results = {(r['configuration'], r['benchmark']): r for r in report['results']}
+
+        assert results[('sync', 'get_by_id')]['operations'] == 5
+        assert results[('sync', 'list_scan')]['items'] == 30
+        assert results[('sync', 'download')]['bytes'] == 2000
+        assert all(r['errors'] == 0 for r in report['results'])
+
+    def test_compare(self):
+        """Test that only slowdowns beyond the tolerance are reported."""
+        previous = [{'configuration': 'sync', 'benchmark': 'get_by_id', 'ops_per_s': 100.0, 'p99_ms': 10.0},
+                    {'configuration': 'sync', 'benchmark': 'download', 'ops_per_s': 10.0, 'p99_ms': 50.0}]
+        results = [{'configuration': 'sync', 'benchmark': 'get_by_id', 'ops_per_s': 95.0, 'p99_ms': 10.5},
+                   {'configuration': 'sync', 'benchmark': 'download', 'ops_per_s': 8.0, 'p99_ms': 60.0},
+                   {'configuration': 'pooled', 'benchmark': 'get_by_id', 'ops_per_s': 1.0, 'p99_ms': 999.0}]
+
+        regressions = compare(previous, results, tolerance=0.1)
+
+        assert len(regressions) == 2
+        assert all(regression.startswith('sync download') for regression in regressions)
+
+    def test_compare_fails_run(self, tmp_path):
+        """Test that a run slower than the compared report exits with an error."""
+        previous = tmp_path / 'previous.json'
+        previous.write_text(json.dumps({'results': [
+            {'configuration': 'sync', 'benchmark': 'get_by_id', 'ops_per_s': 1e9, 'p99_ms': 1e9},
+        ]}))
+
+        with pytest.raises(SystemExit) as error:
+            main(['--configurations', 'sync', '--benchmarks', 'get_by_id', '--requests', '5',
+                  '--articles', '5', '--in-process', '--output', str(tmp_path / 'results.json'),
+                  '--compare', str(previous)])
+
+        assert 'sync get_by_id' in str(error.value.code)
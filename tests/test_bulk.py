@@ -0,0 +1,118 @@
+import pytest
+
+from src.vsesvit_ai.base.exceptions import ResourceNotFoundError
+from src.vsesvit_ai.codec import JSONCodec
+
+
+pytestmark = pytest.mark.server(records={'projects': 2, 'articles': 30, 'landings': 5})
+
+
+class DecodeError(Exception):
+    """Decode error that isn't a ValueError, like the one of msgspec."""
+
+
+class StrictCodec(JSONCodec):
+    """Codec raising its own error type on malformed JSON."""
+
+    name = 'strict'
+    decode_errors = (DecodeError,)
+
+    def loads(self, data: bytes):
+        try:
+            return super().loads(data)
+        except ValueError as error:
+            raise DecodeError(str(error)) from None
+
+
+def archived(server, resource):
+    return {record['id'] for record in server.state.records[resource].values() if record['archived']}
+
+
+def puts(server):
+    return sum(1 for method, _ in server.request_log if method == 'PUT')
+
+
+class TestBulkArchive:
+    """Test suite for bulk archive and unarchive."""
+
+    def test_archive_by_ids(self, server, client):
+        """Test that every given record is archived and reported."""
+        ids = sorted(server.state.records['articles'])[:12]
+
+        report = client.archive_many('articles', ids=ids, max_workers=4)
+
+        assert report.ok
+        assert sorted(record_id for _, record_id in report.succeeded) == ids
+        assert archived(server, 'articles') == set(ids)
+
+    def test_archive_by_filter_across_resources(self, server, client):
+        """Test that a list filter selects the unarchived records of several collections."""
+        project_id = sorted(server.state.records['projects'])[0]
+        client.article.archive(next(record['id'] for record in server.state.records['articles'].values()
+                                    if record['projectId'] == project_id))
+        expected = {(resource, record['id']) for resource in ('articles', 'landings')
+                    for record in server.state.records[resource].values()
+                    if record['projectId'] == project_id and not record['archived']}
+
+        report = client.archive_many(['articles', 'landings'], params={'projectId': project_id}, page_size=4)
+
+        assert set(report.succeeded) == expected
+        assert puts(server) == 1 + len(expected)
+        assert not any(record['projectId'] == project_id and not record['archived']
+                       for resource in ('articles', 'landings') for record in server.state.records[resource].values())
+
+    def test_partial_failure(self, server, client):
+        """Test that temporary errors are retried and other errors are reported per record."""
+        ids = sorted(server.state.records['articles'])[:3]
+        server.fail_next(503, times=1, endpoint=f'articles/{ids[0]}/archive')
+
+        report = client.archive_many('articles', ids=ids + [999999], retry_delay=0.01)
+
+        assert not report.ok
+        assert sorted(record_id for _, record_id in report.succeeded) == ids
+        assert list(report.failed) == [('articles', 999999)]
+        assert isinstance(report.failed[('articles', 999999)], ResourceNotFoundError)
+        assert report.to_dict()['failed'].keys() == {'articles/999999'}
+
+    def test_resume_with_journal(self, server, client, tmp_path):
+        """Test that records completed by an earlier run of the journal are skipped."""
+        journal = str(tmp_path / 'cleanup.jsonl')
+        ids = sorted(server.state.records['articles'])[:6]
+        client.archive_many('articles', ids=ids[:4], journal=journal)
+        sent = puts(server)
+
+        report = client.archive_many('articles', ids=ids, journal=journal)
+
+        assert sorted(record_id for _, record_id in report.skipped) == ids[:4]
+        assert sorted(record_id for _, record_id in report.succeeded) == ids[4:]
+        assert puts(server) == sent + 2
+
+        undone = client.unarchive_many('articles', params={}, journal=journal)
+        assert sorted(record_id for _, record_id in undone.succeeded) == ids
+        assert archived(server, 'articles') == set()
+
+    @pytest.mark.parametrize("codec", [JSONCodec(), StrictCodec()], ids=["json", "strict"])
+    def test_journal_with_truncated_last_line(self, make_client, server, codec, tmp_path):
+        """Test that a last journal line cut short by an interrupted run is ignored and not appended to."""
+        journal = tmp_path / 'cleanup.jsonl'
+        ids = sorted(server.state.records['articles'])[:3]
+        with make_client(json_codec=codec) as client:
+            client.archive_many('articles', ids=ids[:2], journal=str(journal))
+            with open(journal, 'ab') as file:
+                file.write(codec.dumps({'action': 'archive', 'resource': 'articles', 'id': ids[2]})[:-5])
+
+            report = client.archive_many('articles', ids=ids, journal=str(journal))
+            rerun = client.archive_many('articles', ids=ids, journal=str(journal))
+
+        assert sorted(record_id for _, record_id in report.skipped) == ids[:2]
+        assert [record_id for _, record_id in report.succeeded] == [ids[2]]
+        assert sorted(record_id for _, record_id in rerun.skipped) == ids
+
+    def test_invalid_arguments(self, client):
+        """Test that unknown resources and missing selections are rejected."""
+        with pytest.raises(ValueError):
+            client.archive_many('referrals', ids=[1])
+        with pytest.raises(ValueError):
+            client.archive_many(['articles', 'landings'], ids=[1])
+        with pytest.raises(ValueError):
+            client.unarchive_many('articles')
@@ -0,0 +1,82 @@
+import time
+
+import pytest
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.cache import ResponseCache
+
+
+pytestmark = pytest.mark.server(records={'projects': 2})
+
+
+def requests_to(server, path):
+    return sum(1 for _, logged in server.request_log if logged.endswith(path))
+
+
+class TestResponseCache:
+    """Test suite for the persistent response cache."""
+
+    def test_fresh_hit_survives_clients(self, make_client, server, tmp_path):
+        """Test that a new client, as in the next run, is answered from the cache file."""
+        path = str(tmp_path / 'cache.db')
+        with make_client(cache=path) as client:
+            first = client.project.get_list()
+
+        with make_client(cache=path) as client:
+            assert client.project.get_list() == first
+            assert client.cache.stats() == {'hits': 1, 'stale_hits': 0, 'misses': 0}
+
+        assert requests_to(server, '/projects') == 1
+
+    def test_stale_while_revalidate(self, make_client, server, tmp_path):
+        """Test that a stale response is returned at once and refreshed in the background."""
+        cache = ResponseCache(str(tmp_path / 'cache.db'), ttl={'projects': 0.05})
+        client = make_client(cache=cache)
+        stale = client.project.get_list()
+        server.state.create('projects', {'name': 'New', 'description': 'Project'}, completed=True)
+        time.sleep(0.1)
+
+        assert client.project.get_list() == stale
+        client.close()
+
+        assert cache.stats()['stale_hits'] == 1
+        assert requests_to(server, '/projects') == 2
+        fresh = make_client(cache=ResponseCache(str(tmp_path / 'cache.db'), ttl={'projects': 60})).project.get_list()
+        assert len(fresh['data']) == len(stale['data']) + 1
+
+    def test_expired_entry_is_fetched(self, make_client, server, tmp_path):
+        """Test that an entry past its stale window is fetched before it is returned."""
+        cache = ResponseCache(str(tmp_path / 'cache.db'), ttl={'projects': 0.01}, stale_while_revalidate=0)
+        client = make_client(cache=cache)
+        client.project.get_list()
+        time.sleep(0.05)
+        client.project.get_list()
+
+        assert cache.stats() == {'hits': 0, 'stale_hits': 0, 'misses': 2}
+        assert requests_to(server, '/projects') == 2
+
+    def test_writes_invalidate(self, make_client, server, tmp_path):
+        """Test that creating a record drops the cached responses of its collection."""
+        client = make_client(cache=str(tmp_path / 'cache.db'))
+        before = client.project.get_list()
+        client.project.create('Created', 'Project')
+
+        after = client.project.get_list()
+
+        assert len(after['data']) == len(before['data']) + 1
+        assert requests_to(server, '/projects') == 2
+
+    def test_only_configured_resources(self, make_client, server, tmp_path):
+        """Test that collections without a TTL and other API keys are not answered from the cache."""
+        server.state.seed(projects=0, articles=3)
+        client = make_client(cache=str(tmp_path / 'cache.db'))
+        client.article.get_list()
+        client.article.get_list()
+        assert requests_to(server, '/articles') == 2
+
+        client.project.get_list()
+        other = VsesvitAI(api_key='vsa_other_key_0123456789abcdef', base_url=server.base_url,
+                          cache=str(tmp_path / 'cache.db'))
+        other.cache.fetch(other.api_key, 'projects', None, lambda: {'success': True, 'data': []},
+                          other.codec, other.submit)
+        assert other.cache.stats()['misses'] == 1
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from src.vsesvit_ai.base.exceptions import CircuitOpenError, ResourceNotFoundError, ServerError
+from src.vsesvit_ai.circuit import CircuitBreaker, CircuitBreakers, endpoint_group
+
+
+pytestmark = pytest.mark.server(records={"projects": 1, "articles": 3})
+
+
+def breakers(**kwargs):
+    return CircuitBreakers(**dict({"window": 4, "min_requests": 4, "reset_timeout": 0.05}, **kwargs))
+
+
+class TestCircuitBreaker:
+    """Test suite for per-endpoint circuit breakers."""
+
+    def test_endpoint_group(self):
+        """Test that resource IDs are removed from endpoint groups."""
+        assert endpoint_group("articles/42") == "articles/{id}"
+        assert endpoint_group("/articles/42/archive") == "articles/{id}/archive"
+        assert endpoint_group("articles/create") == "articles/create"
+        assert endpoint_group("smart-tables/7/download-csv") == "smart-tables/{id}/download-csv"
+
+    def test_opens_and_fails_fast(self, make_client, server):
+        """Test that the breaker opens at the failure rate and rejects requests without sending them."""
+        with make_client(circuit_breaker=breakers()) as client:
+            server.fail_next(503, times=2, endpoint="projects")
+            for _ in range(2):
+                with pytest.raises(ServerError):
+                    client.project.get_list()
+            client.project.get_list()
+            client.project.get_list()
+            assert client.breakers.stats()["projects"]["state"] == "open"
+
+            server.request_log.clear()
+            with pytest.raises(CircuitOpenError) as exc_info:
+                client.project.get_list()
+            assert exc_info.value.group == "projects"
+            assert len(server.request_log) == 0
+
+            # Other endpoint groups are not affected
+            assert client.article.get_list()["data"]
+
+    def test_half_open_probe(self, make_client, server):
+        """Test that a successful probe closes the breaker and a failed one opens it again."""
+        with make_client(circuit_breaker=breakers(failure_rate=1.0)) as client:
+            server.fail_next(503, times=5, endpoint="articles")
+            for _ in range(4):
+                with pytest.raises(ServerError):
+                    client.article.get_list()
+            breaker = client.breakers.get("articles")
+
+            time.sleep(0.06)
+            with pytest.raises(ServerError):
+                client.article.get_list()
+            assert breaker.state == "open"
+            with pytest.raises(CircuitOpenError):
+                client.article.get_list()
+
+            time.sleep(0.06)
+            assert client.article.get_list()["data"]
+            assert breaker.state == "closed"
+
+    def test_client_errors(self, make_client):
+        """Test that client errors don't count as failures."""
+        with make_client(circuit_breaker=breakers()) as client:
+            for _ in range(5):
+                with pytest.raises(ResourceNotFoundError):
+                    client.article.get_by_id(999999)
+            assert client.breakers.stats()["articles/{id}"] == {
+                "state": "closed", "failure_rate": 0.0, "requests": 4, "rejected": 0
+            }
+
+    def test_half_open_limit(self):
+        """Test that only half_open_requests probes are let through at once."""
+        breaker = CircuitBreaker("articles", min_requests=1, reset_timeout=0, half_open_requests=1)
+        breaker.record(False)
+        assert breaker.state == "open"
+        breaker.before()
+        with pytest.raises(CircuitOpenError):
+            breaker.before()
+        breaker.release()
+        breaker.before()
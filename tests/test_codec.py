@@ -0,0 +1,102 @@
+from unittest.mock import patch, Mock
+
+import pytest
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.codec import JSONCodec, get_codec, available_codecs
+from src.vsesvit_ai.testing import StubServer
+from src.vsesvit_ai.transport import FakeTransport, PooledTransport
+
+API_KEY = "vsa_test_key123456789012345678901234"
+BASE_URL = "https://test.vsesvit.ai/api/v1"
+
+PAYLOAD = {"title": "Кава", "keywords": ["espresso", "латте"], "rules": {"tone": "formal"}, "count": 3}
+
+
+class TestJSONCodec:
+    """Test suite for the pluggable JSON codecs."""
+
+    @pytest.mark.parametrize("name", available_codecs())
+    def test_round_trip(self, name):
+        """Test that every installed codec encodes to bytes and decodes from bytes."""
+        codec = get_codec(name)
+        encoded = codec.dumps(PAYLOAD)
+
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == PAYLOAD
+        assert get_codec("json").loads(encoded) == PAYLOAD
+
+    def test_auto_prefers_fast_library(self):
+        """Test that 'auto' picks the first installed codec in preference order."""
+        expected = next(name for name in ("orjson", "msgspec", "ujson", "json") if name in available_codecs())
+        assert get_codec("auto").name == expected
+
+    def test_unknown_codec(self):
+        """Test that an unknown codec name is rejected."""
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    def test_standard_library_by_default(self):
+        """Test that the client uses the standard library codec unless another one is chosen."""
+        assert VsesvitAI(api_key=API_KEY, base_url=BASE_URL).codec.name == "json"
+
+    def test_codec_instance(self):
+        """Test that a codec instance is used as is."""
+        codec = JSONCodec()
+        client = VsesvitAI(api_key=API_KEY, base_url=BASE_URL, json_codec=codec)
+        assert client.codec is codec
+
+    def test_codec_resolved_lazily(self):
+        """Test that constructing a client does not resolve the codec."""
+        client = VsesvitAI(api_key=API_KEY, base_url=BASE_URL, json_codec="yaml")
+        with pytest.raises(ValueError):
+            client.codec
+
+    def test_response_decoded_from_bytes(self):
+        """Test that responses are decoded from raw bytes, not via response.json()."""
+        client = VsesvitAI(api_key=API_KEY, base_url=BASE_URL)
+        response = Mock(status_code=200, content=b'{"success":true,"data":{"id":7}}')
+        response.json.side_effect = AssertionError("response.json() should not be used")
+
+        with patch('requests.request', return_value=response):
+            assert client.request("GET", "articles/7") == {"success": True, "data": {"id": 7}}
+
+    @pytest.mark.skipif(available_codecs() == ["json"], reason="no fast JSON library installed")
+    @patch('requests.request')
+    def test_fast_codec_sends_encoded_body(self, mock_request):
+        """Test that the 'auto' codec sends a pre-encoded body with a JSON content type."""
+        mock_request.return_value = Mock(status_code=200, content=b'{}')
+        client = VsesvitAI(api_key=API_KEY, base_url=BASE_URL, json_codec="auto")
+
+        client.request("POST", "articles", data=PAYLOAD)
+
+        kwargs = mock_request.call_args[1]
+        assert kwargs["json"] is None
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        assert get_codec("json").loads(kwargs["data"]) == PAYLOAD
+
+    @pytest.mark.parametrize("name", available_codecs())
+    def test_fake_transport_sees_body(self, name):
+        """Test that the fake transport exposes the request body for every codec."""
+        transport = FakeTransport()
+        transport.add("POST", "articles", {"success": True, "data": {"id": 1}})
+        client = VsesvitAI(api_key=API_KEY, base_url=BASE_URL, transport=transport, json_codec=name)
+
+        assert client.request("POST", "articles", data=PAYLOAD) == {"success": True, "data": {"id": 1}}
+        assert transport.calls[0].json == PAYLOAD
+
+    @pytest.mark.parametrize("name", available_codecs())
+    def test_stub_server_round_trip(self, name):
+        """Test creating and reading an article through the stub server with every codec."""
+        with StubServer() as server:
+            server.state.seed(projects=1)
+            client = VsesvitAI(api_key=server.api_key, base_url=server.base_url,
+                               transport=PooledTransport(), json_codec=name)
+            with client:
+                project_id = client.project.get_list()["data"][0]["id"]
+                created = client.article.create(project_id, "Кава", "Про каву",
+                                                additional_params={"keywords": ["espresso"]})
+                article = client.article.get_by_id(created["data"]["id"])
+
+        assert article["data"]["name"] == "Кава"
+        assert article["data"]["keywords"] == ["espresso"]
@@ -0,0 +1,101 @@
+import threading
+import time
+
+import pytest
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.base.exceptions import RateLimitError
+from src.vsesvit_ai.concurrency import AIMDController
+from src.vsesvit_ai.testing import StubServer
+from src.vsesvit_ai.transport import PooledTransport
+
+
+class TestAIMDController:
+    """Test suite for adaptive concurrency control."""
+
+    def test_additive_increase(self):
+        """Test that healthy requests raise the limit by about one per round trip."""
+        controller = AIMDController(initial=2, max_limit=4)
+
+        def complete(count):
+            for _ in range(count):
+                controller.acquire()
+                controller.release(0.01, congested=False)
+
+        # One round trip at a limit of 2 is two requests
+        complete(2)
+        assert 2.8 < controller.limit < 3.0
+        complete(100)
+        assert controller.limit == 4
+
+    def test_multiplicative_decrease(self):
+        """Test that overload cuts the limit once per round trip."""
+        controller = AIMDController(initial=8)
+        controller.acquire()
+        controller.release(0.5, congested=False)
+        limit = controller.limit
+        for _ in range(3):
+            controller.acquire()
+            controller.release(None, congested=True)
+        assert controller.limit == pytest.approx(limit / 2)
+        assert controller.decreases == 1
+
+        def rate_limited():
+            raise RateLimitError()
+
+        controller = AIMDController(initial=8)
+        with pytest.raises(RateLimitError):
+            controller.call(rate_limited)
+        assert controller.limit == 4
+
+    def test_latency_spike(self):
+        """Test that a request much slower than the baseline counts as congestion."""
+        controller = AIMDController(initial=8, latency_tolerance=2.0)
+        for latency in (0.01, 0.012, 0.011):
+            controller.acquire()
+            controller.release(latency, congested=False)
+        limit = controller.limit
+        controller.acquire()
+        controller.release(0.05, congested=False)
+        assert controller.limit == pytest.approx(limit / 2)
+
+    def test_limit_enforced(self):
+        """Test that no more requests than the limit run at once."""
+        controller = AIMDController(initial=2, max_limit=2)
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def send():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+        threads = [threading.Thread(target=controller.call, args=(send,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert peak[0] == 2
+        assert controller.in_flight == 0
+
+        controller = AIMDController(initial=1, timeout=0.01)
+        controller.acquire()
+        with pytest.raises(TimeoutError):
+            controller.acquire()
+
+    def test_client(self):
+        """Test that the client limit backs off on 429 responses from bulk calls."""
+        with StubServer() as server:
+            server.state.seed(projects=1, articles=5)
+            with VsesvitAI(api_key=server.api_key, base_url=server.base_url, transport=PooledTransport(),
+                           adaptive_concurrency=AIMDController(initial=4), max_workers=8) as client:
+                server.fail_next(429, times=2, endpoint="projects")
+                with client.batch() as batch:
+                    for _ in range(20):
+                        batch.submit(client.project.get_list)
+                assert len(batch.errors) == 2
+                assert client.concurrency.stats()["decreases"] >= 1
+                assert client.concurrency.stats()["in_flight"] == 0
@@ -0,0 +1,124 @@
+import pytest
+
+from src.vsesvit_ai.dedupe import ResourceIndex, payload_hash
+
+
+pytestmark = pytest.mark.server(records={'projects': 1})
+
+
+@pytest.fixture
+def project_id(client):
+    return client.project.get_list()['data'][0]['id']
+
+
+def gets(server, resource):
+    return sum(1 for method, logged in server.request_log if method == 'GET' and f'/{resource}' in logged)
+
+
+def creates(server, resource):
+    return sum(1 for method, logged in server.request_log
+               if method == 'POST' and logged.endswith(f'/{resource}/create'))
+
+
+class TestGetOrCreate:
+    """Test suite for get_or_create of authors, audiences and knowledge bases."""
+
+    def test_same_payload_is_created_once(self, make_client, server, project_id):
+        """Test that a repeated get_or_create returns the indexed record."""
+        with make_client() as client:
+            first, created = client.author.get_or_create(project_id, 'Jane', 'Technical writer')
+            second, created_again = client.author.get_or_create(project_id, 'Jane', 'Technical writer')
+
+        assert created and not created_again
+        assert second['data']['id'] == first['data']['id']
+        assert creates(server, 'authors') == 1
+
+    def test_existing_record_is_found_in_list(self, make_client, server, project_id):
+        """Test that a record created without the index is found by project, name and details."""
+        other = server.state.create('projects', {'name': 'Other', 'description': 'd'})
+        server.state.create('audiences', {'projectId': other['id'], 'name': 'Developers',
+                                        'occupation': 'engineer'}, completed=True)
+        record = server.state.create('audiences', {'projectId': project_id, 'name': 'Developers',
+                                                 'occupation': 'engineer'}, completed=True)
+        with make_client() as client:
+            response, created = client.audience.get_or_create(project_id, 'Developers',
+                                                              {'occupation': 'engineer'})
+            assert len(client.resource_index) == 1
+
+        assert not created
+        assert response['data']['id'] == record['id']
+        assert creates(server, 'audiences') == 0
+
+    def test_collection_is_listed_once(self, make_client, server, project_id):
+        """Test that records are listed on the first miss only and new records don't cost lookups."""
+        with make_client() as client:
+            for name in ('Jane', 'John', 'Joan'):
+                client.author.get_or_create(project_id, name, 'Technical writer')
+            assert gets(server, 'authors') == 1
+
+            _, created = client.author.get_or_create(project_id, 'John', 'Technical writer')
+            _, other = client.author.get_or_create(project_id, 'John', 'Editor')
+
+        assert not created and other
+        assert creates(server, 'authors') == 4
+
+    def test_unknown_job_state_is_reused(self, make_client, server, project_id, monkeypatch):
+        """Test that a record in a state the SDK doesn't know isn't created again."""
+        monkeypatch.setattr(server.state, '_refresh', lambda resource, record: None)
+        queued = server.state.create('authors', {'projectId': project_id, 'name': 'Jane',
+                                                 'biography': 'Technical writer'})
+        queued['state'] = 'queued'
+        with make_client() as client:
+            response, created = client.author.get_or_create(project_id, 'Jane', 'Technical writer')
+
+        assert not created
+        assert response['data']['id'] == queued['id']
+
+    def test_different_payload_is_created(self, make_client, server, project_id):
+        """Test that a record with the same name but other parameters isn't reused."""
+        server.state.create('knowledge-bases', {'projectId': project_id, 'name': 'Docs',
+                                              'description': 'Product docs'}, completed=True)
+        with make_client() as client:
+            _, created = client.knowledge_base.get_or_create(project_id, 'Docs', 'API reference')
+
+        assert created
+        assert creates(server, 'knowledge-bases') == 1
+
+    def test_archived_record_is_created_again(self, make_client, server, project_id):
+        """Test that an indexed record that was archived since is replaced by a new one."""
+        with make_client() as client:
+            first, _ = client.author.get_or_create(project_id, 'Jane', 'Technical writer')
+            client.author.archive(first['data']['id'])
+            second, created = client.author.get_or_create(project_id, 'Jane', 'Technical writer')
+
+        assert created
+        assert second['data']['id'] != first['data']['id']
+        assert creates(server, 'authors') == 2
+
+    def test_failed_record_is_created_again(self, make_client, server, project_id, monkeypatch):
+        """Test that a record whose generation job failed isn't reused, from the index or the list."""
+        monkeypatch.setattr(server.state, '_refresh', lambda resource, record: None)
+        failed = server.state.create('audiences', {'projectId': project_id, 'name': 'Developers'})
+        failed['state'] = 'failed'
+        with make_client() as client:
+            first, created = client.audience.get_or_create(project_id, 'Developers')
+            server.state.records['audiences'][first['data']['id']]['state'] = 'failed'
+            second, created_again = client.audience.get_or_create(project_id, 'Developers')
+
+        assert created and created_again
+        assert len({failed['id'], first['data']['id'], second['data']['id']}) == 3
+
+    def test_index_file_is_shared_by_runs(self, make_client, server, project_id, tmp_path):
+        """Test that an index file is reused by later clients and keyed by the payload, not its order."""
+        path = str(tmp_path / 'index.db')
+        with make_client(resource_index=path) as client:
+            first, _ = client.author.get_or_create(project_id, 'Jane', 'Technical writer', {'ppm': {'tone': 'calm'}})
+
+        with make_client(resource_index=ResourceIndex(path)) as client:
+            second, created = client.author.get_or_create(project_id, 'Jane', 'Technical writer',
+                                                          {'ppm': {'tone': 'calm'}})
+
+        assert not created
+        assert second['data']['id'] == first['data']['id']
+        assert creates(server, 'authors') == 1
+        assert payload_hash({'a': 1, 'b': [1, 2]}) == payload_hash({'b': [1, 2], 'a': 1})
@@ -0,0 +1,105 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.vsesvit_ai.base.exceptions import ResourceNotFoundError
+from src.vsesvit_ai.executor import run_bounded
+from src.vsesvit_ai.transport import PooledTransport
+
+
+request_id = contextvars.ContextVar('request_id', default=None)
+
+
+pytestmark = [pytest.mark.server(latency=0.02, records={"projects": 1, "articles": 20}),
+              pytest.mark.client(transport=None, max_workers=8)]
+
+
+class TestExecutor:
+    """Test suite for submit() and batch() on the sync client."""
+
+    def test_submit(self, client):
+        """Test that submit returns a future and uses a pooled transport."""
+        future = client.submit(client.project.get_list)
+        assert future.result()["data"]
+        assert isinstance(client.transport, PooledTransport)
+
+    def test_batch(self, client):
+        """Test that batch calls run concurrently and keep submission order."""
+        ids = [article["id"] for article in client.article.get_list({"limit": 20})["data"]]
+        start = time.perf_counter()
+        with client.batch() as batch:
+            for article_id in ids:
+                batch.submit(client.article.get_by_id, article_id)
+        assert time.perf_counter() - start < 20 * 0.02
+        assert [result["data"]["id"] for result in batch.results] == ids
+        assert batch.errors == {}
+
+    def test_errors(self, client):
+        """Test that failures are collected per call."""
+        ids = [article["id"] for article in client.article.get_list({"limit": 2})["data"]]
+        with client.batch() as batch:
+            batch.map(client.article.get_by_id, [ids[0], 999999, ids[1]])
+        assert batch.results[1] is None
+        assert list(batch.errors) == [1]
+        assert isinstance(batch.errors[1], ResourceNotFoundError)
+
+        with pytest.raises(ResourceNotFoundError):
+            with client.batch(raise_errors=True) as batch:
+                batch.submit(client.article.get_by_id, 999999)
+
+    def test_max_pending(self, client):
+        """Test that submit blocks while max_pending calls are in flight."""
+        release = threading.Event()
+        with client.batch(max_pending=2) as batch:
+            batch.submit(release.wait)
+            batch.submit(release.wait)
+            third = threading.Thread(target=batch.submit, args=(len, []))
+            third.start()
+            third.join(0.05)
+            assert third.is_alive() and len(batch) == 2
+            release.set()
+            third.join()
+        assert batch.results == [True, True, 0]
+
+    def test_explicit_transport(self, make_client):
+        """Test that a transport passed to the client is used by the workers."""
+        transport = PooledTransport()
+        with make_client(transport=transport) as client:
+            client.submit(client.project.get_list).result()
+            assert client.transport is transport
+
+    @pytest.mark.parametrize("ordered", [False, True])
+    def test_run_bounded(self, ordered):
+        """Test that run_bounded keeps a bounded window in flight in the context of the caller."""
+        lock = threading.Lock()
+        in_flight = []
+        peak = 0
+
+        def call(item):
+            nonlocal peak
+            with lock:
+                in_flight.append(item)
+                peak = max(peak, len(in_flight))
+            time.sleep(0.01 * (item % 3))
+            with lock:
+                in_flight.remove(item)
+            return item, request_id.get()
+
+        request_id.set('run')
+        taken = []
+        items = (taken.append(item) or item for item in range(12))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = []
+            for item, future in run_bounded(executor, call, items, 3, ordered=ordered):
+                # Items are taken as calls complete, not up front
+                assert len(taken) <= len(results) + 6
+                results.append(future.result())
+
+        assert peak <= 3
+        assert {result for result, _ in results} == set(range(12))
+        assert {context for _, context in results} == {'run'}
+        if ordered:
+            assert [result for result, _ in results] == list(range(12))
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.export import EXPORTED_RESOURCES
+from src.vsesvit_ai.transport import FakeTransport
+
+
+pytestmark = pytest.mark.server(records={"projects": 2, "articles": 53, "landings": 4, "smart_tables": 3,
+                                      "knowledge_bases": 2, "authors": 1, "audiences": 2, "referrals": 12})
+
+
+def read_jsonl(path):
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+class TestExport:
+    """Test suite for the bulk resource export."""
+
+    def test_jsonl(self, client, tmp_path):
+        """Test exporting every resource to JSONL."""
+        results = client.export(str(tmp_path), file_format="jsonl", page_size=10)
+
+        assert set(results) == set(EXPORTED_RESOURCES)
+        expected = {"projects": 2, "articles": 53, "landings": 4, "smart-tables": 3, "knowledge-bases": 2,
+                    "authors": 1, "audiences": 2, "referrals": 12}
+        assert {resource: result["rows"] for resource, result in results.items()} == expected
+
+        articles = read_jsonl(results["articles"]["path"])
+        assert [article["id"] for article in articles] == sorted(article["id"] for article in articles)
+        assert len({article["id"] for article in articles}) == 53
+        assert len(read_jsonl(results["referrals"]["path"])) == 12
+
+    def test_records_listed_twice(self, tmp_path):
+        """Test that pages are sorted by creation time and records repeated on the next page are written once."""
+        transport = FakeTransport()
+        transport.add("GET", "articles", {"success": True, "data": [{"id": 1}, {"id": 2}], "meta": {"last_page": 2}})
+        transport.add("GET", "articles", {"success": True, "data": [{"id": 2}, {"id": 3}], "meta": {"last_page": 2}})
+        client = VsesvitAI(api_key="vsa_test_key123456789012345678901234", transport=transport)
+
+        results = client.export(str(tmp_path), resources=["articles"], file_format="jsonl", page_size=2)
+
+        assert [article["id"] for article in read_jsonl(results["articles"]["path"])] == [1, 2, 3]
+        assert {(call.params["sort"], call.params["direction"]) for call in transport.calls} == {("createdAt", "asc")}
+
+    def test_selected_resources(self, client, tmp_path):
+        """Test exporting a subset of resources."""
+        results = client.export(str(tmp_path / "out"), resources=["audiences"], file_format="jsonl")
+        assert list(results) == ["audiences"]
+        assert results["audiences"]["path"].endswith("audiences.jsonl")
+
+    def test_unknown_format(self, client, tmp_path):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            client.export(str(tmp_path), file_format="csv")
+
+    def test_parquet(self, client, tmp_path):
+        """Test exporting to Parquet."""
+        pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+        results = client.export(str(tmp_path), resources=["articles"], file_format="parquet", page_size=10,
+                                batch_size=20)
+
+        parquet_file = pyarrow_parquet.ParquetFile(results["articles"]["path"])
+        assert parquet_file.metadata.num_row_groups == 3
+        table = parquet_file.read()
+        assert table.num_rows == 53
+        assert table.column("language").to_pylist()[:5] == ["en", "de", "fr", "es", "uk"]
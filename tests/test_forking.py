@@ -0,0 +1,123 @@
+import multiprocessing
+import os
+import pickle
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.concurrency import SharedTokenBucket
+from src.vsesvit_ai.pool import VsesvitAIPool
+from src.vsesvit_ai.transport import PooledTransport
+
+
+def project_name(client, project_id):
+    return client.project.get_by_id(project_id)['data']['name']
+
+
+def take_tokens(bucket, count):
+    return sum(1 for _ in range(count) if bucket.try_acquire() == 0)
+
+
+class TestPickling:
+    """Test suite for pickling clients and passing them to other processes."""
+
+    def test_round_trip(self, server):
+        """Test that a pickled client keeps its settings but not its connections and threads."""
+        client = VsesvitAI(api_key=server.api_key, base_url=[server.base_url, 'http://127.0.0.1:1/api/v1'],
+                           transport=PooledTransport(), circuit_breaker=True, hedge=True,
+                           adaptive_concurrency=True, scheduler=True, max_workers=3)
+        client.submit(client.project.get_list).result()
+        assert client.transport._session is not None
+
+        copy = pickle.loads(pickle.dumps(client))
+
+        assert copy.api_key == client.api_key
+        assert [endpoint.url for endpoint in copy.router.endpoints] == [server.base_url, 'http://127.0.0.1:1/api/v1']
+        assert copy.max_workers == 3
+        assert copy.scheduler.controller is copy.concurrency
+        assert copy.transport._session is None
+        assert copy._executor is None
+        assert copy.scheduler.in_flight == 0
+        assert copy.project.get_list()['success'] is True
+        client.close()
+        copy.close()
+
+    def test_pool_round_trip(self, server, tmp_path):
+        """Test that a pickled pool keeps its keys, learned owners and shared rate limits."""
+        pool = VsesvitAIPool([server.api_key, 'vsa_other_key_0123456789abcdef'], base_url=server.base_url,
+                             rate_limit=50, shared_limits=str(tmp_path / 'limits.db'))
+        pool.project.get_list()
+
+        copy = pickle.loads(pickle.dumps(pool))
+
+        assert copy.api_keys == pool.api_keys
+        assert copy._owners.keys() == pool._owners.keys()
+        assert copy._members[0].bucket.path == str(tmp_path / 'limits.db')
+        assert copy.project.get_list()['success'] is True
+
+    def test_process_pool(self, server, client):
+        """Test that a client is passed to spawned worker processes."""
+        project = server.state.create('projects', {'name': 'Forked', 'description': 'Project'}, completed=True)
+
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+            names = list(executor.map(project_name, [client] * 4, [project['id']] * 4))
+
+        assert names == [project['name']] * 4
+
+
+class TestFork:
+    """Test suite for fork safety."""
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="os.fork is not available")
+    def test_child_opens_own_connections(self, client):
+        """Test that a forked child doesn't reuse the connections and threads of the parent."""
+        client.submit(client.project.get_list).result()
+
+        with warnings.catch_warnings():
+            # Python warns about forking a process that runs threads
+            warnings.simplefilter('ignore', DeprecationWarning)
+            pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                fresh = client.transport._session is None and client._executor is None
+                if fresh and client.submit(client.project.get_list).result()['success']:
+                    status = 0
+            finally:
+                os._exit(status)
+
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert client.transport._session is not None
+        assert client.project.get_list()['success'] is True
+        client.close()
+
+
+class TestSharedTokenBucket:
+    """Test suite for the rate limit shared between processes."""
+
+    def test_processes_share_tokens(self, tmp_path):
+        """Test that processes draw from one bucket instead of a full burst each."""
+        bucket = SharedTokenBucket(str(tmp_path / 'limits.db'), rate=0.01, burst=5)
+
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+            taken = list(executor.map(take_tokens, [bucket] * 2, [5] * 2))
+
+        assert sum(taken) == 5
+        assert bucket.try_acquire() > 0
+
+    def test_named_buckets(self, tmp_path):
+        """Test that buckets with different names in one file are independent."""
+        path = str(tmp_path / 'limits.db')
+        first = SharedTokenBucket(path, rate=0.01, burst=1, name='first')
+        second = SharedTokenBucket(path, rate=0.01, burst=1, name='second')
+
+        assert first.try_acquire() == 0
+        assert second.try_acquire() == 0
+        assert first.try_acquire() > 0
+        first.close()
+        second.close()
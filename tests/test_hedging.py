@@ -0,0 +1,114 @@
+import asyncio
+import itertools
+import time
+
+import pytest
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.base.exceptions import ServerError
+from src.vsesvit_ai.hedging import Hedger, LatencyWindow
+from src.vsesvit_ai.transport import FakeTransport
+
+API_KEY = "vsa_test_key_0123456789abcdefg"
+BASE_URL = "https://test.vsesvit.ai/api/v1"
+
+
+def slow_calls(*slow, delay=0.5):
+    """Return a fake response that sleeps on the given (zero-based) calls."""
+    counter = itertools.count()
+
+    def respond(request):
+        if next(counter) in slow:
+            time.sleep(delay)
+        return {"success": True, "data": {"id": 1}}
+
+    return respond
+
+
+def make_client(transport, **kwargs):
+    hedger = Hedger(**dict({"min_samples": 5, "budget": 0.5, "min_delay": 0.01}, **kwargs))
+    return VsesvitAI(api_key=API_KEY, base_url=BASE_URL, transport=transport, hedge=hedger)
+
+
+class TestHedger:
+    """Test suite for hedged GET requests."""
+
+    def test_percentile(self):
+        """Test latency percentiles of the window."""
+        window = LatencyWindow(size=100)
+        assert window.percentile(95) is None
+        for value in range(1, 101):
+            window.add(value / 1000)
+        assert window.percentile(50) == pytest.approx(0.0505)
+        assert window.percentile(100) == pytest.approx(0.1)
+
+    def test_slow_request_hedged(self):
+        """Test that a slow GET is sent again and the faster response wins."""
+        transport = FakeTransport()
+        transport.add("GET", "articles/1", slow_calls(5))
+        with make_client(transport) as client:
+            for _ in range(5):
+                client.article.get_by_id(1)
+            start = time.perf_counter()
+            assert client.article.get_by_id(1)["data"]["id"] == 1
+            assert time.perf_counter() - start < 0.4
+            assert client.hedger.stats()["hedged"] == 1
+            assert client.hedger.stats()["hedge_wins"] == 1
+            assert len(transport.calls) == 7
+
+    def test_budget(self):
+        """Test that no more requests than the budget allows are hedged."""
+        transport = FakeTransport()
+        transport.add("GET", "articles/1", slow_calls(5, 6, delay=0.1))
+        with make_client(transport, budget=0.1) as client:
+            for _ in range(7):
+                client.article.get_by_id(1)
+            assert client.hedger.stats()["hedged"] == 0
+            assert len(transport.calls) == 7
+
+    def test_only_get(self):
+        """Test that requests other than JSON GETs are not hedged."""
+        transport = FakeTransport()
+        transport.add("PUT", "articles/1/archive", slow_calls(5, delay=0.05))
+        with make_client(transport) as client:
+            for _ in range(6):
+                client.article.archive(1)
+            assert client.hedger.requests == 0
+            assert len(transport.calls) == 6
+
+    def test_errors(self):
+        """Test that a failed attempt loses to a successful one and errors are raised otherwise."""
+        hedger = Hedger(min_samples=1, budget=1.0, min_delay=0.01)
+        hedger.latencies.add(0.01)
+        attempts = itertools.count()
+
+        def send():
+            if next(attempts) == 0:
+                time.sleep(0.05)
+                raise ServerError()
+            return "hedge"
+
+        assert hedger.call(send) == "hedge"
+
+        def fail():
+            time.sleep(0.02)
+            raise ServerError()
+
+        with pytest.raises(ServerError):
+            hedger.call(fail)
+        hedger.close()
+
+    def test_async(self):
+        """Test that hedging works from coroutines and the slower attempt is cancelled."""
+        hedger = Hedger(min_samples=1, budget=1.0, min_delay=0.01)
+        hedger.latencies.add(0.01)
+        delays = iter([1.0, 0.0])
+
+        async def send():
+            await asyncio.sleep(next(delays))
+            return "done"
+
+        start = time.perf_counter()
+        assert asyncio.run(hedger.call_async(send)) == "done"
+        assert time.perf_counter() - start < 0.5
+        assert hedger.hedge_wins == 1
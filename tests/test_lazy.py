@@ -0,0 +1,73 @@
+import time
+
+import pytest
+
+from src.vsesvit_ai.base.exceptions import ServerError
+from src.vsesvit_ai.lazy import LazyItem, LazyList
+
+
+pytestmark = pytest.mark.server(latency=0.02, records={"articles": 20})
+
+
+def detail_requests(server):
+    return [path for method, path in server.request_log if path.rsplit('/', 1)[-1].isdigit()]
+
+
+class TestLazyList:
+    """Test suite for lazy article proxies."""
+
+    def test_summary_fields_without_fetch(self, server, client):
+        """Test that reading summary fields doesn't fetch article details."""
+        page = client.article.get_list_lazy({"limit": 10})
+
+        assert isinstance(page, LazyList)
+        assert page.meta["total"] == 20
+        assert all(isinstance(item, LazyItem) for item in page)
+        assert [item.name for item in page] == [item["name"] for item in page]
+        assert {item.state for item in page} == {"content completed"}
+        assert not any(item.loaded for item in page)
+        assert detail_requests(server) == []
+
+    def test_content_fetched_once(self, server, client):
+        """Test that detail fields are fetched once and cached."""
+        page = client.article.get_list_lazy({"limit": 5}, batch=False)
+        article = page[0]
+
+        assert article.content.startswith("<h1>")
+        assert article["content"] == article.content
+        assert article.loaded
+        assert len(detail_requests(server)) == 1
+        assert article.get("missing", "default") == "default"
+        with pytest.raises(AttributeError):
+            article.missing_field
+
+    def test_page_batched(self, server, client):
+        """Test that detail access fetches the rest of the page in the background."""
+        page = client.article.get_list_lazy({"limit": 10}, max_workers=8)
+
+        started = time.perf_counter()
+        contents = [item.content for item in page]
+        elapsed = time.perf_counter() - started
+
+        assert all(content.startswith("<h1>") for content in contents)
+        assert len(detail_requests(server)) == 10
+        # Ten sequential requests would take at least 0.2 seconds
+        assert elapsed < 0.15
+
+    def test_failed_fetch_retried(self, server, client):
+        """Test that a failed background fetch is retried on the next access."""
+        page = client.article.get_list_lazy({"limit": 1})
+        server.fail_next(500, endpoint="articles/")
+
+        with pytest.raises(ServerError):
+            page[0].content
+        assert page[0].content.startswith("<h1>")
+
+    def test_models_client(self, make_client):
+        """Test lazy items with a client that has models enabled."""
+        with make_client(models=True) as client:
+            page = client.article.get_list_lazy({"limit": 2})
+            page.load_all()
+
+        assert all(item.loaded and item.content for item in page)
+        assert page[0].to_dict()["content"] == page[0].content
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+
+from src.vsesvit_ai.mirror import Mirror, MIRRORED_RESOURCES
+from src.vsesvit_ai.testing.state import format_timestamp
+
+
+pytestmark = pytest.mark.server(records={"projects": 3, "articles": 45, "landings": 7, "audiences": 2})
+
+
+class TestMirror:
+    """Test suite for the local SQLite mirror."""
+
+    def test_initial_sync(self, client, tmp_path):
+        """Test that the first sync mirrors every resource."""
+        with client.sync(store=str(tmp_path / "vsesvit.db"), page_size=10) as mirror:
+            assert mirror.stats["articles"]["records"] == 45
+            assert mirror.count("projects") == 3
+            assert mirror.count("articles") == 45
+            assert mirror.count("landings") == 7
+            assert mirror.count("smart-tables") == 0
+            assert set(mirror.stats) == set(MIRRORED_RESOURCES)
+
+    def test_queries(self, client):
+        """Test indexed queries against the mirror."""
+        mirror = client.sync(store=":memory:")
+        project_id = mirror.query("projects")[0]["id"]
+
+        by_project = mirror.query("articles", project_id=project_id)
+        assert by_project and all(article["projectId"] == project_id for article in by_project)
+        assert mirror.count("articles", language="uk") == 9
+        assert mirror.count("articles", state="content completed") == 45
+        assert len(mirror.query("articles", limit=5)) == 5
+        assert mirror.get("articles", by_project[0]["id"]) == by_project[0]
+        assert mirror.get("articles", 1) is None
+
+    def test_incremental_sync(self, server, client, tmp_path):
+        """Test that later syncs fetch only changed records."""
+        path = str(tmp_path / "vsesvit.db")
+        # Seeded records share one second; records tying the watermark are all compared
+        for records in server.state.records.values():
+            for age, record in enumerate(sorted(records.values(), key=lambda r: -r["id"]), start=1):
+                record["updatedAt"] = format_timestamp(time.time() - 60 - age)
+        client.sync(store=path, page_size=10).close()
+
+        server.request_log.clear()
+        with client.sync(store=path, page_size=10) as mirror:
+            assert sum(stats["records"] for stats in mirror.stats.values()) == 0
+        # One page per resource for active and archived records
+        assert len(server.request_log) == 2 * len(MIRRORED_RESOURCES)
+
+        article = server.state.create("articles", {"projectId": 1, "name": "Fresh", "brief": "b"}, completed=True)
+        archived_id = client.article.get_list({"limit": 1})["data"][0]["id"]
+        client.article.archive(archived_id)
+
+        with client.sync(store=path, page_size=10, resources=["articles"]) as mirror:
+            assert mirror.stats["articles"]["records"] == 2
+            assert mirror.get("articles", article["id"])["name"] == "Fresh"
+            assert mirror.count("articles") == 46
+            assert mirror.count("articles", archived=True) == 1
+            assert mirror.get("articles", archived_id)["archived"] is True
+
+    def test_changes_tying_the_watermark(self, server, client, tmp_path):
+        """Test that a record updated within the second of the watermark is synced."""
+        path = str(tmp_path / "vsesvit.db")
+        client.sync(store=path, resources=["articles"]).close()
+        watermark = "2099-01-01 00:00:00"
+        # Ties are listed by descending ID, so the unchanged record comes first
+        changed_id, unchanged_id = sorted(server.state.records["articles"])[:2]
+        server.state.records["articles"][unchanged_id]["updatedAt"] = watermark
+        client.sync(store=path, resources=["articles"]).close()
+
+        server.state.records["articles"][changed_id].update(name="Renamed", updatedAt=watermark)
+
+        with client.sync(store=path, resources=["articles"]) as mirror:
+            assert mirror.stats["articles"]["records"] == 1
+            assert mirror.get("articles", changed_id)["name"] == "Renamed"
+
+    def test_mirror_instance(self, client):
+        """Test syncing into an open mirror."""
+        mirror = Mirror(":memory:")
+        assert client.sync(store=mirror, resources=["audiences"]) is mirror
+        assert mirror.count("audiences") == 2
+        assert set(mirror.watermarks()) == {"audiences:archived=0", "audiences:archived=1"}
@@ -0,0 +1,131 @@
+import json
+import pickle
+import tracemalloc
+from datetime import datetime
+
+import pytest
+
+from src.vsesvit_ai.models import ArticleModel, ModelList, ProjectModel, UserModel, ReferralModel, Model
+
+
+def make_item(i):
+    return {
+        "id": i,
+        "name": f"Article {i}",
+        "projectId": 7,
+        "language": "en",
+        "state": "content completed",
+        "archived": False,
+        "createdAt": "2025-04-28 08:36:47",
+        "updatedAt": "2025-04-28 09:27:44",
+    }
+
+
+pytestmark = [
+    pytest.mark.server(records={"projects": 2, "articles": 25, "referrals": 3}),
+    pytest.mark.client(models=True),
+]
+
+
+class TestModels:
+    """Test suite for the compact typed response models."""
+
+    def test_fields(self):
+        """Test attribute access, raw access and lazy decoding."""
+        article = ArticleModel(dict(make_item(1), content="<p>Hi</p>", extra={"a": 1}))
+
+        assert article.id == 1
+        assert article.name == "Article 1"
+        assert article.project_id == 7
+        assert article.content == "<p>Hi</p>"
+        assert article.created_at == datetime(2025, 4, 28, 8, 36, 47)
+        assert article["createdAt"] == "2025-04-28 08:36:47"
+        assert article.get("extra") == {"a": 1}
+        assert article.keywords is None
+        assert "extra" in article
+        with pytest.raises(KeyError):
+            article["missing"]
+
+    def test_shape_shared(self):
+        """Test that records with the same fields share one shape."""
+        first, second = ArticleModel(make_item(1)), ArticleModel(make_item(2))
+        assert first._shape is second._shape
+        assert first.state is second.state
+
+    def test_immutable(self):
+        """Test that models don't get a per-instance __dict__."""
+        article = ArticleModel(make_item(1))
+        with pytest.raises(AttributeError):
+            article.foo = 1
+
+    def test_round_trip(self):
+        """Test conversion back to dictionaries and pickling."""
+        page = ModelList.from_response({"data": [make_item(1), make_item(2)], "meta": {"total": 2}}, ArticleModel)
+
+        assert page.to_dicts() == [make_item(1), make_item(2)]
+        restored = pickle.loads(pickle.dumps(page))
+        assert restored == page
+        assert restored.meta == {"total": 2}
+
+    def test_memory(self):
+        """Test that a model list takes much less memory than the raw dictionaries."""
+        def measure(build):
+            tracemalloc.start()
+            items = build()
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del items
+            return size
+
+        body = json.dumps({"data": [make_item(i) for i in range(5000)], "meta": {"total": 5000}})
+        raw_size = measure(lambda: json.loads(body)["data"])
+        model_size = measure(lambda: ModelList.from_response(json.loads(body), ArticleModel))
+
+        assert model_size < raw_size * 0.7
+
+    def test_disabled_by_default(self, make_client):
+        """Test that resources return dictionaries unless models are enabled."""
+        with make_client() as client:
+            assert isinstance(client.article.get_list(), dict)
+
+    def test_get_list(self, client):
+        """Test get_list pages as model lists."""
+        page = client.article.get_list({"limit": 10})
+
+        assert isinstance(page, ModelList)
+        assert len(page) == 10
+        assert page.total == 25
+        assert all(isinstance(item, ArticleModel) for item in page)
+
+        page.extend(client.article.get_list({"limit": 10, "page": 2}))
+        assert len(page) == 20
+        assert page.meta["current_page"] == 2
+
+    def test_get_by_id(self, client):
+        """Test single records as models."""
+        article_id = client.article.get_list({"limit": 1})[0].id
+        article = client.article.get_by_id(article_id)
+
+        assert isinstance(article, ArticleModel)
+        assert article.content.startswith("<h1>")
+        assert isinstance(client.project.get_list()[0], ProjectModel)
+
+    def test_user(self, client):
+        """Test user endpoints as models."""
+        assert isinstance(client.user.get_me(), UserModel)
+        referrals = client.user.get_referrals({"limit": 10})
+        assert len(referrals) == 3
+        assert all(isinstance(item, ReferralModel) for item in referrals)
+
+    def test_download_unchanged(self, client):
+        """Test that binary responses are not wrapped."""
+        article_id = client.article.get_list({"limit": 1})[0].id
+        assert isinstance(client.article.download(article_id, "pdf"), bytes)
+
+    def test_all_resources(self, client):
+        """Test that every list endpoint returns models."""
+        for resource in (client.project, client.landing, client.smart_table, client.knowledge_base,
+                         client.author, client.audience):
+            page = resource.get_list()
+            assert isinstance(page, ModelList)
+            assert all(isinstance(item, Model) for item in page)
@@ -0,0 +1,170 @@
+import time
+
+import pytest
+
+from src.vsesvit_ai.base.exceptions import (
+    JobFailedError,
+    NetworkError,
+    PipelineError,
+    RateLimitError,
+    ServerError,
+    ValidationError,
+)
+
+
+pytestmark = pytest.mark.server(job_duration=0.1)
+
+
+def flaky(failures, error):
+    calls = []
+
+    def call():
+        calls.append(time.monotonic())
+        if len(calls) <= failures:
+            raise error
+        return len(calls)
+
+    return call
+
+
+class TestPipeline:
+    """Test suite for dependency-aware pipelines."""
+
+    def test_content_flow(self, server, client):
+        """Test that created IDs flow into dependent steps, which start once their dependencies are ready."""
+        project_id = client.project.create('Campaign', 'Pipeline')['data']['id']
+        pipeline = client.pipeline(poll_interval=0.02)
+        kb = pipeline.knowledge_base('kb', project_id, 'Docs', 'Product docs',
+                                     {'sources': [{'url': 'https://example.com/docs'}]})
+        author = pipeline.author('author', project_id, 'Jane', 'Technical writer')
+        audience = pipeline.audience('audience', project_id, 'Developers')
+        post = pipeline.article('post', project_id, 'Guide', 'Getting started',
+                                {'knowledgeIds': [kb.id], 'authorId': author.id, 'audienceId': audience.id})
+        pipeline.step('docx', client.article.download, post.id, 'docx')
+
+        results = pipeline.run()
+
+        assert results['kb']['state'] == 'ready'
+        assert results['post']['state'] == 'content completed'
+        assert results['post']['authorId'] == results['author']['id']
+        assert results['post']['knowledgeIds'] == [results['kb']['id']]
+        assert isinstance(results['docx'], bytes)
+        assert post.depends == {'kb', 'author', 'audience'}
+
+    def test_independent_steps_run_in_parallel(self, client):
+        """Test that steps without dependencies between them run at the same time."""
+        pipeline = client.pipeline()
+        for name in ('a', 'b', 'c'):
+            pipeline.step(name, time.sleep, 0.2)
+        pipeline.step('d', lambda *_: 'done', after=[pipeline.steps['a']])
+
+        started = time.monotonic()
+        results = pipeline.run()
+
+        assert time.monotonic() - started < 0.4
+        assert results['d'] == 'done'
+
+    def test_retries(self, client):
+        """Test that temporary errors are retried with backoff and client errors are not."""
+        pipeline = client.pipeline(retries=2, retry_delay=0.01)
+        pipeline.step('flaky', flaky(2, ServerError()))
+        invalid = pipeline.step('invalid', flaky(1, ValidationError()))
+
+        with pytest.raises(PipelineError) as error:
+            pipeline.run()
+
+        assert error.value.results == {'flaky': 3}
+        assert isinstance(error.value.errors['invalid'], ValidationError)
+        assert invalid.attempts == 1
+
+    def test_failure_skips_dependents(self, client):
+        """Test that steps depending on a failed step are skipped and reported."""
+        pipeline = client.pipeline(retries=0)
+        failed = pipeline.step('failed', flaky(1, ServerError()))
+        child = pipeline.step('child', lambda value: value, failed.result)
+        pipeline.step('grandchild', lambda value: value, child.result)
+        pipeline.step('other', lambda: 'ok')
+
+        with pytest.raises(PipelineError) as error:
+            pipeline.run()
+
+        assert list(error.value.errors) == ['failed']
+        assert error.value.skipped == ['child', 'grandchild']
+        assert error.value.results == {'other': 'ok'}
+
+    def test_unknown_job_state_waits(self, client, monkeypatch):
+        """Test that a record in a state the SDK doesn't know is polled until it's ready or the timeout."""
+        states = iter(['queued', 'queued', 'ready'])
+        monkeypatch.setattr(client.author, 'create', lambda *args, **kwargs: {'data': {'id': 7, 'state': 'queued'}})
+        monkeypatch.setattr(client.author, 'get_by_id', lambda record_id: {'data': {'id': 7, 'state': next(states)}})
+        pipeline = client.pipeline(retries=0, poll_interval=0.01)
+        pipeline.author('author', 1, 'Jane', 'Technical writer')
+
+        assert pipeline.run()['author']['state'] == 'ready'
+
+        stuck = client.pipeline(retries=0, poll_interval=0.01, timeout=0.05)
+        stuck.author('author', 1, 'Jane', 'Technical writer')
+        monkeypatch.setattr(client.author, 'get_by_id', lambda record_id: {'data': {'id': 7, 'state': 'queued'}})
+        with pytest.raises(PipelineError) as error:
+            stuck.run()
+
+        assert isinstance(error.value.errors['author'], TimeoutError)
+        assert pipeline.timeout == 1800.0
+
+    @pytest.mark.parametrize("error, sent", [
+        (NetworkError(connect=True), 3),
+        (RateLimitError(), 3),
+        (NetworkError(connect=False), 1),
+        (ServerError(), 1),
+    ])
+    def test_create_sent_again_only_if_not_received(self, client, monkeypatch, error, sent):
+        """Test that a create request is only sent again when it can't have reached the API."""
+        calls = []
+
+        def create(*args, **kwargs):
+            calls.append(args)
+            if len(calls) < 3:
+                raise error
+            return {'data': {'id': 7, 'state': 'ready'}}
+
+        monkeypatch.setattr(client.author, 'create', create)
+        pipeline = client.pipeline(retries=2, retry_delay=0.01)
+        pipeline.author('author', 1, 'Jane', 'Technical writer')
+
+        if sent == 3:
+            assert pipeline.run()['author']['id'] == 7
+        else:
+            with pytest.raises(PipelineError):
+                pipeline.run()
+        assert len(calls) == sent
+
+    def test_failed_job(self, client, monkeypatch):
+        """Test that a failed job fails the step, and is only replaced when records are reused."""
+        records = iter([{'id': 7, 'state': 'failed'}, {'id': 8, 'state': 'ready'}])
+        monkeypatch.setattr(client.author, 'create', lambda *args, **kwargs: {'data': next(records)})
+        pipeline = client.pipeline(retries=2, retry_delay=0.01)
+        pipeline.author('author', 1, 'Jane', 'Technical writer')
+
+        with pytest.raises(PipelineError) as error:
+            pipeline.run()
+
+        assert isinstance(error.value.errors['author'], JobFailedError)
+        assert pipeline.steps['author'].attempts == 1
+
+        records = iter([{'id': 9, 'state': 'failed'}, {'id': 10, 'state': 'ready'}])
+        monkeypatch.setattr(client.author, 'get_or_create', lambda *args, **kwargs: ({'data': next(records)}, True))
+        reusing = client.pipeline(retries=2, retry_delay=0.01, reuse=True)
+        reusing.author('author', 1, 'Jane', 'Technical writer')
+
+        assert reusing.run()['author']['id'] == 10
+
+    def test_invalid_graph(self, client):
+        """Test that duplicate names and steps of other pipelines are rejected."""
+        pipeline = client.pipeline()
+        pipeline.step('a', lambda: 1)
+        with pytest.raises(ValueError):
+            pipeline.step('a', lambda: 2)
+
+        foreign = client.pipeline().step('foreign', lambda: 1)
+        with pytest.raises(ValueError):
+            pipeline.step('b', lambda value: value, foreign.id)
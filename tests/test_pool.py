@@ -0,0 +1,105 @@
+import pytest
+
+from src.vsesvit_ai.base.exceptions import AuthenticationError, RateLimitError, ResourceNotFoundError
+from src.vsesvit_ai.pool import TokenBucket, VsesvitAIPool
+from src.vsesvit_ai.testing import StubServer
+from src.vsesvit_ai.transport import PooledTransport
+
+KEYS = [f"vsa_pool_key_{index}_0123456789abc" for index in range(3)]
+
+
+@pytest.fixture
+def server():
+    """Starts a stub API server where records belong to the key that created them."""
+    with StubServer(key_scoped=True) as stub:
+        stub.state.seed(projects=1, articles=5)
+        yield stub
+
+
+def make_pool(server, keys=KEYS, **kwargs):
+    return VsesvitAIPool(api_keys=keys, base_url=server.base_url, transport=PooledTransport(), **kwargs)
+
+
+class TestVsesvitAIPool:
+    """Test suite for the multi-key client pool."""
+
+    def test_round_robin(self, server):
+        """Test that requests without a resource ID are spread across keys."""
+        with make_pool(server) as pool:
+            for _ in range(9):
+                pool.project.get_list()
+            assert [key["requests"] for key in pool.health()] == [3, 3, 3]
+
+    def test_sticky_routing(self, server):
+        """Test that requests for a resource go to the key that created it."""
+        with make_pool(server) as pool:
+            project_id = pool.project.get_list()["data"][0]["id"]
+            ids = [pool.article.create(project_id, f"Article {index}", "Brief")["data"]["id"] for index in range(6)]
+            server.request_log.clear()
+            for article_id in ids:
+                assert pool.article.get_by_id(article_id)["data"]["id"] == article_id
+            # No request was denied access
+            assert len(server.request_log) == len(ids)
+
+    def test_owner_discovery(self, server):
+        """Test that the owner of an unknown resource is found and remembered."""
+        with make_pool(server) as pool:
+            project_id = pool.project.get_list()["data"][0]["id"]
+            article_id = pool.article.create(project_id, "Owned", "Brief")["data"]["id"]
+
+        with make_pool(server, keys=list(reversed(KEYS))) as pool:
+            server.request_log.clear()
+            pool.article.get_by_id(article_id)
+            assert len(server.request_log) > 1
+
+            server.request_log.clear()
+            pool.article.archive(article_id)
+            assert len(server.request_log) == 1
+
+            with pytest.raises(ResourceNotFoundError):
+                pool.article.get_by_id(999999)
+
+    def test_rate_limited_key(self, server):
+        """Test that a key answered with 429 cools down and the request moves on."""
+        with make_pool(server) as pool:
+            server.fail_next(429, endpoint="projects", retry_after=30, api_key=KEYS[0])
+            assert pool.project.get_list()["data"]
+
+            health = pool.health()
+            assert health[0]["rate_limited"] == 1 and health[0]["cooldown"] > 0
+            for _ in range(4):
+                pool.project.get_list()
+            assert pool.health()[0]["requests"] == 1
+
+    def test_all_keys_rate_limited(self, server):
+        """Test that RateLimitError is raised when no key becomes available in time."""
+        with make_pool(server, keys=KEYS[:2], max_wait=0) as pool:
+            for key in KEYS[:2]:
+                server.fail_next(429, endpoint="projects", retry_after=30, api_key=key)
+            with pytest.raises(RateLimitError):
+                pool.project.get_list()
+
+    def test_invalid_key_disabled(self):
+        """Test that keys rejected by the API are taken out of rotation."""
+        with StubServer(api_keys=KEYS[1:]) as server:
+            with make_pool(server) as pool:
+                for _ in range(4):
+                    pool.project.get_list()
+                assert [key["disabled"] for key in pool.health()] == [True, False, False]
+
+            with make_pool(server, keys=KEYS[:1]) as pool:
+                with pytest.raises(AuthenticationError):
+                    pool.project.get_list()
+
+    def test_key_rate_limit(self, server):
+        """Test that every key has its own token bucket."""
+        bucket = TokenBucket(rate=1, burst=2)
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == 0
+        assert 0 < bucket.try_acquire() <= 1
+
+        with make_pool(server, rate_limit=1, burst=1, max_wait=0) as pool:
+            for _ in range(3):
+                pool.project.get_list()
+            with pytest.raises(RateLimitError):
+                pool.project.get_list()
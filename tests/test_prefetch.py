@@ -0,0 +1,89 @@
+import time
+
+import pytest
+
+from src.vsesvit_ai.prefetch import Prefetcher
+
+
+pytestmark = pytest.mark.server(records={'projects': 1, 'articles': 10})
+
+
+def requests_to(server, path):
+    return sum(1 for _, logged in server.request_log if logged.endswith(path))
+
+
+class TestPrefetch:
+    """Test suite for background prefetch of detail records."""
+
+    def test_detail_is_prefetched(self, make_client, server):
+        """Test that get_by_id for a top item of a list uses the prefetched response."""
+        client = make_client(prefetch=2)
+        items = client.article.get_list()['data']
+
+        detail = client.article.get_by_id(items[0]['id'])
+        client.article.get_by_id(items[1]['id'])
+
+        assert detail['data']['id'] == items[0]['id']
+        assert requests_to(server, f"/articles/{items[0]['id']}") == 1
+        assert requests_to(server, f"/articles/{items[1]['id']}") == 1
+        assert client.prefetcher.stats()['used'] == 2
+        client.close()
+
+    def test_other_items_are_fetched(self, make_client, server):
+        """Test that items below the top are fetched on demand only."""
+        client = make_client(prefetch=1)
+        items = client.article.get_list()['data']
+
+        client.article.get_by_id(items[3]['id'])
+
+        assert requests_to(server, f"/articles/{items[2]['id']}") == 0
+        assert requests_to(server, f"/articles/{items[3]['id']}") == 1
+        assert client.prefetcher.stats() == {'prefetched': 1, 'used': 0, 'dropped': 0, 'pending': 1}
+        client.close()
+
+    def test_new_page_drops_unused(self, make_client, server):
+        """Test that a new list page replaces the unused prefetches of the previous one."""
+        client = make_client(prefetch=Prefetcher(top=3))
+        first = client.article.get_list(params={'page': 1, 'limit': 5})['data']
+        client.article.get_list(params={'page': 2, 'limit': 5})
+
+        assert client.prefetcher.stats()['dropped'] == 3
+        client.article.get_by_id(first[0]['id'])
+        assert client.prefetcher.stats()['used'] == 0
+        client.close()
+
+    def test_expired_prefetch_is_not_used(self, make_client, server):
+        """Test that prefetched responses older than the TTL are dropped."""
+        client = make_client(prefetch=Prefetcher(top=1, ttl=0.05))
+        item = client.article.get_list()['data'][0]
+        time.sleep(0.1)
+
+        client.article.get_by_id(item['id'])
+
+        assert requests_to(server, f"/articles/{item['id']}") == 2
+        assert client.prefetcher.stats()['dropped'] == 1
+        client.close()
+
+    def test_failed_prefetch_is_sent_again(self, make_client, server):
+        """Test that a failed prefetch doesn't fail the get_by_id call that follows."""
+        client = make_client(prefetch=1)
+        item = client.article.get_list(params={'limit': 1})['data'][0]
+        client.article.get_by_id(item['id'])
+        server.fail_next(503, times=1, endpoint=f"articles/{item['id']}")
+        client.article.get_list(params={'limit': 1})
+
+        assert client.article.get_by_id(item['id'])['data']['id'] == item['id']
+        assert requests_to(server, f"/articles/{item['id']}") == 3
+        assert client.prefetcher.stats()['used'] == 1
+        client.close()
+
+    def test_write_drops_prefetch(self, make_client, server):
+        """Test that get_by_id after archive() returns the archived record, not the prefetched one."""
+        client = make_client(prefetch=1)
+        item = client.article.get_list()['data'][0]
+
+        client.article.archive(item['id'])
+
+        assert client.article.get_by_id(item['id'])['data']['archived'] is True
+        assert client.prefetcher.stats()['dropped'] == 1
+        client.close()
@@ -0,0 +1,117 @@
+import socket
+
+import pytest
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.base.exceptions import NetworkError, ResourceNotFoundError, ServerError
+from src.vsesvit_ai.routing import EndpointRouter
+from src.vsesvit_ai.testing import StubServer
+from src.vsesvit_ai.transport import PooledTransport
+
+
+def closed_url():
+    """Return the URL of a local port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/api/v1"
+
+
+@pytest.fixture
+def servers():
+    """Starts a slow and a fast stub API server."""
+    with StubServer(latency=0.03) as slow, StubServer() as fast:
+        for stub in (slow, fast):
+            stub.state.seed(projects=1, articles=3)
+        yield slow, fast
+
+
+def make_client(urls, **kwargs):
+    return VsesvitAI(api_key=StubServer.api_key, base_url=urls, transport=PooledTransport(), **kwargs)
+
+
+class TestEndpointRouter:
+    """Test suite for multi-endpoint routing and failover."""
+
+    def test_single_url(self):
+        """Test that a single base URL doesn't use a router."""
+        client = VsesvitAI(api_key=StubServer.api_key, base_url="https://test.vsesvit.ai/api/v1/")
+        assert client.router is None
+        assert client.base_url == "https://test.vsesvit.ai/api/v1"
+
+    def test_fastest_endpoint(self, servers):
+        """Test that requests go to the endpoint with the lowest latency."""
+        slow, fast = servers
+        with make_client([slow.base_url, fast.base_url]) as client:
+            for _ in range(20):
+                client.project.get_list()
+            slow_stats, fast_stats = client.router.stats()
+            assert slow_stats["requests"] == 1
+            assert fast_stats["requests"] == 19
+            assert slow_stats["latency"] > fast_stats["latency"]
+
+    def test_network_failover(self, servers):
+        """Test that requests fail over from an unreachable endpoint."""
+        _, fast = servers
+        with make_client([closed_url(), fast.base_url], failover_cooldown=60) as client:
+            for _ in range(5):
+                assert client.project.get_list()["data"]
+            # The endpoint that only failed so far is tried last
+            dead, _ = client.router.stats()
+            assert dead["failures"] == 1
+            assert dead["requests"] == 1
+
+        with make_client([closed_url(), closed_url()]) as client:
+            with pytest.raises(NetworkError):
+                client.project.get_list()
+
+    def test_server_error_failover(self, servers):
+        """Test that server errors fail over, except for requests that aren't idempotent."""
+        slow, fast = servers
+        with make_client([fast.base_url, slow.base_url]) as client:
+            fast.fail_next(503, times=1, endpoint="projects")
+            assert client.project.get_list()["data"]
+            assert client.router.stats()[0]["failures"] == 1
+
+            for stub in servers:
+                stub.fail_next(503, times=1, endpoint="articles/create")
+                stub.request_log.clear()
+            with pytest.raises(ServerError):
+                client.article.create(1, "Name", "Brief")
+            assert len(slow.request_log) + len(fast.request_log) == 1
+
+            # Client errors are not failed over
+            with pytest.raises(ResourceNotFoundError):
+                client.article.get_by_id(999999)
+
+    def test_post_failover_only_on_connect_errors(self, servers):
+        """Test that a POST fails over if it couldn't connect, but not after a read timeout."""
+        slow, fast = servers
+        project_id = sorted(fast.state.records["projects"])[0]
+        with make_client([closed_url(), fast.base_url]) as client:
+            assert client.article.create(project_id, "Name", "Brief")["success"]
+
+        slow.latency = 0.5
+        fast.request_log.clear()
+        with make_client([slow.base_url, fast.base_url]) as client:
+            with pytest.raises(NetworkError) as error:
+                client.request("POST", "articles/create", timeout=0.1,
+                               data={"projectId": project_id, "name": "Name", "brief": "Brief"})
+            assert not error.value.connect
+            assert not fast.request_log
+
+    def test_cool_down(self):
+        """Test that repeatedly failing endpoints cool down and are tried again afterwards."""
+        router = EndpointRouter(["a", "b"], cooldown=60, max_failures=2, probe_every=0)
+        a, b = router.endpoints
+        router.record_success(a, 0.01)
+        router.record_success(b, 0.1)
+        router.record_failure(a)
+        assert router.select()[0] is a
+        router.record_failure(a)
+        assert router.select() == [b, a]
+        assert router.stats()[0]["cooldown"] > 0
+
+        a.open_until = 0.0
+        router.record_success(a, 0.01)
+        assert router.select()[0] is a
@@ -0,0 +1,110 @@
+import threading
+import time
+
+import pytest
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.concurrency import AIMDController
+from src.vsesvit_ai.scheduling import Scheduler, current_priority, priority
+from src.vsesvit_ai.testing import StubServer
+from src.vsesvit_ai.transport import PooledTransport
+
+
+def start_blocked(scheduler, release, name):
+    """Start a request that holds its slot until release is set."""
+    thread = threading.Thread(target=scheduler.call, args=(release.wait, name))
+    thread.start()
+    return thread
+
+
+def wait_for(condition, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+class TestScheduler:
+    """Test suite for priority scheduling."""
+
+    def test_priority_order(self):
+        """Test that waiting requests are admitted by priority, then in arrival order."""
+        scheduler = Scheduler(max_concurrency=1)
+        release = threading.Event()
+        holder = start_blocked(scheduler, release, "default")
+        wait_for(lambda: scheduler.in_flight == 1)
+
+        order = []
+        threads = []
+        for name in ("batch", "batch", "interactive", "default"):
+            thread = threading.Thread(target=scheduler.call, args=(lambda n=name: order.append(n), name))
+            thread.start()
+            threads.append(thread)
+            wait_for(lambda: sum(scheduler.stats()["waiting"].values()) == len(threads))
+
+        release.set()
+        for thread in [holder] + threads:
+            thread.join()
+        assert order == ["interactive", "default", "batch", "batch"]
+
+    def test_quota(self):
+        """Test that a class at its quota doesn't take the remaining capacity."""
+        scheduler = Scheduler(max_concurrency=4, quotas={"batch": 0.5})
+        release = threading.Event()
+        threads = [start_blocked(scheduler, release, "batch") for _ in range(3)]
+        wait_for(lambda: scheduler.stats()["waiting"]["batch"] == 1)
+        assert scheduler.active["batch"] == 2
+
+        # Interactive requests use the capacity left by the quota
+        assert scheduler.call(lambda: "ok", "interactive") == "ok"
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert scheduler.served == {"interactive": 1, "default": 0, "batch": 3}
+
+        with pytest.raises(ValueError):
+            Scheduler(quotas={"bulk": 0.5})
+
+    def test_rate_limit(self):
+        """Test that the rate limit spaces out requests."""
+        scheduler = Scheduler(max_concurrency=4, rate_limit=50, burst=1)
+        start = time.perf_counter()
+        for _ in range(4):
+            scheduler.call(lambda: None)
+        assert time.perf_counter() - start >= 0.05
+
+        scheduler = Scheduler(max_concurrency=1, timeout=0.01)
+        release = threading.Event()
+        holder = start_blocked(scheduler, release, "default")
+        wait_for(lambda: scheduler.in_flight == 1)
+        with pytest.raises(TimeoutError):
+            scheduler.call(lambda: None)
+        release.set()
+        holder.join()
+
+    def test_adaptive_capacity(self):
+        """Test that the capacity follows an AIMDController."""
+        controller = AIMDController(initial=2, max_limit=3, latency_tolerance=100)
+        scheduler = Scheduler(max_concurrency=controller)
+        assert scheduler.capacity == 2
+        for _ in range(3):
+            scheduler.call(lambda: time.sleep(0.001))
+        assert scheduler.capacity == 3
+
+    def test_client_priority(self):
+        """Test that the client priority context reaches the scheduler and worker threads."""
+        with StubServer() as server:
+            server.state.seed(projects=1)
+            with VsesvitAI(api_key=server.api_key, base_url=server.base_url, transport=PooledTransport(),
+                           scheduler=True) as client:
+                client.project.get_list()
+                with client.priority("batch"):
+                    assert current_priority() == "batch"
+                    client.submit(client.project.get_list).result()
+                client.request("GET", "projects", priority="interactive")
+                assert client.scheduler.served == {"interactive": 1, "default": 1, "batch": 1}
+                assert current_priority() == "default"
+
+        with pytest.raises(ValueError):
+            with priority("urgent"):
+                pass
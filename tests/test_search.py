@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from src.vsesvit_ai.search import ContentIndex, html_to_text
+from src.vsesvit_ai.testing.state import format_timestamp
+
+
+pytestmark = pytest.mark.server(content_size=2000, records={"projects": 2, "articles": 30})
+
+
+class TestContentIndex:
+    """Test suite for the local full-text search index."""
+
+    def test_html_to_text(self):
+        """Test HTML to plain text conversion."""
+        html = "<h1>Title</h1><script>var x = 1;</script><p>First &amp; <b>bold</b></p><ul><li>One</li></ul>"
+        assert html_to_text(html) == "Title\nFirst & bold\nOne"
+
+    def test_search(self, server, client):
+        """Test indexing and searching article content."""
+        article = server.state.create("articles", {"projectId": 1, "name": "Zebrafish husbandry", "brief": "b"},
+                                      completed=True)
+        with ContentIndex(":memory:") as index:
+            stats = index.update(client, page_size=10)
+            assert stats["articles"] == 31
+            assert index.count() == 31
+
+            results = index.search("zebrafish")
+            assert [result["id"] for result in results] == [article["id"]]
+            assert "[Zebrafish]" in results[0]["snippet"]
+
+            assert len(index.search("python", limit=5)) == 5
+            assert index.search("python", language="de")
+            assert index.search("nonexistentword") == []
+
+    def test_incremental_update(self, server, client, tmp_path):
+        """Test that updates only fetch changed articles."""
+        path = str(tmp_path / "search.db")
+        # Seeded articles share one second; articles tying the watermark are all compared
+        for age, article in enumerate(sorted(server.state.records["articles"].values(), key=lambda r: -r["id"])):
+            article["updatedAt"] = format_timestamp(time.time() - 60 - age)
+        with ContentIndex(path) as index:
+            index.update(client, page_size=10)
+
+        server.request_log.clear()
+        server.state.create("articles", {"projectId": 1, "name": "Quokka guide", "brief": "b"}, completed=True)
+        with ContentIndex(path) as index:
+            assert index.update(client, page_size=10)["articles"] == 1
+            assert index.search("quokka")
+
+        # One list page of active and archived articles each, and one detail request
+        assert len(server.request_log) == 3
+
+    def test_archived_since_update(self, server, client):
+        """Test that articles archived after they were indexed are removed from the index."""
+        article = server.state.create("articles", {"projectId": 1, "name": "Axolotl care", "brief": "b"},
+                                      completed=True)
+        with ContentIndex(":memory:") as index:
+            index.update(client)
+            assert index.search("axolotl")
+
+            client.article.archive(article["id"])
+            stats = index.update(client)
+
+            assert stats["removed"] == 1
+            assert index.search("axolotl") == []
+            assert index.count() == 30
+            assert index.update(client, include_archived=True)["articles"] == 1
+            assert index.search("axolotl")
+
+    def test_archived(self, server, client):
+        """Test that archived articles are only indexed on request."""
+        archived_id = client.article.get_list({"limit": 1})["data"][0]["id"]
+        client.article.archive(archived_id)
+
+        with ContentIndex(":memory:") as index:
+            assert index.update(client)["articles"] == 29
+            assert index.update(client, include_archived=True)["articles"] == 1
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+
+from src.vsesvit_ai import config
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.transport.requests_transport import RequestsTransport
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code: str, cwd: str = ROOT) -> str:
+    """Runs code in a fresh interpreter with the repository on sys.path."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.pop('API_BASE_URL', None)
+    return subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env,
+                          capture_output=True, text=True, check=True).stdout.strip()
+
+
+class TestStartup:
+    """Test suite for lazy imports and cheap client construction."""
+
+    def test_import_does_not_load_heavy_modules(self):
+        """Test that importing the package and building a client stays lightweight."""
+        output = run_python(
+            "import sys\n"
+            "from src.vsesvit_ai import VsesvitAI\n"
+            "VsesvitAI(api_key='vsa_test')\n"
+            "print(sorted(m for m in ('requests', 'dotenv', 'httpx', 'asyncio') if m in sys.modules))"
+        )
+        assert output == "[]"
+
+    def test_dotenv_is_opt_in(self, tmp_path):
+        """Test that .env files are only loaded on request."""
+        (tmp_path / ".env").write_text("API_BASE_URL=https://env.vsesvit.ai/api/v1\n")
+        code = (
+            "from src.vsesvit_ai import VsesvitAI\n"
+            "print(VsesvitAI(api_key='vsa_test').base_url)\n"
+            "print(VsesvitAI(api_key='vsa_test', load_env=True).base_url)"
+        )
+        default_url, env_url = run_python(code, cwd=str(tmp_path)).splitlines()
+
+        assert default_url == config.DEFAULT_API_BASE_URL
+        assert env_url == "https://env.vsesvit.ai/api/v1"
+
+    def test_lazy_resources(self):
+        """Test that resources and the default transport are created on first access."""
+        client = VsesvitAI(api_key="vsa_test")
+
+        assert "article" not in client.__dict__
+        assert client._transport is None
+        assert client.article is client.article
+        assert client.article.client is client
+        assert isinstance(client.transport, RequestsTransport)
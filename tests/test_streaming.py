@@ -0,0 +1,145 @@
+import json
+
+import pytest
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.base.exceptions import VsesvitAIError, ServerError
+from src.vsesvit_ai.models import ArticleModel
+from src.vsesvit_ai.streaming import iter_items
+from src.vsesvit_ai.transport import FakeTransport, PooledTransport, RequestsTransport, AsyncTransport
+
+API_KEY = "vsa_test_key123456789012345678901234"
+BASE_URL = "https://test.vsesvit.ai/api/v1"
+
+
+def chunked(body, size):
+    data = body.encode("utf-8") if isinstance(body, str) else body
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+pytestmark = pytest.mark.server(records={"articles": 120})
+
+
+class TestIterItems:
+    """Test suite for the incremental list parser."""
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 64, 100000])
+    def test_chunk_sizes(self, size):
+        """Test that items are parsed correctly regardless of chunk boundaries."""
+        response = {
+            "success": True,
+            "data": [{"id": i, "name": f"Стаття {i} ✓", "score": i * 1.5, "tags": ["a", None, False]}
+                     for i in range(50)],
+            "meta": {"current_page": 1, "last_page": 1, "total": 12345},
+        }
+        fields = {}
+        items = list(iter_items(chunked(json.dumps(response, indent=1, ensure_ascii=False), size), fields))
+
+        assert items == response["data"]
+        assert fields == {"success": True, "meta": response["meta"]}
+
+    def test_meta_before_data(self):
+        """Test a response with data as the last field."""
+        fields = {}
+        body = '{"meta": {"total": 10}, "data": [1, 22, 333]}'
+        assert list(iter_items(chunked(body, 2), fields)) == [1, 22, 333]
+        assert fields == {"meta": {"total": 10}}
+
+    def test_empty(self):
+        """Test empty lists and objects."""
+        fields = {}
+        assert list(iter_items(chunked('{"data": [ ], "meta": {}}', 1), fields)) == []
+        assert fields == {"meta": {}}
+        assert list(iter_items(chunked('{}', 1), {})) == []
+
+    def test_items_yielded_before_body_ends(self):
+        """Test that the first item is available before the rest of the body is read."""
+        read = []
+
+        def chunks():
+            for chunk in chunked('{"data": [{"id": 1}, {"id": 2}], "meta": {}}', 4):
+                read.append(chunk)
+                yield chunk
+
+        iterator = iter_items(chunks(), {})
+        assert next(iterator) == {"id": 1}
+        assert len(read) < 8
+
+    @pytest.mark.parametrize("body", ['{"data": [{"id": 1}', '{"data": [1 2]}', '[1, 2]', '{"data": [1]'])
+    def test_malformed(self, body):
+        """Test that malformed and truncated bodies raise an error."""
+        with pytest.raises(VsesvitAIError):
+            list(iter_items(chunked(body, 3), {}))
+
+
+class TestStreamList:
+    """Test suite for streaming get_list pages through the client."""
+
+    def test_fake_transport(self):
+        """Test streaming with a transport without native streaming support."""
+        transport = FakeTransport()
+        transport.add("GET", "articles", {"success": True, "data": [{"id": 1}, {"id": 2}], "meta": {"total": 2}})
+        client = VsesvitAI(api_key=API_KEY, base_url=BASE_URL, transport=transport)
+
+        stream = client.article.stream_list({"limit": 2})
+        assert stream.meta is None
+        assert [item["id"] for item in stream] == [1, 2]
+        assert stream.meta == {"total": 2}
+        assert transport.calls[0].params == {"limit": 2}
+
+    def test_error_status(self, server, make_client):
+        """Test that error statuses raise before iteration."""
+        server.fail_next(500, endpoint="articles")
+        client = make_client(transport=None)
+        with pytest.raises(ServerError):
+            client.article.stream_list()
+
+    def test_single_iteration(self):
+        """Test that a stream can't be iterated twice."""
+        transport = FakeTransport()
+        transport.add("GET", "articles", {"success": True, "data": [], "meta": {}})
+        stream = VsesvitAI(api_key=API_KEY, base_url=BASE_URL, transport=transport).article.stream_list()
+        list(stream)
+        with pytest.raises(VsesvitAIError):
+            list(stream)
+
+    @pytest.mark.parametrize("transport", [RequestsTransport, PooledTransport, AsyncTransport])
+    def test_stub_server(self, make_client, transport):
+        """Test streaming a big page from the stub server with every transport."""
+        with make_client(transport=transport()) as client:
+            expected = client.article.get_list({"limit": 100})
+            with client.article.stream_list({"limit": 100}) as stream:
+                items = list(stream)
+
+        assert items == expected["data"]
+        assert stream.meta == expected["meta"]
+
+    def test_models(self, make_client):
+        """Test that streamed items are models when models are enabled."""
+        with make_client(models=True) as client:
+            items = list(client.article.stream_list({"limit": 5}))
+
+        assert len(items) == 5
+        assert all(isinstance(item, ArticleModel) for item in items)
+
+    def test_early_close(self, make_client):
+        """Test stopping iteration early and reusing the pooled connection."""
+        with make_client() as client:
+            with client.article.stream_list({"limit": 100}) as stream:
+                first = next(iter(stream))
+            assert stream.meta is None
+            assert client.article.get_by_id(first["id"])["data"]["id"] == first["id"]
+
+    @pytest.mark.parametrize("limits", [{"scheduler": True}, {"adaptive_concurrency": True}])
+    def test_slot_held_until_closed(self, make_client, limits):
+        """Test that a stream keeps its scheduler or concurrency slot until it's read or closed."""
+        with make_client(**limits) as client:
+            limiter = client.scheduler or client.concurrency
+            with client.article.stream_list({"limit": 100}) as stream:
+                items = iter(stream)
+                next(items)
+                assert limiter.in_flight == 1
+            assert limiter.in_flight == 0
+
+            assert len(list(client.article.stream_list({"limit": 5}))) == 5
+            assert limiter.in_flight == 0
@@ -0,0 +1,129 @@
+import time
+
+import pytest
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.base.exceptions import *
+from src.vsesvit_ai.testing import StubServer
+
+
+pytestmark = [
+    pytest.mark.server(download_size=3 * 1024 * 1024 + 17, seed=1,
+                       records={"projects": 2, "articles": 25, "authors": 3, "referrals": 4}),
+    pytest.mark.client(transport=None),
+]
+
+
+class TestStubServer:
+    """Test suite for the stub API server used through the real HTTP transport."""
+
+    def test_list_pagination(self, client):
+        """Test pagination meta and page contents of list endpoints."""
+        first = client.article.get_list(params={"page": 1, "limit": 10})
+        last = client.article.get_list(params={"page": 3, "limit": 10})
+
+        assert first["success"] is True
+        assert first["meta"] == {"current_page": 1, "last_page": 3, "per_page": 10, "total": 25}
+        assert len(first["data"]) == 10
+        assert len(last["data"]) == 5
+        assert "content" not in first["data"][0]
+
+    def test_list_filters(self, client):
+        """Test filtering lists by language and sorting."""
+        result = client.article.get_list(params={"language": "de", "sort": "id", "direction": "desc"})
+
+        ids = [item["id"] for item in result["data"]]
+        assert result["meta"]["total"] == 5
+        assert ids == sorted(ids, reverse=True)
+        assert {item["language"] for item in result["data"]} == {"de"}
+
+    def test_get_by_id_includes_content(self, client):
+        """Test that detail responses include generated article content."""
+        article_id = client.article.get_list()["data"][0]["id"]
+        result = client.article.get_by_id(article_id)
+
+        assert result["data"]["id"] == article_id
+        assert result["data"]["content"].startswith("<h1>")
+
+    def test_job_state_transitions(self, server, client):
+        """Test that created articles move through their job states."""
+        server.state.job_duration = 0.2
+        project_id = client.project.get_list()["data"][0]["id"]
+
+        created = client.article.create(project_id, "Stub article", "Brief")
+        assert created["data"]["state"] == "draft"
+
+        time.sleep(0.25)
+        result = client.article.get_by_id(created["data"]["id"])
+        assert result["data"]["state"] == "content completed"
+
+    def test_create_validation_error(self, client):
+        """Test that missing required fields produce a ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            client.author.create(None, "Author", "")
+
+        assert "biography" in str(exc_info.value)
+
+    def test_resource_not_found(self, client):
+        """Test that unknown IDs produce a ResourceNotFoundError."""
+        with pytest.raises(ResourceNotFoundError):
+            client.landing.get_by_id(1)
+
+    def test_archive(self, client):
+        """Test archiving and unarchiving."""
+        author_id = client.author.get_list()["data"][0]["id"]
+
+        assert client.author.archive(author_id)["data"]["archived"] is True
+        assert client.author.get_list(params={"archived": True})["meta"]["total"] == 1
+        assert client.author.unarchive(author_id)["data"]["archived"] is False
+
+    def test_large_download(self, server, client):
+        """Test downloading a large binary file."""
+        article_id = client.article.get_list()["data"][0]["id"]
+        content = client.article.download(article_id, "pdf")
+
+        assert len(content) == server.download_size
+        assert content[:4] == bytes([0, 1, 2, 3])
+
+    def test_upload(self, client):
+        """Test multipart upload of a smart table input file."""
+        import io
+        result = client.smart_table.upload(io.BytesIO(b"x" * 1000), file_name="products.xlsx")
+
+        assert result["data"]["name"] == "products.xlsx"
+        assert result["data"]["size"] == 1000
+
+    def test_user_endpoints(self, client):
+        """Test current user and referrals endpoints."""
+        assert client.user.get_me()["data"]["email"] == "stub@vsesvit.ai"
+
+        referrals = client.user.get_referrals(params={"offset": 1, "limit": 2})
+        assert len(referrals["data"]) == 2
+        assert referrals["meta"]["total"] == 4
+
+    def test_injected_rate_limit(self, server, client):
+        """Test that queued 429 responses map to RateLimitError."""
+        server.fail_next(429, retry_after=7)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            client.article.get_list()
+
+        assert exc_info.value.retry_after == 7
+        assert client.article.get_list()["success"] is True
+
+    def test_injected_server_error(self, server, client):
+        """Test that faults can be limited to an endpoint prefix."""
+        server.fail_next(503, times=2, endpoint="articles")
+
+        assert client.project.get_list()["success"] is True
+        for _ in range(2):
+            with pytest.raises(ServerError):
+                client.article.get_list()
+        assert client.article.get_list()["success"] is True
+
+    def test_invalid_api_key(self):
+        """Test that keys outside of api_keys are rejected."""
+        with StubServer(api_keys=["vsa_other_key_0123456789abcdefg"]) as stub:
+            client = VsesvitAI(api_key=stub.api_key, base_url=stub.base_url)
+            with pytest.raises(AuthenticationError):
+                client.user.get_me()
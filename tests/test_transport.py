@@ -0,0 +1,184 @@
+import asyncio
+import time
+
+import pytest
+
+from src.vsesvit_ai.base.client import VsesvitAI
+from src.vsesvit_ai.base.exceptions import *
+from src.vsesvit_ai.transport import (
+    RequestsTransport,
+    PooledTransport,
+    AsyncTransport,
+    FakeTransport,
+    CassetteTransport,
+    TransportResponse
+)
+
+API_KEY = "vsa_test_key123456789012345678901234"
+
+
+pytestmark = pytest.mark.server(records={"articles": 5})
+
+
+class TestTransports:
+    """Test suite for the pluggable client transports."""
+
+    def test_default_transport(self):
+        """Test that the client uses RequestsTransport by default."""
+        client = VsesvitAI(api_key=API_KEY)
+        assert isinstance(client.transport, RequestsTransport)
+
+    def test_pooled_transport_reuses_session(self, server):
+        """Test requests through the pooled transport."""
+        transport = PooledTransport(pool_maxsize=4)
+        with VsesvitAI(api_key=server.api_key, base_url=server.base_url, transport=transport) as client:
+            session = transport.session
+            assert client.article.get_list()["meta"]["total"] == 5
+            assert client.user.get_me()["success"] is True
+            assert transport.session is session
+
+        assert transport._session is None
+
+    def test_pooled_transport_network_error(self):
+        """Test that connection errors are raised as NetworkError."""
+        client = VsesvitAI(api_key=API_KEY, base_url="http://127.0.0.1:1/api/v1", transport=PooledTransport())
+
+        with pytest.raises(NetworkError):
+            client.user.get_me()
+
+    def test_async_transport(self, server):
+        """Test concurrent requests through the async transport."""
+        pytest.importorskip("httpx")
+        client = VsesvitAI(api_key=server.api_key, base_url=server.base_url, transport=AsyncTransport())
+
+        async def fetch():
+            try:
+                return await asyncio.gather(*(client.request_async("GET", "articles") for _ in range(5)))
+            finally:
+                await client.aclose()
+
+        results = asyncio.run(fetch())
+
+        assert [r["meta"]["total"] for r in results] == [5] * 5
+        assert client.user.get_me()["success"] is True
+
+    def test_async_transport_error_mapping(self, server):
+        """Test that HTTP errors from the async transport map to SDK exceptions."""
+        pytest.importorskip("httpx")
+        client = VsesvitAI(api_key=server.api_key, base_url=server.base_url, transport=AsyncTransport())
+        server.fail_next(429, retry_after=3)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            client.article.get_list()
+
+        assert exc_info.value.retry_after == 3
+
+    def test_request_async_with_sync_transport(self):
+        """Test that request_async works with transports without native async support."""
+        transport = FakeTransport()
+        transport.add("GET", "user/me", {"success": True, "data": {"id": 1}})
+        client = VsesvitAI(api_key=API_KEY, transport=transport)
+
+        result = asyncio.run(client.request_async("GET", "user/me"))
+
+        assert result["data"]["id"] == 1
+
+
+class TestFakeTransport:
+    """Test suite for the in-memory fake transport."""
+
+    def setup_method(self):
+        self.transport = FakeTransport()
+        self.client = VsesvitAI(api_key=API_KEY, transport=self.transport)
+
+    def test_canned_response(self):
+        """Test JSON responses and recorded calls."""
+        self.transport.add("POST", "projects/create", {"success": True, "data": {"id": 7}})
+
+        result = self.client.project.create("Name", "Description")
+
+        assert result["data"]["id"] == 7
+        call = self.transport.requests_for("projects/create")[0]
+        assert call.json == {"name": "Name", "description": "Description"}
+        assert call.headers["X-API-KEY"] == API_KEY
+
+    def test_response_sequence(self):
+        """Test that responses for the same endpoint are returned in order."""
+        self.transport.add("GET", "articles/1", {"error": "Too many requests"}, status=429,
+                           headers={"Retry-After": "2"}, times=2)
+        self.transport.add("GET", "articles/1", {"success": True, "data": {"id": 1}})
+
+        for _ in range(2):
+            with pytest.raises(RateLimitError):
+                self.client.article.get_by_id(1)
+        assert self.client.article.get_by_id(1)["data"]["id"] == 1
+        assert self.client.article.get_by_id(1)["data"]["id"] == 1
+
+    def test_callable_and_binary_responses(self):
+        """Test dynamic responses and binary content."""
+        self.transport.add("GET", "landings/3", lambda request: {"data": {"id": int(request.endpoint[-1])}})
+        self.transport.add("GET", "landings/3/download", b"PK\x03\x04")
+
+        assert self.client.landing.get_by_id(3)["data"]["id"] == 3
+        assert self.client.landing.download(3) == b"PK\x03\x04"
+
+    def test_unregistered_endpoint(self):
+        """Test that unknown endpoints answer 404."""
+        with pytest.raises(ResourceNotFoundError):
+            self.client.author.get_by_id(5)
+
+
+class TestCassetteTransport:
+    """Test suite for record/replay cassettes."""
+
+    def test_record_and_replay(self, server, tmp_path):
+        """Test that recorded traffic is replayed offline without credentials."""
+        path = str(tmp_path / "cassette.json")
+        recorder = CassetteTransport(path, mode="record")
+        with VsesvitAI(api_key=server.api_key, base_url=server.base_url, transport=recorder) as client:
+            listed = client.article.get_list(params={"limit": 2})
+            downloaded = client.article.download(listed["data"][0]["id"], "pdf")
+            with pytest.raises(ResourceNotFoundError):
+                client.article.get_by_id(1)
+
+        assert server.api_key not in open(path).read()
+        assert [i["status_code"] for i in recorder.timeline()] == [200, 200, 404]
+
+        requests_before = server.request_count
+        player = CassetteTransport(path, mode="replay")
+        client = VsesvitAI(api_key=API_KEY, base_url="https://offline.invalid/api/v1", transport=player)
+
+        assert client.article.get_list(params={"limit": 2}) == listed
+        assert client.article.download(listed["data"][0]["id"], "pdf") == downloaded
+        with pytest.raises(ResourceNotFoundError):
+            client.article.get_by_id(1)
+        with pytest.raises(CassetteError):
+            client.article.get_list(params={"limit": 3})
+        assert server.request_count == requests_before
+
+    def test_replay_timing(self, tmp_path):
+        """Test that replayed responses keep their recorded latency."""
+        path = str(tmp_path / "cassette.json")
+
+        def slow_response(request):
+            time.sleep(0.05)
+            return {"data": {}}
+
+        fake = FakeTransport()
+        fake.add("GET", "user/me", slow_response)
+        with VsesvitAI(api_key=API_KEY, transport=CassetteTransport(path, mode="record", transport=fake)) as client:
+            client.user.get_me()
+
+        client = VsesvitAI(api_key=API_KEY, transport=CassetteTransport(path, replay_timing=True, speed=2.0))
+        started = time.perf_counter()
+        client.user.get_me()
+
+        assert 0.02 <= time.perf_counter() - started < 0.05
+
+    def test_transport_response(self):
+        """Test the minimal response object."""
+        response = TransportResponse(200, b'{"a": 1}', {"Retry-After": "5"})
+
+        assert response.json() == {"a": 1}
+        assert response.text == '{"a": 1}'
+        assert response.headers.get("retry-after") == "5"
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from src.vsesvit_ai.base.exceptions import PipelineError, ValidationError
+from src.vsesvit_ai.validation import check_payload
+
+
+pytestmark = [pytest.mark.server(job_duration=0.1, records={'projects': 1}), pytest.mark.client(validate=True)]
+
+
+@pytest.fixture
+def project_id(client):
+    return client.project.get_list()['data'][0]['id']
+
+
+def creates(server):
+    return sum(1 for method, logged in server.request_log if method == 'POST' and logged.endswith('/create'))
+
+
+class TestValidation:
+    """Test suite for client-side validation of create payloads."""
+
+    def test_valid_payloads(self):
+        """Test that documented parameters pass, including temperature as a string."""
+        assert check_payload('articles', {
+            'projectId': 1, 'name': 'Guide', 'brief': 'Getting started', 'temperature': '0.7',
+            'useTOC': False, 'keywords': [{'value': 'sdk', 'quantity': 2}], 'knowledgeIds': [3],
+            'sections': None,
+        }) == {}
+        assert check_payload('knowledge-bases', {
+            'projectId': 1, 'name': 'Docs', 'description': 'Product docs',
+            'sources': [{'url': 'https://example.com'}, {'query': 'python sdk'}],
+        }) == {}
+        assert check_payload('projects', {'name': 'Site', 'description': 'Blog', 'custom': 1}) == {}
+
+    def test_invalid_payloads(self):
+        """Test that wrong shapes, ranges and unknown flags are reported by field path."""
+        errors = check_payload('landings', {
+            'projectId': True, 'name': '', 'temperature': 1.0, 'useSwiper': 'yes',
+            'keywords': [{'value': 'sdk'}, 'seo'],
+        })
+
+        assert errors == {
+            'projectId': ['must be an integer'],
+            'name': ['must not be empty'],
+            'brief': ['is required'],
+            'temperature': ['is not a known parameter'],
+            'useSwiper': ['must be a boolean'],
+            'keywords[0].quantity': ['is required'],
+            'keywords[1]': ['must be an object'],
+        }
+        assert check_payload('articles', {'projectId': 1, 'name': 'a', 'brief': 'b', 'temperature': '2.5'}) == {
+            'temperature': ['must be between 0.0 and 2.0'],
+        }
+
+    def test_invalid_create_isnt_sent(self, server, client, project_id):
+        """Test that an invalid create raises ValidationError without a request."""
+        with pytest.raises(ValidationError) as error:
+            client.article.create(project_id, 'Guide', 'Getting started', {'keywords': 'sdk, python'})
+
+        assert error.value.errors == {'keywords': ['must be a list']}
+        assert error.value.status_code is None
+        assert creates(server) == 0
+        assert client.article.create(project_id, 'Guide', 'Getting started',
+                                     {'keywords': [{'value': 'sdk', 'quantity': 1}]})['success']
+
+    def test_async_create_is_validated(self, server, client):
+        """Test that request_async checks create payloads as well."""
+        with pytest.raises(ValidationError):
+            asyncio.run(client.request_async('POST', 'authors/create', data={'projectId': 1, 'name': 'Jane'}))
+
+        assert creates(server) == 0
+
+    def test_pipeline_rejects_invalid_rows_up_front(self, server, client, project_id):
+        """Test that invalid create steps fail before any request, and valid rows still run."""
+        pipeline = client.pipeline(poll_interval=0.02)
+        author = pipeline.author('author', project_id, 'Jane', 'Technical writer')
+        pipeline.article('good', project_id, 'Guide', 'Getting started', {'authorId': author.id})
+        bad = pipeline.article('bad', project_id, 'Guide', 'Getting started',
+                               {'authorId': author.id, 'temperature': 5})
+        pipeline.step('download', client.article.download, bad.id, 'docx')
+
+        assert list(pipeline.validate()) == ['bad']
+        with pytest.raises(PipelineError) as error:
+            pipeline.run()
+
+        assert isinstance(error.value.errors['bad'], ValidationError)
+        assert error.value.skipped == ['download']
+        assert set(error.value.results) == {'author', 'good'}
+        assert creates(server) == 2